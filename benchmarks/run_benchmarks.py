@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for vibe-coding-kit.
+Measures CLI cold start, rules parsing and rendering, rules writes and batch throughput,
+writes the results as JSON and fails if a result exceeds its regression threshold.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+from unittest import mock
+
+REPO_ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+DEFAULT_THRESHOLDS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'thresholds.json')
+
+sys.path.insert(0, REPO_ROOT)
+
+
+def best_of(func: Callable[[], None], runs: int, inner: int = 1) -> float:
+    """
+    Time a function and return the best per-call time.
+
+    Args:
+        func: Function to time
+        runs: Number of timed runs
+        inner: Number of calls per run
+
+    Returns:
+        Best per-call time in seconds
+    """
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        for _ in range(inner):
+            func()
+        elapsed = (time.perf_counter() - start) / inner
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def get_scratch_dir() -> str:
+    """
+    Create a scratch directory, on tmpfs when available so disk latency does not dominate.
+
+    Returns:
+        Path to a new temporary directory
+    """
+    base_dir = '/dev/shm' if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK) else None
+    return tempfile.mkdtemp(prefix='vibe-bench-', dir=base_dir)
+
+
+def bench_cli_cold_start(runs: int) -> Dict[str, float]:
+    """
+    Measure the wall time of `vibe --help` in a fresh interpreter.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = REPO_ROOT + os.pathsep + env.get("PYTHONPATH", "")
+    command = [sys.executable, "-m", "vibe_coding_kit.cli.main", "--help"]
+
+    def run() -> None:
+        subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, env=env, check=True)
+
+    return {"cli_help_cold_start_ms": best_of(run, runs) * 1e3}
+
+
+def bench_global_rules(scratch_dir: str, runs: int) -> Dict[str, float]:
+    """
+    Measure parsing a global rules file, uncached and through the signature cache.
+    Both read the same scratch file, not the global rules of the machine running the benchmark.
+    """
+    from vibe_coding_kit.cli import project_commands
+
+    global_rules_path = os.path.join(scratch_dir, 'global_rules_template.md')
+    with open(global_rules_path, 'w', encoding='utf-8') as f:
+        f.write("## Language Rules\ncommunication_language: English\ncode_comment_language: English\n")
+
+    parse = best_of(lambda: project_commands._parse_global_rules(global_rules_path), runs, inner=1000)
+    with mock.patch.object(project_commands, 'get_global_rules_path', lambda: global_rules_path):
+        project_commands.get_global_rules()
+        cached = best_of(project_commands.get_global_rules, runs, inner=1000)
+    return {"global_rules_parse_us": parse * 1e6, "global_rules_cached_us": cached * 1e6}
+
+
+def bench_render_and_write(scratch_dir: str, runs: int) -> Dict[str, float]:
+    """
+    Measure rendering rules content and writing a rules file (new content and unchanged content).
+    """
+    from vibe_coding_kit.cli.project_commands import create_project_rules_file, render_project_rules
+
+    render = best_of(render_project_rules, runs, inner=1000)
+
+    project_dir = os.path.join(scratch_dir, 'render-project')
+    os.makedirs(project_dir)
+    rules_content = render_project_rules()
+    counter = [0]
+
+    def write_changed() -> None:
+        counter[0] += 1
+        create_project_rules_file("windsurf", project_dir, f"{rules_content}\n<!-- {counter[0]} -->\n")
+
+    write = best_of(write_changed, runs, inner=200)
+    create_project_rules_file("windsurf", project_dir, rules_content)
+    unchanged = best_of(lambda: create_project_rules_file("windsurf", project_dir, rules_content), runs, inner=200)
+    return {
+        "render_project_rules_us": render * 1e6,
+        "rules_file_write_us": write * 1e6,
+        "rules_file_unchanged_us": unchanged * 1e6,
+    }
+
+
+def bench_history(runs: int) -> Dict[str, float]:
+    """
+    Measure recording a changed render in the rules history store, and listing a project's revisions.
+    """
+    from vibe_coding_kit.cli.history import list_revisions, record_revision
+    from vibe_coding_kit.cli.project_commands import render_project_rules
+
+    rules_content = render_project_rules()
+    counter = [0]
+
+    def record_changed() -> None:
+        counter[0] += 1
+        record_revision("/bench/history-project", [(".windsurfrules", f"{rules_content}\n<!-- {counter[0]} -->\n")])
+
+    record = best_of(record_changed, runs, inner=200)
+    listing = best_of(lambda: list_revisions("/bench/history-project"), runs, inner=10)
+    return {"history_record_us": record * 1e6, "history_list_1k_ms": listing * 1e3}
+
+
+def bench_profiles(scratch_dir: str, runs: int) -> Dict[str, float]:
+    """
+    Measure resolving a project's headless profile from its config and the user config,
+    uncached and through the per-directory cache.
+    """
+    from vibe_coding_kit.cli import profiles
+    from vibe_coding_kit.cli.cache import clear_cache
+
+    project_dir = os.path.join(scratch_dir, 'profile-project')
+    os.makedirs(os.path.join(project_dir, '.vibe'))
+    with open(os.path.join(project_dir, '.vibe', 'config.json'), 'w', encoding='utf-8') as f:
+        json.dump({"profiles": {"ci": {"editor": "windsurf,cursor", "packs": ["web"]}}}, f)
+    with open(os.environ["VIBE_CONFIG"], 'w', encoding='utf-8') as f:
+        json.dump({"profile": "ci", "profiles": {"ci": {"communication_language": "English"}}}, f)
+
+    def resolve_uncached() -> None:
+        profiles._resolved.clear()
+        clear_cache()
+        profiles.resolve_profile(project_dir)
+
+    uncached = best_of(resolve_uncached, runs, inner=1000)
+    cached = best_of(lambda: profiles.resolve_profile(project_dir), runs, inner=1000)
+    return {"profile_resolve_us": uncached * 1e6, "profile_resolve_cached_us": cached * 1e6}
+
+
+def make_projects(root: str, count: int) -> List[str]:
+    """
+    Create empty synthetic project directories.
+    """
+    project_dirs = [os.path.join(root, f"project-{index:05d}") for index in range(count)]
+    for project_dir in project_dirs:
+        os.makedirs(project_dir)
+    return project_dirs
+
+
+def bench_fleet(scratch_dir: str, projects: int, workers: Optional[int]) -> Dict[str, float]:
+    """
+    Measure create_project_structure over many projects and a full batch start over many projects.
+    """
+    from vibe_coding_kit.cli.batch_commands import batch_start_command
+    from vibe_coding_kit.cli.project_commands import create_project_structure
+
+    structure_dirs = make_projects(os.path.join(scratch_dir, 'structure'), projects)
+    start = time.perf_counter()
+    for project_dir in structure_dirs:
+        create_project_structure(project_dir)
+    structure = (time.perf_counter() - start) / projects
+
+    batch_dirs = make_projects(os.path.join(scratch_dir, 'batch'), projects)
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        batch_start_command(batch_dirs, "windsurf", workers)
+    batch = (time.perf_counter() - start) / projects
+
+    return {
+        "project_structure_per_project_us": structure * 1e6,
+        "batch_start_per_project_us": batch * 1e6,
+    }
+
+
+def check_regressions(
+    results: Dict[str, float],
+    thresholds: Dict[str, float],
+    baseline: Optional[Dict[str, float]],
+    tolerance: float
+) -> List[str]:
+    """
+    Compare results against absolute thresholds and, optionally, a previous run.
+
+    Args:
+        results: Measured values (lower is better)
+        thresholds: Absolute upper limits per benchmark
+        baseline: Results of a previous run
+        tolerance: Allowed slowdown factor relative to the baseline
+
+    Returns:
+        Regression messages (empty if everything passed)
+    """
+    regressions = []
+    for name, value in sorted(results.items()):
+        limit = thresholds.get(name)
+        if limit is not None and value > limit:
+            regressions.append(f"{name}: {value:.1f} exceeds threshold {limit:.1f}")
+        if baseline and name in baseline and value > baseline[name] * tolerance:
+            regressions.append(f"{name}: {value:.1f} is more than {tolerance:.2f}x baseline {baseline[name]:.1f}")
+    return regressions
+
+
+def main() -> None:
+    """
+    Command line entry point for the benchmark runner.
+    """
+    parser = argparse.ArgumentParser(description="Run the vibe-coding-kit benchmark suite")
+    parser.add_argument("--output", help="Write the JSON report to this file (default: stdout only)")
+    parser.add_argument("--thresholds", default=DEFAULT_THRESHOLDS, help="JSON file of absolute thresholds")
+    parser.add_argument("--baseline", help="JSON report of a previous run to compare against")
+    parser.add_argument("--tolerance", type=float, default=1.25, help="Allowed slowdown factor vs. the baseline")
+    parser.add_argument("--projects", type=int, default=10000, help="Number of synthetic projects for fleet benchmarks")
+    parser.add_argument("--workers", type=int, default=None, help="Worker threads for the batch benchmark")
+    parser.add_argument("--runs", type=int, default=5, help="Timed runs per benchmark (best run is reported)")
+    args = parser.parse_args()
+
+    scratch_dir = get_scratch_dir()
+    # Keep the registry and caches of the benchmark away from the user's own
+    os.environ["VIBE_DATA_DIR"] = os.path.join(scratch_dir, 'data')
+    os.environ["VIBE_CACHE_DIR"] = os.path.join(scratch_dir, 'cache')
+    os.environ["VIBE_CONFIG"] = os.path.join(scratch_dir, 'config.json')
+
+    try:
+        results = {}
+        results.update(bench_cli_cold_start(args.runs))
+        results.update(bench_global_rules(scratch_dir, args.runs))
+        results.update(bench_render_and_write(scratch_dir, args.runs))
+        results.update(bench_history(args.runs))
+        results.update(bench_profiles(scratch_dir, args.runs))
+        results.update(bench_fleet(scratch_dir, args.projects, args.workers))
+    finally:
+        shutil.rmtree(scratch_dir, ignore_errors=True)
+
+    with open(args.thresholds, 'r', encoding='utf-8') as f:
+        thresholds = json.load(f)
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)["results"]
+
+    regressions = check_regressions(results, thresholds, baseline, args.tolerance)
+    report = {
+        "python": sys.version.split()[0],
+        "platform": sys.platform,
+        "projects": args.projects,
+        "results": results,
+        "thresholds": thresholds,
+        "regressions": regressions,
+    }
+
+    report_json = json.dumps(report, indent=2, sort_keys=True)
+    print(report_json)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(report_json + "\n")
+
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
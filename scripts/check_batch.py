@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Behaviour check for non-interactive batch starts (`vibe start --batch`).
+Pipes project roots into `vibe start --batch` against a scratch copy of the kit, checking that an editor
+given by --editor or VIBE_EDITOR is used without prompts, and that without one the command exits with an
+error instead of prompting on a stdin that holds the project list.
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List
+
+REPO_ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+
+def make_scratch(scratch: str) -> Dict[str, str]:
+    """
+    Copy the kit into a scratch root with its own data dir and saved global rules.
+
+    Returns:
+        Environment for the kit's subprocesses
+    """
+    ignore = shutil.ignore_patterns('__pycache__', 'global_rules_template.md', 'org_rules_template.md')
+    shutil.copytree(os.path.join(REPO_ROOT, 'vibe_coding_kit'), os.path.join(scratch, 'vibe_coding_kit'), ignore=ignore)
+    shutil.copytree(os.path.join(REPO_ROOT, 'templates'), os.path.join(scratch, 'templates'), ignore=ignore)
+    env = dict(
+        os.environ,
+        HOME=scratch,
+        PYTHONPATH=scratch,
+        VIBE_DATA_DIR=os.path.join(scratch, 'data'),
+        VIBE_CACHE_DIR=os.path.join(scratch, 'cache'),
+    )
+    for name in ('VIBE_EDITOR', 'VIBE_PROFILE', 'VIBE_ORG_SOURCE'):
+        env.pop(name, None)
+    subprocess.run([sys.executable, "-c", "from vibe_coding_kit.cli.global_commands import save_global_rules; "
+                                          "save_global_rules('english', 'english')"],
+                   env=env, cwd=scratch, check=True)
+    return env
+
+
+def batch_start(env: Dict[str, str], scratch: str, project_dirs: List[str], *args: str) -> subprocess.CompletedProcess:
+    """
+    Run `vibe start --batch` with the project roots on stdin.
+
+    Returns:
+        The finished process, with its output as text
+    """
+    for project_dir in project_dirs:
+        os.makedirs(project_dir, exist_ok=True)
+    return subprocess.run(
+        [sys.executable, "-m", "vibe_coding_kit.cli.main", "start", "--batch"] + list(args),
+        input="".join(project_dir + "\n" for project_dir in project_dirs), env=env, cwd=scratch,
+        stdout=subprocess.PIPE, stderr=subprocess.STDOUT, universal_newlines=True, timeout=60,
+    )
+
+
+def main() -> None:
+    """
+    Command line entry point for the batch start check.
+    """
+    errors: List[str] = []
+    scratch = tempfile.mkdtemp(prefix='vibe-batch-')
+    try:
+        env = make_scratch(scratch)
+
+        def expect(label: str, result: subprocess.CompletedProcess, code: int, files: List[str]) -> None:
+            if result.returncode != code or "Traceback" in result.stdout:
+                errors.append(f"{label}: expected exit code {code}, got {result.returncode}: {result.stdout!r}")
+            for path in files:
+                if not os.path.isfile(path):
+                    errors.append(f"{label}: {os.path.relpath(path, scratch)} was not written")
+
+        dirs = [os.path.join(scratch, 'flag', name) for name in ('b1', 'b2')]
+        expect("--editor", batch_start(env, scratch, dirs, "--editor", "cursor"), 0,
+               [os.path.join(project_dir, '.cursorrules') for project_dir in dirs])
+
+        dirs = [os.path.join(scratch, 'env', name) for name in ('b1', 'b2')]
+        expect("VIBE_EDITOR", batch_start(dict(env, VIBE_EDITOR="windsurf"), scratch, dirs), 0,
+               [os.path.join(project_dir, '.windsurfrules') for project_dir in dirs])
+
+        dirs = [os.path.join(scratch, 'none', name) for name in ('b1', 'b2')]
+        result = batch_start(env, scratch, dirs)
+        expect("no editor", result, 1, [])
+        if "Error: No editor" not in result.stdout:
+            errors.append(f"no editor: expected an error naming the missing editor, got {result.stdout!r}")
+        if any(os.listdir(project_dir) for project_dir in dirs):
+            errors.append("no editor: projects were initialized without an editor")
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+    if errors:
+        for error in errors:
+            print(f"FAIL: {error}")
+        sys.exit(1)
+    print("OK: batch starts from stdin use --editor or VIBE_EDITOR and fail cleanly without one")
+
+
+if __name__ == '__main__':
+    main()
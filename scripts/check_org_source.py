@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Behaviour check for the organisation template source (VIBE_ORG_SOURCE).
+Serves an organisation template from the local stand-in server and renders a project against a scratch
+copy of the kit, checking that renders within the TTL make no requests, that later checks are conditional
+and download only a changed template, that an unreachable source falls back to the cached version, and
+that a git source updates on a new commit.
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+from typing import Dict, List
+
+REPO_ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, os.path.join(REPO_ROOT, 'scripts'))
+
+from org_template_server import TemplateServer  # noqa: E402
+
+TEMPLATE = "## Organisation Rules\n\n- Organisation rules version {version}\n"
+
+
+def make_scratch(scratch: str) -> Dict[str, str]:
+    """
+    Copy the kit into a scratch root with its own data and cache dirs and saved global rules.
+
+    Returns:
+        Environment for the kit's subprocesses
+    """
+    ignore = shutil.ignore_patterns('__pycache__', 'global_rules_template.md', 'org_rules_template.md')
+    shutil.copytree(os.path.join(REPO_ROOT, 'vibe_coding_kit'), os.path.join(scratch, 'vibe_coding_kit'), ignore=ignore)
+    shutil.copytree(os.path.join(REPO_ROOT, 'templates'), os.path.join(scratch, 'templates'), ignore=ignore)
+    os.makedirs(os.path.join(scratch, 'project'))
+    os.makedirs(os.path.join(scratch, 'served'))
+    env = dict(
+        os.environ,
+        HOME=scratch,
+        PYTHONPATH=scratch,
+        VIBE_DATA_DIR=os.path.join(scratch, 'data'),
+        VIBE_CACHE_DIR=os.path.join(scratch, 'cache'),
+        VIBE_ORG_TIMEOUT="2",
+    )
+    env.pop('VIBE_ORG_SOURCE', None)
+    run_python(env, scratch, "from vibe_coding_kit.cli.global_commands import save_global_rules; "
+                             "save_global_rules('english', 'english')")
+    return env
+
+
+def run_python(env: Dict[str, str], scratch: str, statements: str) -> str:
+    """
+    Run statements against the scratch kit from the scratch root.
+
+    Returns:
+        What they printed
+    """
+    result = subprocess.run([sys.executable, "-c", statements], env=env, cwd=scratch, check=True,
+                            capture_output=True, text=True)
+    return result.stdout
+
+
+def render(env: Dict[str, str], scratch: str) -> str:
+    """
+    Render the scratch project's rules in a new process.
+
+    Returns:
+        The rendered rules, followed by anything the render printed
+    """
+    return run_python(env, scratch, (
+        "from vibe_coding_kit.cli.serve_commands import handle_render; "
+        "print(*handle_render({'path': 'project', 'editor': 'windsurf'})['outputs'].values())"
+    ))
+
+
+def org(env: Dict[str, str], scratch: str) -> Dict:
+    """
+    Run `vibe org --refresh --json`.
+
+    Returns:
+        The report
+    """
+    result = subprocess.run([sys.executable, "-m", "vibe_coding_kit.cli.main", "org", "--refresh", "--json"],
+                            env=env, cwd=scratch, capture_output=True, text=True)
+    return json.loads(result.stdout)
+
+
+def write_template(scratch: str, version: int) -> None:
+    path = os.path.join(scratch, 'served', 'org_rules_template.md')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(TEMPLATE.format(version=version))
+    # The server's Last-Modified has whole-second resolution: make each version visibly newer
+    os.utime(path, (1000000000 + version * 60, 1000000000 + version * 60))
+
+
+def check_http(env: Dict[str, str], scratch: str, errors: List[str]) -> None:
+    server = TemplateServer(os.path.join(scratch, 'served'))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    env = dict(env, VIBE_ORG_SOURCE=f"{server.url}/org_rules_template.md")
+
+    def expect(label: str, output: str, version: int, statuses: List[int]) -> None:
+        requests = [status for _, status, _ in server.requests]
+        del server.requests[:]
+        if f"Organisation rules version {version}" not in output:
+            errors.append(f"{label}: the render does not contain version {version}")
+        if requests != statuses:
+            errors.append(f"{label}: expected responses {statuses}, the server sent {requests}")
+
+    try:
+        write_template(scratch, 1)
+        expect("first render", render(env, scratch), 1, [200])
+        expect("renders within the TTL", render(env, scratch) + render(env, scratch), 1, [])
+
+        report = org(dict(env, VIBE_ORG_TTL="0"), scratch)
+        if report.get("status") != "not modified":
+            errors.append(f"unchanged template: expected status 'not modified', got {report.get('status')!r}")
+        expect("render after an unchanged check", render(env, scratch), 1, [304])
+
+        write_template(scratch, 2)
+        expect("render after the TTL expired", render(dict(env, VIBE_ORG_TTL="0"), scratch), 2, [200])
+        versions = os.listdir(os.path.join(scratch, 'cache', 'org', 'versions'))
+        if len(versions) != 2:
+            errors.append(f"expected 2 cached versions, found {len(versions)}")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    output = render(dict(env, VIBE_ORG_TTL="0"), scratch)
+    if "Organisation rules version 2" not in output or "using the cached version" not in output:
+        errors.append(f"server down: expected the cached version and a warning, got: {output!r}")
+    report = org(env, scratch)
+    if report.get("status") != "offline":
+        errors.append(f"server down: expected status 'offline', got {report.get('status')!r}")
+
+    shutil.rmtree(os.path.join(scratch, 'cache', 'org'))
+    report = org(env, scratch)
+    if report.get("status") != "unavailable":
+        errors.append(f"server down, empty cache: expected status 'unavailable', got {report.get('status')!r}")
+    if "Organisation rules" in render(env, scratch):
+        errors.append("server down, empty cache: the render still contains an organisation layer")
+
+
+def check_git(env: Dict[str, str], scratch: str, errors: List[str]) -> None:
+    repository = os.path.join(scratch, 'org-repo')
+    os.makedirs(repository)
+
+    def commit(version: int) -> None:
+        with open(os.path.join(repository, 'org_rules_template.md'), 'w', encoding='utf-8') as f:
+            f.write(TEMPLATE.format(version=version))
+        for args in (['add', '-A'], ['commit', '-q', '-m', f"Version {version}"]):
+            subprocess.run(['git', '-C', repository, '-c', 'user.name=check', '-c', 'user.email=check@example.com']
+                           + args, check=True)
+
+    subprocess.run(['git', 'init', '-q', repository], check=True)
+    commit(1)
+    shutil.rmtree(os.path.join(scratch, 'cache', 'org'), ignore_errors=True)
+    env = dict(env, VIBE_ORG_SOURCE=f"git+file://{repository}", VIBE_ORG_TTL="0")
+    statuses = [org(env, scratch).get("status")]
+    statuses.append(org(env, scratch).get("status"))
+    commit(2)
+    statuses.append(org(env, scratch).get("status"))
+    if statuses != ["updated", "not modified", "updated"]:
+        errors.append(f"git source: expected updated, not modified, updated; got {statuses}")
+    if "Organisation rules version 2" not in render(env, scratch):
+        errors.append("git source: the render does not contain the new commit's version")
+
+
+def main() -> None:
+    """
+    Command line entry point for the organisation template source check.
+    """
+    errors: List[str] = []
+    scratch = tempfile.mkdtemp(prefix='vibe-org-')
+    try:
+        env = make_scratch(scratch)
+        check_http(env, scratch, errors)
+        if shutil.which('git'):
+            check_git(env, scratch, errors)
+        else:
+            print("SKIP: git is not installed, git sources not checked")
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+    if errors:
+        for error in errors:
+            print(f"FAIL: {error}")
+        sys.exit(1)
+    print("OK: renders use the cached organisation template, fetch it conditionally and survive an offline source")
+
+
+if __name__ == '__main__':
+    main()
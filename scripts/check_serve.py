@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Latency and access check for the vibe render server.
+Starts `vibe serve` on a Unix socket with a scratch registry, sends sequential and concurrent render
+and status requests through the bundled client, and fails if the median render exceeds a budget.
+Also checks that requests a web page or another user could send are refused, on the socket and over TCP.
+"""
+
+import argparse
+import http.client
+import json
+import os
+import stat
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from typing import Dict, List
+
+REPO_ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, REPO_ROOT)
+
+from vibe_coding_kit.cli.serve_client import ServeClient, ServeError  # noqa: E402
+from vibe_coding_kit.cli.serve_security import read_token  # noqa: E402
+
+
+def percentiles(samples: List[float]) -> Dict[str, float]:
+    """
+    Summarise latencies in milliseconds.
+
+    Args:
+        samples: Latencies in seconds
+
+    Returns:
+        Dictionary with "p50", "p99" and "max" in milliseconds
+    """
+    ordered = sorted(samples)
+    return {
+        "p50": ordered[len(ordered) // 2] * 1e3,
+        "p99": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1e3,
+        "max": ordered[-1] * 1e3,
+    }
+
+
+def make_projects(root: str, count: int) -> List[str]:
+    """
+    Create small synthetic projects, every other one with Python sources.
+    """
+    project_dirs = []
+    for index in range(count):
+        project_dir = os.path.join(root, f"project-{index:03d}")
+        os.makedirs(project_dir)
+        if index % 2:
+            for name in ("setup.py", "main.py"):
+                with open(os.path.join(project_dir, name), 'w', encoding='utf-8') as f:
+                    f.write("print('hello')\n")
+        project_dirs.append(project_dir)
+    return project_dirs
+
+
+def register_projects(project_dirs: List[str], env: Dict[str, str]) -> None:
+    """
+    Initialize the projects with batch start, so the server may write to them.
+    """
+    code = ("import sys; from vibe_coding_kit.cli.batch_commands import batch_start_command; "
+            "sys.exit(batch_start_command(sys.argv[1:], 'windsurf,cursor'))")
+    subprocess.run([sys.executable, "-c", code] + project_dirs, env=env, stdout=subprocess.DEVNULL, check=True)
+
+
+def start_server(socket_path: str, env: Dict[str, str]) -> subprocess.Popen:
+    """
+    Start the server in a separate interpreter and wait until it answers.
+    """
+    code = f"from vibe_coding_kit.cli.serve_commands import serve_command; serve_command(socket_path={socket_path!r})"
+    server = subprocess.Popen([sys.executable, "-c", code], env=env, stdout=subprocess.DEVNULL)
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        try:
+            ServeClient(socket_path).health()
+            return server
+        except OSError:
+            time.sleep(0.05)
+    server.kill()
+    raise RuntimeError("the server did not start within 10 seconds")
+
+
+def raw_request(connection: http.client.HTTPConnection, method: str, path: str, headers: Dict[str, str],
+                body: str = None) -> int:
+    """
+    Send a request with exactly the given headers (plus Host, unless given).
+
+    Returns:
+        Response status
+    """
+    connection.putrequest(method, path, skip_host="Host" in headers)
+    for name, value in dict(headers, **({"Content-Length": str(len(body))} if body else {})).items():
+        connection.putheader(name, value)
+    connection.endheaders(body.encode('utf-8') if body else None)
+    response = connection.getresponse()
+    response.read()
+    return response.status
+
+
+def check_access(socket_path: str, project_dirs: List[str], scratch_dir: str, env: Dict[str, str]) -> List[str]:
+    """
+    Check that the server refuses browser, non-local and malformed requests, and writes to unregistered
+    projects; over TCP, that it refuses requests without the bearer token.
+
+    Returns:
+        Failures
+    """
+    errors = []
+    client = ServeClient(socket_path)
+    json_body = {"Content-Type": "application/json"}
+    registered = json.dumps({"path": project_dirs[0]})
+    for label, method, path, headers, body, expected in (
+        ("cross-origin simple POST", "POST", "/render",
+         {"Origin": "http://evil.example", "Content-Type": "text/plain"}, registered, 403),
+        ("POST without a JSON content type", "POST", "/render", {"Content-Type": "text/plain"}, registered, 415),
+        ("request for another host name", "GET", "/health", {"Host": "evil.example:8765"}, None, 403),
+        ("non-object overrides", "POST", "/render", json_body,
+         json.dumps({"path": project_dirs[0], "overrides": "French"}), 400),
+        ("multi-line override", "POST", "/render", json_body,
+         json.dumps({"path": project_dirs[0], "overrides": {"communication_language": "English.\n## Injected"}}), 400),
+        ("string stacks", "POST", "/render", json_body, json.dumps({"path": project_dirs[0], "stacks": "python"}), 400),
+    ):
+        status = raw_request(client.connection, method, path, headers, body)
+        if status != expected:
+            errors.append(f"{label}: expected {expected}, got {status}")
+
+    unregistered = os.path.join(scratch_dir, 'unregistered')
+    os.makedirs(unregistered)
+    try:
+        client.render(unregistered, write=True)
+        errors.append("a write to an unregistered project was accepted")
+    except ServeError as e:
+        if e.status != 403:
+            errors.append(f"write to an unregistered project: expected 403, got {e.status}")
+    if os.listdir(unregistered):
+        errors.append("the server wrote files into an unregistered project")
+    client.close()
+
+    # Over TCP every request needs the token from the 0600 token file
+    code = "from vibe_coding_kit.cli.serve_commands import serve_command; serve_command(port=0)"
+    server = subprocess.Popen([sys.executable, "-c", code], env=env, stdout=subprocess.PIPE, text=True)
+    try:
+        address = server.stdout.readline().split()[3]
+        host, port = address[len("http://"):].rsplit(':', 1)
+        token_path = os.path.join(env["VIBE_DATA_DIR"], 'serve_token')
+        if stat.S_IMODE(os.stat(token_path).st_mode) != 0o600:
+            errors.append(f"the token file has mode {oct(stat.S_IMODE(os.stat(token_path).st_mode))}, not 0600")
+        status = raw_request(http.client.HTTPConnection(host, int(port), timeout=10), "GET", "/health", {})
+        if status != 401:
+            errors.append(f"TCP request without the token: expected 401, got {status}")
+        ServeClient(host=host, port=int(port), token=read_token(token_path)).health()
+    except (OSError, ServeError, IndexError, ValueError) as e:
+        errors.append(f"TCP server with a token: {e}")
+    finally:
+        server.terminate()
+        server.wait()
+    return errors
+
+
+def main() -> None:
+    """
+    Command line entry point for the server check.
+    """
+    parser = argparse.ArgumentParser(description="Check vibe serve request latency")
+    parser.add_argument("--budget-ms", type=float, default=10.0, help="Maximum median render latency")
+    parser.add_argument("--projects", type=int, default=50, help="Number of synthetic projects")
+    parser.add_argument("--requests", type=int, default=500, help="Sequential render requests")
+    parser.add_argument("--clients", type=int, default=16, help="Concurrent clients")
+    args = parser.parse_args()
+
+    scratch_dir = tempfile.mkdtemp(prefix='vibe-serve-')
+    socket_path = os.path.join(scratch_dir, 'vibe.sock')
+    env = dict(os.environ)
+    env["PYTHONPATH"] = REPO_ROOT + os.pathsep + env.get("PYTHONPATH", "")
+    # Keep the registry and caches of the check away from the user's own
+    env["VIBE_DATA_DIR"] = os.path.join(scratch_dir, 'data')
+    env["VIBE_CACHE_DIR"] = os.path.join(scratch_dir, 'cache')
+
+    server = None
+    try:
+        project_dirs = make_projects(os.path.join(scratch_dir, 'projects'), args.projects)
+        register_projects(project_dirs, env)
+        server = start_server(socket_path, env)
+        access_errors = check_access(socket_path, project_dirs, scratch_dir, env)
+        client = ServeClient(socket_path)
+
+        # Register every project, and check the written files match the rendered outputs
+        for project_dir in project_dirs:
+            result = client.render(project_dir, editor_type="windsurf,cursor", write=True)
+            for rel_path, content in result["outputs"].items():
+                with open(os.path.join(project_dir, rel_path), 'r', encoding='utf-8') as f:
+                    if f.read() != content:
+                        raise RuntimeError(f"{project_dir}/{rel_path} does not match the rendered output")
+
+        sequential = []
+        for index in range(args.requests):
+            start = time.perf_counter()
+            client.render(project_dirs[index % len(project_dirs)])
+            sequential.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        client.status(show_all=True)
+        status_ms = (time.perf_counter() - start) * 1e3
+
+        concurrent: List[float] = []
+        lock = threading.Lock()
+
+        def run_client(offset: int) -> None:
+            own = ServeClient(socket_path)
+            samples = []
+            for index in range(args.requests // args.clients):
+                begin = time.perf_counter()
+                own.render(project_dirs[(offset + index) % len(project_dirs)])
+                samples.append(time.perf_counter() - begin)
+            own.close()
+            with lock:
+                concurrent.extend(samples)
+
+        threads = [threading.Thread(target=run_client, args=(offset,)) for offset in range(args.clients)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        client.close()
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+        shutil.rmtree(scratch_dir, ignore_errors=True)
+
+    sequential_stats = percentiles(sequential)
+    concurrent_stats = percentiles(concurrent)
+    print(f"sequential render: p50 {sequential_stats['p50']:.2f} ms, p99 {sequential_stats['p99']:.2f} ms, "
+          f"max {sequential_stats['max']:.2f} ms ({len(sequential)} requests)")
+    print(f"concurrent render: p50 {concurrent_stats['p50']:.2f} ms, p99 {concurrent_stats['p99']:.2f} ms "
+          f"({args.clients} clients, {len(concurrent) / elapsed:.0f} requests/s)")
+    print(f"status of {args.projects} projects: {status_ms:.2f} ms")
+
+    for error in access_errors:
+        print(f"FAIL: {error}")
+    if sequential_stats["p50"] > args.budget_ms:
+        print(f"FAIL: median render latency exceeds the {args.budget_ms:.1f} ms budget")
+    if access_errors or sequential_stats["p50"] > args.budget_ms:
+        sys.exit(1)
+    print("OK: the server refuses browser, non-local, malformed and unauthenticated requests")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Overhead and behaviour check for the shell cd hook (scripts/vibe_cd_hook.sh).
+Times thousands of cds in bash with and without the hook against a scratch copy of the kit, fails if
+the hook adds more than a budget per cd or starts vibe while nothing changed, and checks it warns
+about a project exactly when its rules are stale.
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, Tuple
+
+REPO_ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+HOOK_PATH = os.path.join(REPO_ROOT, 'scripts', 'vibe_cd_hook.sh')
+
+# Runs $CDS round trips between two directories, emulating a prompt after each cd, and prints the
+# elapsed microseconds
+TIMING_SCRIPT = r'''
+if [[ -n $WITH_HOOK ]]; then source "$HOOK"; else _vibe_prompt() { :; }; fi
+start=$EPOCHREALTIME
+for ((i = 0; i < CDS; i++)); do
+    cd "$FIRST"; _vibe_prompt
+    cd "$SECOND"; _vibe_prompt
+done
+end=$EPOCHREALTIME
+echo $(( ${end/./} - ${start/./} ))
+'''
+
+# Visits each directory given as an argument, emulating a prompt after each cd
+VISIT_SCRIPT = r'''
+source "$HOOK"
+for dir in "$@"; do
+    cd "$dir"; _vibe_prompt
+done
+'''
+
+# Helpers for run_python(): renders and registers a project like `vibe start` does
+PRELUDE = '''
+from vibe_coding_kit.cli.global_commands import save_global_rules
+from vibe_coding_kit.cli.project_commands import create_project_rules_files, render_project_rules
+from vibe_coding_kit.cli.registry import record_project
+
+def render(path):
+    content = render_project_rules()
+    create_project_rules_files('windsurf', path, content)
+    record_project(path, 'windsurf', content)
+
+'''
+
+# Stands in for the vibe command on PATH and counts how often the hook starts it
+VIBE_WRAPPER = '''#!/bin/sh
+echo "$@" >> "$VIBE_HOOK_CALLS"
+exec "{python}" -m vibe_coding_kit.cli.main "$@"
+'''
+
+
+def make_scratch(scratch: str) -> Tuple[Dict[str, str], str]:
+    """
+    Copy the kit into a scratch root with its own data dir, a vibe command and one registered project.
+
+    Returns:
+        Tuple of (environment for bash, registered project directory)
+    """
+    ignore = shutil.ignore_patterns('__pycache__', 'global_rules_template.md', 'org_rules_template.md')
+    shutil.copytree(os.path.join(REPO_ROOT, 'vibe_coding_kit'), os.path.join(scratch, 'vibe_coding_kit'), ignore=ignore)
+    shutil.copytree(os.path.join(REPO_ROOT, 'templates'), os.path.join(scratch, 'templates'), ignore=ignore)
+    project = os.path.join(scratch, 'work', 'project')
+    os.makedirs(os.path.join(project, 'src', 'pkg', 'deep'))
+    os.makedirs(os.path.join(scratch, 'work', 'elsewhere', 'a', 'b'))
+    os.makedirs(os.path.join(scratch, 'bin'))
+    wrapper = os.path.join(scratch, 'bin', 'vibe')
+    with open(wrapper, 'w', encoding='utf-8') as f:
+        f.write(VIBE_WRAPPER.format(python=sys.executable))
+    os.chmod(wrapper, 0o755)
+
+    env = {
+        "PATH": os.path.join(scratch, 'bin') + os.pathsep + os.environ.get("PATH", ""),
+        "HOME": scratch,
+        "PYTHONPATH": scratch,
+        "VIBE_DATA_DIR": os.path.join(scratch, 'data'),
+        "VIBE_CACHE_DIR": os.path.join(scratch, 'cache'),
+        "VIBE_HOOK_CALLS": os.path.join(scratch, 'calls'),
+        "HOOK": HOOK_PATH,
+    }
+    run_python(env, scratch, "save_global_rules('english', 'english'); render('{project}')".format(project=project))
+
+    # Sources written in the last second count as newer than the manifest stamp: age them first
+    past = time.time() - 60
+    for root, _, names in os.walk(os.path.join(scratch, 'templates')):
+        for name in names + ['.']:
+            os.utime(os.path.join(root, name), (past, past))
+    subprocess.run(['vibe', 'status', '--shell-manifest'], env=env, cwd=scratch, check=True)
+    count_calls(env)
+    return env, project
+
+
+def run_python(env: Dict[str, str], scratch: str, statements: str) -> None:
+    """
+    Run statements against the scratch kit, with save_global_rules() and render(path) at hand.
+    """
+    # Run from the scratch root: `python -c` puts the working directory first on the import path
+    subprocess.run([sys.executable, "-c", PRELUDE + statements], env=env, cwd=scratch, check=True,
+                   stdout=subprocess.DEVNULL)
+
+
+def count_calls(env: Dict[str, str]) -> int:
+    """
+    Count the vibe runs the hook made so far, and reset the count.
+    """
+    try:
+        with open(env["VIBE_HOOK_CALLS"], 'r', encoding='utf-8') as f:
+            calls = len(f.read().splitlines())
+    except FileNotFoundError:
+        return 0
+    os.remove(env["VIBE_HOOK_CALLS"])
+    return calls
+
+
+def time_cds(env: Dict[str, str], first: str, second: str, cds: int, with_hook: bool) -> float:
+    """
+    Time round trips between two directories.
+
+    Returns:
+        Microseconds per cd
+    """
+    run_env = dict(env, FIRST=first, SECOND=second, CDS=str(cds), WITH_HOOK="1" if with_hook else "")
+    result = subprocess.run(['bash', '--norc', '--noprofile', '-c', TIMING_SCRIPT], env=run_env,
+                            capture_output=True, text=True, check=True)
+    return int(result.stdout.strip().splitlines()[-1]) / (2 * cds)
+
+
+def visit(env: Dict[str, str], *dirs: str) -> str:
+    """
+    Visit directories in one bash session with the hook loaded.
+
+    Returns:
+        What the hook printed
+    """
+    result = subprocess.run(['bash', '--norc', '--noprofile', '-c', VISIT_SCRIPT, 'visit'] + list(dirs),
+                            env=env, capture_output=True, text=True, check=True)
+    return result.stdout + result.stderr
+
+
+def main() -> None:
+    """
+    Command line entry point for the cd hook check.
+    """
+    parser = argparse.ArgumentParser(description="Check the overhead and warnings of the shell cd hook")
+    parser.add_argument("--budget-ms", type=float, default=2.0, help="Maximum overhead per cd")
+    parser.add_argument("--cds", type=int, default=1000, help="Round trips per timing run")
+    args = parser.parse_args()
+    if not shutil.which('bash'):
+        print("FAIL: bash is not installed")
+        sys.exit(1)
+
+    errors = []
+    scratch = tempfile.mkdtemp(prefix='vibe-hook-')
+    try:
+        env, project = make_scratch(scratch)
+        deep = os.path.join(project, 'src', 'pkg', 'deep')
+        elsewhere = os.path.join(scratch, 'work', 'elsewhere', 'a', 'b')
+
+        # Best of three runs each, so a scheduler hiccup does not decide the result
+        timings = {}
+        for label, first, second in (("in and out of a project", deep, elsewhere),
+                                     ("outside projects", elsewhere, scratch)):
+            baseline = min(time_cds(env, first, second, args.cds, False) for _ in range(3))
+            hooked = min(time_cds(env, first, second, args.cds, True) for _ in range(3))
+            timings[label] = (baseline, hooked)
+        calls = count_calls(env)
+        if calls:
+            errors.append(f"the hook started vibe {calls} times while nothing changed")
+
+        if visit(env, project, deep):
+            errors.append("the hook warned about an up-to-date project")
+
+        run_python(env, scratch, "save_global_rules('french', 'french')")
+        # Within a second of a change the hook refreshes on every cd (the stamp is a second early, so
+        # no change is missed on filesystems with whole-second mtimes); count the refreshes after it
+        time.sleep(1.1)
+        output = visit(env, project, deep, elsewhere, deep)
+        calls = count_calls(env)
+        if output.count("are stale") != 2 or "global rules changed" not in output:
+            errors.append(f"expected a stale warning on each of the 2 project entries, got: {output!r}")
+        if calls != 1:
+            errors.append(f"expected one manifest refresh after the global rules changed, got {calls}")
+        if visit(env, elsewhere, scratch):
+            errors.append("the hook warned outside any project")
+
+        run_python(env, scratch, f"render({project!r})")
+        output = visit(env, deep)
+        if output:
+            errors.append(f"the hook still warned after the project was re-rendered: {output!r}")
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+    for label, (baseline, hooked) in timings.items():
+        print(f"cd {label}: {baseline:.1f} us without the hook, {hooked:.1f} us with it "
+              f"(+{hooked - baseline:.1f} us per cd)")
+        if (hooked - baseline) / 1000 > args.budget_ms:
+            errors.append(f"the hook adds more than {args.budget_ms:.1f} ms per cd {label}")
+    if errors:
+        for error in errors:
+            print(f"FAIL: {error}")
+        sys.exit(1)
+    print("OK: the hook stays within budget and warns only about stale projects")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Cold start check for the vibe command.
+Measures the import cost of the CLI entry point with `python -X importtime` and fails if it exceeds a budget.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict
+
+# Modules that must not be imported just to parse arguments or print help
+LAZY_MODULES = [
+    "vibe_coding_kit.cli.commands",
+    "vibe_coding_kit.cli.global_commands",
+    "vibe_coding_kit.cli.project_commands",
+    "vibe_coding_kit.cli.batch_commands",
+]
+
+REPO_ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+
+def get_import_times(code: str) -> Dict[str, int]:
+    """
+    Run a snippet under `python -X importtime` and collect top-level import times.
+
+    Args:
+        code: Python code to execute
+
+    Returns:
+        Mapping of module name to cumulative import time in microseconds, for
+        every module imported at the top level of the snippet or interpreter startup
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = REPO_ROOT + os.pathsep + env.get("PYTHONPATH", "")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        env=env,
+        check=True
+    )
+
+    times = {}
+    for line in result.stderr.splitlines():
+        # Lines look like: "import time:       123 |        456 |   package.module"
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        name = parts[2].rstrip()
+        # Nested imports are indented; their cost is already in the parent's cumulative time
+        if name.startswith("  "):
+            continue
+        times[name.strip()] = int(parts[1])
+    return times
+
+
+def measure_cli_import(runs: int) -> Dict[str, object]:
+    """
+    Measure the import cost attributable to the vibe CLI entry point.
+
+    Args:
+        runs: Number of runs; the fastest run is reported to reduce noise
+
+    Returns:
+        Dictionary with the best import time in milliseconds and any eagerly loaded lazy modules
+    """
+    baseline = set(get_import_times("pass"))
+    best_us = None
+    eager = []
+
+    for _ in range(runs):
+        times = get_import_times("import vibe_coding_kit.cli.main")
+        cli_us = sum(us for name, us in times.items() if name not in baseline)
+        if best_us is None or cli_us < best_us:
+            best_us = cli_us
+        eager = [name for name in LAZY_MODULES if name in times]
+
+    return {"import_ms": best_us / 1000.0, "eager_modules": eager}
+
+
+def main() -> None:
+    """
+    Command line entry point for the startup check.
+    """
+    parser = argparse.ArgumentParser(description="Fail if the vibe CLI cold start exceeds a budget")
+    parser.add_argument("--budget-ms", type=float, default=30.0, help="Import time budget in milliseconds")
+    parser.add_argument("--runs", type=int, default=5, help="Number of runs (best run is used)")
+    args = parser.parse_args()
+
+    result = measure_cli_import(args.runs)
+    print(f"vibe CLI import time: {result['import_ms']:.1f} ms (budget {args.budget_ms:.1f} ms)")
+
+    failed = False
+    if result["eager_modules"]:
+        print(f"FAIL: command modules imported at startup: {', '.join(result['eager_modules'])}")
+        failed = True
+    if result["import_ms"] > args.budget_ms:
+        print("FAIL: cold start exceeds budget")
+        failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for an organisation template endpoint.
+Serves the files of a directory over HTTP with ETag and Last-Modified validators and answers conditional
+requests with 304, like a static file host or CDN would. Used by check_org_source.py, and handy for
+trying VIBE_ORG_SOURCE without a real server.
+"""
+
+import argparse
+import hashlib
+import os
+import threading
+from email.utils import formatdate, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Tuple
+
+
+class TemplateHandler(BaseHTTPRequestHandler):
+    """
+    Answers GET requests for files of the served directory.
+    """
+
+    server: "TemplateServer"
+
+    def do_GET(self) -> None:
+        name = self.path.split('?', 1)[0].lstrip('/')
+        file_path = os.path.join(self.server.directory, name)
+        if not name or os.path.dirname(os.path.normpath(name)) or not os.path.isfile(file_path):
+            self.reply(404, b"not found\n")
+            return
+        with open(file_path, 'rb') as f:
+            content = f.read()
+        mtime = int(os.stat(file_path).st_mtime)
+        etag = '"%s"' % hashlib.sha256(content).hexdigest()[:16]
+        headers = [("ETag", etag), ("Last-Modified", formatdate(mtime, usegmt=True))]
+
+        # If-None-Match takes precedence over If-Modified-Since (RFC 9110)
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match is not None:
+            not_modified = etag in [tag.strip() for tag in if_none_match.split(',')]
+        else:
+            try:
+                not_modified = mtime <= parsedate_to_datetime(self.headers["If-Modified-Since"]).timestamp()
+            except (TypeError, ValueError):
+                not_modified = False
+        if not_modified:
+            self.reply(304, b"", headers)
+        else:
+            self.reply(200, content, headers + [("Content-Type", "text/markdown; charset=utf-8")])
+
+    def reply(self, status: int, body: bytes, headers: List[Tuple[str, str]] = ()) -> None:
+        with self.server.lock:
+            self.server.requests.append((self.path, status, self.headers.get("If-None-Match")))
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        if status != 304:
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class TemplateServer(ThreadingHTTPServer):
+    """
+    HTTP server over a directory that records (path, status, If-None-Match) of every request.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, directory: str, host: str = "127.0.0.1", port: int = 0, verbose: bool = False):
+        super().__init__((host, port), TemplateHandler)
+        self.directory = os.path.abspath(directory)
+        self.verbose = verbose
+        self.requests: List[Tuple[str, int, str]] = []
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+def main() -> None:
+    """
+    Command line entry point: serve a directory until interrupted.
+    """
+    parser = argparse.ArgumentParser(description="Serve organisation templates with ETag/Last-Modified validation")
+    parser.add_argument("directory", help="Directory with org_rules_template.md")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to listen on")
+    parser.add_argument("--port", type=int, default=8766, help="TCP port")
+    args = parser.parse_args()
+
+    server = TemplateServer(args.directory, args.host, args.port, verbose=True)
+    print(f"Serving {server.directory} on {server.url}, e.g. VIBE_ORG_SOURCE={server.url}/org_rules_template.md")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -7,6 +7,9 @@ shell_type=$(basename "$SHELL")
 # Path to the initialization script
 init_script=""
 
+# Path to the cd hook that warns about stale projects
+hook_script="$(cd "$(dirname "$0")" && pwd)/vibe_cd_hook.sh"
+
 if [ "$shell_type" = "zsh" ]; then
     # For ZSH
     init_script="$HOME/.zshrc"
@@ -33,3 +36,14 @@ if ! grep -q "# vibe-coding-init-kit integration" "$init_script"; then
 else
     echo "Shell integration already exists in $init_script"
 fi
+
+# Add the cd hook separately, so existing integrations pick it up too
+if ! grep -q "# vibe-coding-init-kit cd hook" "$init_script"; then
+    echo "# vibe-coding-init-kit cd hook" >> "$init_script"
+    echo "[ -f \"$hook_script\" ] && source \"$hook_script\"" >> "$init_script"
+    echo "" >> "$init_script"
+
+    echo "cd hook added to $init_script"
+else
+    echo "cd hook already exists in $init_script"
+fi
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Concurrency stress check for rules file publishing.
+Runs hundreds of processes against a scratch copy of the kit: writers republish the global rules and a
+project's rules files, appenders do locked read-modify-writes, readers check every read is one complete
+version. Fails on any torn read, lost append, duplicated "created" status or leftover temp file.
+"""
+
+import argparse
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+REPO_ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+EDITORS = "windsurf,cursor"
+# Padding per rules file: large enough that an unprotected write spans many syscalls
+BODY_LINES = 800
+
+GLOBAL_RULES_PATTERN = re.compile(
+    r"\A## Language Rules\ncommunication_language: (\S+)\ncode_comment_language: (\S+)\n\Z"
+)
+
+
+def build_rules(token: str) -> str:
+    """
+    Build the rules content of one write; the token opens and closes it, so a torn read shows.
+    """
+    body = ''.join(f"- rule {line} of write {token}\n" for line in range(BODY_LINES))
+    return f"# Project Rules\n\nstress-token: {token}\n\n{body}\nstress-token: {token}\n"
+
+
+def wait_for(path: str) -> None:
+    """
+    Block until the parent creates a marker file, so all workers start together.
+    """
+    while not os.path.exists(path):
+        time.sleep(0.001)
+
+
+def run_writer(args: argparse.Namespace) -> Dict:
+    """
+    Republish the global rules and the project rules, and race once on creating a shared file.
+    """
+    from vibe_coding_kit.cli.fileio import write_if_changed
+    from vibe_coding_kit.cli.global_commands import save_global_rules
+    from vibe_coding_kit.cli.project_commands import create_project_rules_files
+
+    wait_for(args.go)
+    created = write_if_changed(os.path.join(args.scratch, 'shared', 'created.md'), "first writer wins\n")
+    statuses: Dict[str, int] = {}
+    for iteration in range(args.iterations):
+        token = f"w{args.index}-{iteration}"
+        save_global_rules(token, token)
+        for status in create_project_rules_files(EDITORS, args.project, build_rules(token)).values():
+            statuses[status] = statuses.get(status, 0) + 1
+    return {"created": created, "statuses": statuses}
+
+
+def run_appender(args: argparse.Namespace) -> Dict:
+    """
+    Append lines to a shared log with locked read-modify-writes.
+    """
+    from vibe_coding_kit.cli.fileio import atomic_write, locked
+
+    log_path = os.path.join(args.scratch, 'shared', 'appends.log')
+    wait_for(args.go)
+    for iteration in range(args.iterations):
+        with locked(log_path):
+            try:
+                with open(log_path, 'r', encoding='utf-8') as f:
+                    existing = f.read()
+            except FileNotFoundError:
+                existing = ""
+            atomic_write(log_path, existing + f"a{args.index}-{iteration}\n")
+    return {}
+
+
+def run_reader(args: argparse.Namespace) -> Dict:
+    """
+    Read the published files without locks until the writers are done, checking every version is whole.
+    """
+    from vibe_coding_kit.cli.editors import render_outputs
+    from vibe_coding_kit.cli.main import is_first_run
+    from vibe_coding_kit.cli.paths import get_global_rules_path
+    from vibe_coding_kit.cli.project_commands import get_global_rules
+
+    errors: List[str] = []
+    rules_path = os.path.join(args.project, '.windsurfrules')
+    wait_for(args.go)
+    reads = 0
+    while not os.path.exists(args.done) and len(errors) < 10:
+        reads += 1
+        if is_first_run():
+            errors.append("is_first_run() saw no global rules file")
+        with open(get_global_rules_path(), 'r', encoding='utf-8') as f:
+            content = f.read()
+        match = GLOBAL_RULES_PATTERN.match(content)
+        if not match or match.group(1) != match.group(2):
+            errors.append(f"torn global rules: {content!r}")
+        rules = get_global_rules()
+        if rules["communication_language"] != rules["code_comment_language"]:
+            errors.append(f"get_global_rules() mixed two versions: {rules}")
+
+        with open(rules_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        token = re.match(r"# Project Rules\n\nstress-token: (\S+)\n", content)
+        expected = dict(render_outputs(EDITORS, build_rules(token.group(1))))[".windsurfrules"] if token else None
+        if content != expected:
+            errors.append(f"torn project rules ({len(content)} bytes, starting {content[:60]!r})")
+        # Leave CPU time for the writers: a hundred spinning readers would starve them
+        time.sleep(0.002)
+    return {"reads": reads, "errors": errors}
+
+
+def run_worker(args: argparse.Namespace) -> None:
+    """
+    Worker process entry point: run one role and print its report as JSON.
+    """
+    roles = {"writer": run_writer, "appender": run_appender, "reader": run_reader}
+    try:
+        report = roles[args.role](args)
+    except Exception as e:
+        report = {"errors": [f"{args.role} {args.index} failed: {type(e).__name__}: {e}"]}
+    print(json.dumps(report))
+
+
+def make_scratch_kit(scratch: str) -> str:
+    """
+    Copy the kit into a scratch root, so the global rules of the check never touch the real templates.
+
+    Returns:
+        Project directory for the writers
+    """
+    ignore = shutil.ignore_patterns('__pycache__', 'global_rules_template.md', 'org_rules_template.md')
+    shutil.copytree(os.path.join(REPO_ROOT, 'vibe_coding_kit'), os.path.join(scratch, 'vibe_coding_kit'), ignore=ignore)
+    shutil.copytree(os.path.join(REPO_ROOT, 'templates'), os.path.join(scratch, 'templates'), ignore=ignore)
+    for name in ('project', 'shared', 'data', 'cache'):
+        os.makedirs(os.path.join(scratch, name))
+    return os.path.join(scratch, 'project')
+
+
+def main() -> None:
+    """
+    Command line entry point for the stress check.
+    """
+    parser = argparse.ArgumentParser(description="Stress concurrent rules publishing")
+    parser.add_argument("--processes", type=int, default=300, help="Number of worker processes")
+    parser.add_argument("--iterations", type=int, default=10, help="Writes per writer and appender")
+    parser.add_argument("--role", choices=["writer", "appender", "reader"], help=argparse.SUPPRESS)
+    parser.add_argument("--index", type=int, default=0, help=argparse.SUPPRESS)
+    parser.add_argument("--scratch", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.role:
+        args.project = os.path.join(args.scratch, 'project')
+        args.go = os.path.join(args.scratch, 'go')
+        args.done = os.path.join(args.scratch, 'done')
+        run_worker(args)
+        return
+
+    scratch = tempfile.mkdtemp(prefix='vibe-stress-')
+    try:
+        project = make_scratch_kit(scratch)
+        env = dict(os.environ)
+        env["PYTHONPATH"] = scratch
+        env["VIBE_DATA_DIR"] = os.path.join(scratch, 'data')
+        env["VIBE_CACHE_DIR"] = os.path.join(scratch, 'cache')
+        # Readers start against published files
+        seed = ("from vibe_coding_kit.cli.global_commands import save_global_rules; "
+                "from vibe_coding_kit.cli.project_commands import create_project_rules_files; "
+                "save_global_rules('seed', 'seed'); "
+                f"create_project_rules_files({EDITORS!r}, {project!r}, {build_rules('seed')!r})")
+        # Run from the scratch root: `python -c` puts the working directory first on the import path
+        subprocess.run([sys.executable, "-c", seed], env=env, cwd=scratch, check=True, stdout=subprocess.DEVNULL)
+
+        roles = ["writer", "appender", "reader"]
+        workers = {role: [] for role in roles}
+        for index in range(args.processes):
+            role = roles[index % len(roles)]
+            command = [sys.executable, os.path.abspath(__file__), "--role", role, "--index", str(index),
+                       "--scratch", scratch, "--iterations", str(args.iterations)]
+            workers[role].append(subprocess.Popen(command, env=env, cwd=scratch, stdout=subprocess.PIPE, text=True))
+
+        start = time.perf_counter()
+        open(os.path.join(scratch, 'go'), 'w').close()
+        reports: Dict[str, List[Dict]] = {role: [] for role in roles}
+        for role in ("writer", "appender", "reader"):
+            if role == "reader":
+                open(os.path.join(scratch, 'done'), 'w').close()
+            for worker in workers[role]:
+                output, _ = worker.communicate()
+                try:
+                    reports[role].append(json.loads(output.strip().splitlines()[-1]))
+                except (IndexError, ValueError):
+                    reports[role].append({"errors": [f"{role} exited with {worker.returncode} and no report"]})
+        elapsed = time.perf_counter() - start
+
+        errors = [error for role in roles for report in reports[role] for error in report.get("errors", ())]
+        created = sum(1 for report in reports["writer"] if report.get("created") == "created")
+        if reports["writer"] and created != 1:
+            errors.append(f"{created} writers saw created.md as created, expected exactly 1")
+
+        with open(os.path.join(scratch, 'shared', 'appends.log'), 'r', encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        expected = {f"a{index}-{iteration}" for index in range(args.processes) if index % len(roles) == 1
+                    for iteration in range(args.iterations)}
+        if len(lines) != len(expected) or set(lines) != expected:
+            errors.append(f"lost or duplicated appends: {len(lines)} lines, expected {len(expected)}")
+
+        leftovers = [os.path.join(root, name) for root, _, names in os.walk(scratch) for name in names
+                     if name.endswith('.tmp')]
+        if leftovers:
+            errors.append(f"{len(leftovers)} temp files left behind, e.g. {leftovers[0]}")
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+    reads = sum(report.get("reads", 0) for report in reports["reader"])
+    writes = sum(sum(report.get("statuses", {}).values()) for report in reports["writer"])
+    print(f"{args.processes} processes in {elapsed:.1f} s: {writes} rules file writes, "
+          f"{len(lines)} locked appends, {reads} unlocked reads")
+    if errors:
+        for error in errors[:20]:
+            print(f"FAIL: {error}")
+        sys.exit(1)
+    print("OK: no torn reads, no lost writes")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+# cd hook for vibe-coding-init-kit (bash and zsh)
+# Warns when you enter a project whose rules files are stale. A cd only runs builtin file tests
+# against a manifest vibe precomputes under its data dir; vibe itself runs only when a rules source
+# (global rules, templates, rule packs) changed since the manifest was written.
+# Source this file from ~/.zshrc or ~/.bashrc (scripts/shell_integration.sh adds the line).
+
+# Succeeds if a source listed in the manifest changed, appeared or disappeared since its stamp
+_vibe_sources_changed() {
+    local line
+    [[ -f $1/stamp && -f $1/sources ]] || return 0
+    while IFS= read -r line; do
+        case $line in
+            +*) [[ -e ${line#+} && ! ${line#+} -nt $1/stamp ]] || return 0 ;;
+            -*) [[ -e ${line#-} ]] && return 0 ;;
+        esac
+    done < "$1/sources"
+    return 1
+}
+
+# Rebuild the manifest; if vibe cannot, stay quiet for the rest of the session
+_vibe_refresh() {
+    command vibe status --shell-manifest >/dev/null 2>&1 || _VIBE_HOOK_OFF=1
+}
+
+_vibe_chpwd() {
+    [[ -z ${_VIBE_HOOK_OFF-} ]] || return 0
+    local manifest=${VIBE_DATA_DIR:-${XDG_DATA_HOME:-$HOME/.local/share}/vibe-coding-kit}/shell
+    local dir=$PWD marker reasons
+    if [[ ! -f $manifest/stamp ]]; then
+        _vibe_refresh
+        [[ -z ${_VIBE_HOOK_OFF-} ]] || return 0
+    fi
+
+    # The nearest registered project at or above the current directory
+    while [[ -n $dir ]]; do
+        marker=$manifest/projects/${dir//\//%}
+        [[ -f $marker ]] && break
+        dir=${dir%/*}
+    done
+    if [[ -z $dir ]]; then
+        _VIBE_WARNED=
+        return 0
+    fi
+
+    if _vibe_sources_changed "$manifest"; then
+        _vibe_refresh
+        [[ -f $marker ]] || return 0
+    fi
+    if [[ ! -s $marker ]]; then
+        _VIBE_WARNED=
+    elif [[ $dir != "${_VIBE_WARNED-}" ]]; then
+        # Warn once per project entered, not on every cd inside it
+        IFS= read -r reasons < "$marker"
+        printf 'vibe: rules of %s are stale (%s), run "vibe reset" there to re-render them\n' "$dir" "$reasons" >&2
+        _VIBE_WARNED=$dir
+    fi
+    return 0
+}
+
+# bash has no cd hook: check before each prompt, only when the directory changed
+_vibe_prompt() {
+    if [[ $PWD != "${_VIBE_LAST_PWD-}" ]]; then
+        _VIBE_LAST_PWD=$PWD
+        _vibe_chpwd
+    fi
+}
+
+if [[ -n ${ZSH_VERSION-} ]]; then
+    autoload -Uz add-zsh-hook
+    add-zsh-hook chpwd _vibe_chpwd
+elif [[ -n ${BASH_VERSION-} ]]; then
+    case ";${PROMPT_COMMAND-};" in
+        *";_vibe_prompt;"*) ;;
+        *) PROMPT_COMMAND="_vibe_prompt${PROMPT_COMMAND:+;$PROMPT_COMMAND}" ;;
+    esac
+fi
@@ -53,6 +53,8 @@ setup(
         "console_scripts": [
             "vibe=vibe_coding_kit.cli.main:main",
         ],
+        # Rule packs from other packages, e.g. "django = my_rules.packs:DJANGO" (see vibe_coding_kit/cli/rule_packs.py)
+        "vibe_coding_kit.rule_packs": [],
     },
     python_requires=">=3.6",
     author="Vibe Coding Team",
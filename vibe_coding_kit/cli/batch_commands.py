@@ -0,0 +1,159 @@
+"""
+Batch command implementations for vibe-coding-kit CLI.
+Initializes many project roots in one pass on a worker pool.
+"""
+
+import os
+import sqlite3
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .editors import AUTO_EDITOR, describe_editor_types, detect_editor_types
+from .profiles import language_overrides, resolve_profile
+from .project_commands import create_project_structure, create_project_rules_file
+from .propagate_commands import Renderer, make_renderer
+from .registry import make_entry, record_projects
+from .rule_packs import find_unknown_requests
+from .stack import detect_stacks
+
+
+def read_project_dirs(paths: Iterable[str] = (), batch_file: Optional[str] = None) -> List[str]:
+    """
+    Collect project roots from arguments and an optional list file.
+
+    Args:
+        paths: Project roots given on the command line
+        batch_file: File with one project root per line ("-" reads stdin)
+
+    Returns:
+        De-duplicated list of absolute project roots, in input order
+    """
+    entries = list(paths)
+
+    if batch_file is not None:
+        if batch_file == '-':
+            entries.extend(sys.stdin.read().splitlines())
+        else:
+            with open(batch_file, 'r', encoding='utf-8') as f:
+                entries.extend(f.read().splitlines())
+
+    project_dirs = []
+    seen = set()
+    for entry in entries:
+        entry = entry.strip()
+        # Skip blank lines and comments in list files
+        if not entry or entry.startswith('#'):
+            continue
+        project_dir = os.path.abspath(os.path.expanduser(entry))
+        if project_dir not in seen:
+            seen.add(project_dir)
+            project_dirs.append(project_dir)
+
+    return project_dirs
+
+
+def _start_project(
+    project_dir: str,
+    editor_type: str,
+    render: Renderer,
+    packs: List[str] = ()
+) -> Tuple[str, bool, str, str, Optional[Dict]]:
+    """
+    Initialize a single project root with the rules rendered for its stacks and the settings of its profile.
+
+    Args:
+        project_dir: Project root directory
+        editor_type: Comma-separated editor types, or "auto" to use the ones the project already has,
+            for projects whose profile sets no editor
+        render: Renderer from make_renderer(), shared by every project
+        packs: Plugin pack names or tags added to every project
+
+    Returns:
+        Tuple of (project_dir, success, rules file path or error message, combined write status,
+        registry settings: {"editor", "stacks", "packs", "overrides", "rules_digest"} or None on failure)
+    """
+    if not os.path.isdir(project_dir):
+        return project_dir, False, "not a directory", "", None
+
+    try:
+        # Resolved per project: a project's .vibe/config.json can pick its own settings
+        profile = resolve_profile(project_dir)
+        editor_type = profile["editor"] or editor_type
+        if editor_type == AUTO_EDITOR:
+            editor_type = detect_editor_types(project_dir)
+            if not editor_type:
+                return project_dir, False, "no editor rules found to detect (pass --editor)", "", None
+
+        stacks = profile["stacks"] if profile["stacks"] is not None else detect_stacks(project_dir)
+        packs = sorted(set(packs) | set(profile["packs"] or ()))
+        overrides = language_overrides(profile)
+        rules_content, rules_digest = render(stacks, overrides, packs=packs)
+        create_project_structure(project_dir)
+        rules_file_path, status = create_project_rules_file(editor_type, project_dir, rules_content)
+    except Exception as e:
+        return project_dir, False, str(e), "", None
+
+    return project_dir, True, rules_file_path, status, {
+        "editor": editor_type, "stacks": stacks, "packs": packs, "overrides": overrides, "rules_digest": rules_digest,
+    }
+
+
+def batch_start_command(
+    project_dirs: List[str],
+    editor_type: str = "windsurf",
+    workers: Optional[int] = None,
+    packs: Iterable[str] = ()
+) -> int:
+    """
+    Initialize many projects at once and print a per-project summary.
+    The rules are rendered only once per distinct set of detected stacks,
+    and each editor format is derived from that single render.
+
+    Args:
+        project_dirs: Project root directories to initialize
+        editor_type: Comma-separated editor types, or "auto" to detect them per project
+        workers: Number of worker threads (defaults to the executor's default)
+        packs: Plugin pack names or tags added to every project
+
+    Returns:
+        Number of projects that failed
+    """
+    if not project_dirs:
+        print("No project directories given.")
+        return 0
+
+    target = "detected editors" if editor_type == AUTO_EDITOR else describe_editor_types(editor_type)
+    print(f"\nInitializing {len(project_dirs)} projects for {target}...")
+    packs = sorted(set(packs))
+    for name in find_unknown_requests(packs):
+        print(f"Warning: No installed rule pack is named or tagged '{name}'.")
+    render = make_renderer()
+
+    failures = 0
+    entries = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(
+            lambda project_dir: _start_project(project_dir, editor_type, render, packs),
+            project_dirs
+        )
+        for project_dir, success, detail, status, settings in results:
+            if success:
+                stack_note = f", {'+'.join(settings['stacks'])}" if settings["stacks"] else ""
+                print(f"ok    {project_dir} -> {settings['editor']}{stack_note} ({status})")
+                entries.append(make_entry(
+                    project_dir, settings["editor"], detail, settings["overrides"],
+                    rules_digest=settings["rules_digest"], stacks=settings["stacks"], packs=settings["packs"]
+                ))
+            else:
+                failures += 1
+                print(f"FAIL  {project_dir}: {detail}")
+
+    # Record every initialized project in one registry transaction
+    try:
+        record_projects(entries)
+    except (sqlite3.Error, OSError) as e:
+        print(f"Warning: Could not update project registry: {e}")
+
+    print(f"\nBatch complete: {len(project_dirs) - failures} succeeded, {failures} failed.")
+    return failures
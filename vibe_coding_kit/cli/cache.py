@@ -0,0 +1,132 @@
+"""
+Parsed file cache for vibe-coding-kit CLI.
+Caches values derived from source files in memory and optionally on disk,
+invalidated by the file's (mtime_ns, size, inode) signature.
+"""
+
+import hashlib
+import json
+import os
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .paths import get_user_cache_dir
+
+# In-process cache: (kind, path) -> (signature, value)
+_memory_cache: Dict[Tuple[str, str], Tuple[Optional[Tuple[int, int, int]], Any]] = {}
+
+
+def file_signature(path: str) -> Optional[Tuple[int, int, int]]:
+    """
+    Get the cache signature of a file with a single stat call.
+
+    Args:
+        path: File path
+
+    Returns:
+        Tuple of (mtime_ns, size, inode), or None if the file does not exist
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def disk_cache_enabled() -> bool:
+    """
+    Check whether the on-disk cache is enabled (VIBE_DISK_CACHE=1).
+
+    Returns:
+        True if parsed values should also be persisted under the user cache dir
+    """
+    return os.environ.get('VIBE_DISK_CACHE', '') not in ('', '0')
+
+
+def _disk_cache_path(kind: str, path: str) -> str:
+    """
+    Get the on-disk cache entry path for a (kind, source path) pair.
+
+    Args:
+        kind: Kind of parsed value
+        path: Source file path
+
+    Returns:
+        Path to the JSON cache entry
+    """
+    key = hashlib.sha1(f"{kind}\0{os.path.abspath(path)}".encode('utf-8')).hexdigest()
+    return os.path.join(get_user_cache_dir(), 'parsed', f"{key}.json")
+
+
+def _read_disk_entry(kind: str, path: str, signature: Optional[Tuple[int, int, int]]) -> Tuple[bool, Any]:
+    """
+    Read a value from the on-disk cache if its signature still matches.
+
+    Returns:
+        Tuple of (hit, value)
+    """
+    try:
+        with open(_disk_cache_path(kind, path), 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return False, None
+    stored = entry.get('signature')
+    if (tuple(stored) if stored is not None else None) != signature:
+        return False, None
+    return True, entry.get('value')
+
+
+def _write_disk_entry(kind: str, path: str, signature: Optional[Tuple[int, int, int]], value: Any) -> None:
+    """
+    Persist a value to the on-disk cache. Failures are ignored, the cache is best effort.
+    """
+    # Imported here: the write path is rare and fileio pulls in tempfile
+    from .fileio import atomic_write
+
+    entry_path = _disk_cache_path(kind, path)
+    try:
+        os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+        # A unique temp file per write: threads of one process (e.g. `vibe serve`) may store the same entry
+        atomic_write(entry_path, json.dumps({'signature': signature, 'value': value}))
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+def cached_load(kind: str, path: str, loader: Callable[[str], Any]) -> Any:
+    """
+    Load a value derived from a file, re-running the loader only when the file changed.
+    The hot path is one stat call on the source file.
+
+    Args:
+        kind: Kind of parsed value, so one file can back several cached values
+        path: Source file path (may not exist; the loader handles that case)
+        loader: Function taking the path and returning a JSON-serializable value
+
+    Returns:
+        Cached or freshly loaded value
+    """
+    signature = file_signature(path)
+    key = (kind, path)
+
+    entry = _memory_cache.get(key)
+    if entry is not None and entry[0] == signature:
+        return entry[1]
+
+    use_disk = disk_cache_enabled() and signature is not None
+    if use_disk:
+        hit, value = _read_disk_entry(kind, path, signature)
+        if hit:
+            _memory_cache[key] = (signature, value)
+            return value
+
+    value = loader(path)
+    _memory_cache[key] = (signature, value)
+    if use_disk:
+        _write_disk_entry(kind, path, signature, value)
+    return value
+
+
+def clear_cache() -> None:
+    """
+    Drop all in-process cache entries.
+    """
+    _memory_cache.clear()
@@ -0,0 +1,164 @@
+"""
+Check command implementation for vibe-coding-kit CLI.
+Enforces the project rule that code files stay within a maximum number of lines.
+"""
+
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from .fileio import atomic_write
+from .paths import get_user_cache_dir
+from .walk import walk_entries
+
+# Limit stated in templates/project_rules_template.md
+DEFAULT_MAX_LINES = 400
+
+# Code files covered by the rule ("including .html, .css, .js, .py, etc.")
+CODE_EXTENSIONS = (
+    '.py', '.pyi', '.js', '.jsx', '.mjs', '.cjs', '.ts', '.tsx', '.vue', '.svelte',
+    '.html', '.htm', '.css', '.scss', '.sass', '.less', '.go', '.rs', '.java', '.kt',
+    '.scala', '.c', '.h', '.cc', '.cpp', '.hpp', '.cs', '.m', '.swift', '.rb', '.php',
+    '.lua', '.sh', '.bash', '.zsh', '.sql', '.dart', '.ex', '.exs', '.clj',
+)
+
+CACHE_VERSION = 1
+_READ_SIZE = 1 << 20
+
+
+def count_lines(path: str) -> int:
+    """
+    Count the lines of a file with bulk binary reads.
+
+    Args:
+        path: File path
+
+    Returns:
+        Number of lines (a final line without a newline counts too)
+    """
+    lines = 0
+    last = b'\n'
+    with open(path, 'rb', buffering=0) as f:
+        while True:
+            chunk = f.read(_READ_SIZE)
+            if not chunk:
+                break
+            lines += chunk.count(b'\n')
+            last = chunk[-1:]
+    return lines + (0 if last == b'\n' else 1)
+
+
+def _get_cache_path(root: str) -> str:
+    key = hashlib.sha1(os.path.abspath(root).encode('utf-8')).hexdigest()
+    return os.path.join(get_user_cache_dir(), 'check', f"{key}.json")
+
+
+def _load_cache(cache_path: str) -> Dict[str, List[int]]:
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache.get("files", {}) if cache.get("version") == CACHE_VERSION else {}
+
+
+def _count_job(job: Tuple[str, str]) -> Tuple[str, Optional[int]]:
+    path, rel_path = job
+    try:
+        return rel_path, count_lines(path)
+    except OSError:
+        return rel_path, None
+
+
+def collect_line_counts(
+    root: str,
+    workers: Optional[int] = None,
+    use_cache: bool = True
+) -> Dict[str, int]:
+    """
+    Count the lines of every code file in a tree, honouring .gitignore and skipping vendored directories.
+    Files whose (mtime, size) did not change since the last run are not read.
+
+    Args:
+        root: Project root directory
+        workers: Number of reader threads
+        use_cache: Whether to reuse counts from the previous run
+
+    Returns:
+        Mapping of relative path to line count
+    """
+    cache_path = _get_cache_path(root)
+    cached = _load_cache(cache_path) if use_cache else {}
+
+    counts: Dict[str, int] = {}
+    signatures: Dict[str, List[int]] = {}
+    jobs = []
+    for rel_path, entry in walk_entries(root, CODE_EXTENSIONS, respect_gitignore=True):
+        try:
+            st = entry.stat()
+        except OSError:
+            continue
+        signatures[rel_path] = [st.st_mtime_ns, st.st_size]
+        previous = cached.get(rel_path)
+        if previous is not None and previous[:2] == signatures[rel_path]:
+            counts[rel_path] = previous[2]
+        else:
+            jobs.append((entry.path, rel_path))
+
+    # Reads release the GIL, so threads overlap the I/O of many small files
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for rel_path, lines in executor.map(_count_job, jobs, chunksize=256):
+            if lines is not None:
+                counts[rel_path] = lines
+
+    if use_cache and (jobs or len(cached) != len(counts)):
+        files = {rel_path: signatures[rel_path] + [lines] for rel_path, lines in counts.items()}
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        atomic_write(cache_path, json.dumps({"version": CACHE_VERSION, "files": files}))
+    return counts
+
+
+def check_command(
+    project_dir: str = None,
+    max_lines: int = DEFAULT_MAX_LINES,
+    as_json: bool = False,
+    workers: Optional[int] = None,
+    use_cache: bool = True
+) -> None:
+    """
+    Report code files longer than the line limit and exit non-zero if there are any.
+
+    Args:
+        project_dir: Project root directory (defaults to the current working directory)
+        max_lines: Maximum number of lines per code file
+        as_json: Whether to print the report as JSON
+        workers: Number of reader threads
+        use_cache: Whether to reuse counts from the previous run
+    """
+    if project_dir is None:
+        project_dir = os.getcwd()
+    project_dir = os.path.abspath(project_dir)
+
+    counts = collect_line_counts(project_dir, workers, use_cache)
+    violations = sorted(
+        ((rel_path, lines) for rel_path, lines in counts.items() if lines > max_lines),
+        key=lambda item: (-item[1], item[0])
+    )
+
+    if as_json:
+        print(json.dumps({
+            "root": project_dir,
+            "max_lines": max_lines,
+            "files_checked": len(counts),
+            "violations": [{"path": rel_path, "lines": lines} for rel_path, lines in violations],
+        }, indent=2))
+    else:
+        for rel_path, lines in violations:
+            print(f"{rel_path}: {lines} lines (limit {max_lines})")
+        print(f"Checked {len(counts)} code files: {len(violations)} over {max_lines} lines.")
+
+    if violations:
+        sys.exit(1)
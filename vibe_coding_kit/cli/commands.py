@@ -4,21 +4,25 @@ Provides a unified entry point for global and project commands.
 """
 
 import os
-import json
 import sys
-from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import List, Optional, Tuple
 
-# Import global and project command modules
+# Global, project and batch command modules are imported inside each
+# command so that only the modules a command needs are loaded.
+from .editors import detect_editor_types
+from .tracing import traced
 from .utils import get_user_input, get_editor_type
-from .global_commands import global_start_command
-from .project_commands import project_start_command, create_project_rules_file, create_project_rules_file_with_overrides
 
 
+@traced("start_command")
 def start_command(
     communication_language: str = None,
     code_comment_language: str = None,
-    is_global: bool = False
+    is_global: bool = False,
+    project_dirs: Optional[List[str]] = None,
+    editor_type: Optional[str] = None,
+    workers: Optional[int] = None,
+    packs: Optional[List[str]] = None
 ) -> None:
     """
     Unified entry point, decides whether to execute global or project commands based on parameters.
@@ -27,21 +31,82 @@ def start_command(
         communication_language: Communication language preference
         code_comment_language: Code comment language preference
         is_global: Whether to apply global settings
+        project_dirs: Project roots to initialize in batch mode (None for the current directory only)
+        editor_type: Comma-separated editor types (or "auto") for batch mode, used for projects whose
+            profile sets none; taken from the profile of the current directory or prompted once if not given
+        workers: Number of worker threads for batch mode
+        packs: Plugin rule pack names or tags to add to the project rules
     """
-    if is_global:
+    if project_dirs is not None:
+        # Batch mode: ask for the editor at most once, then run without prompts
+        if editor_type is None:
+            from .profiles import resolve_profile
+            editor_type = resolve_profile()["editor"] or get_editor_type()
+        from .batch_commands import batch_start_command
+        failures = batch_start_command(project_dirs, editor_type, workers, packs or [])
+        if failures:
+            sys.exit(1)
+    elif is_global:
         # Call global initialization command
+        from .global_commands import global_start_command
         global_start_command(
             communication_language=communication_language,
             code_comment_language=code_comment_language
         )
     else:
         # Call project initialization command
-        project_start_command()
+        from .project_commands import project_start_command
+        project_start_command(packs or [])
+
+
+def _propagate(workers: Optional[int]) -> None:
+    """
+    Propagate the global rules to all stale registered projects, exiting non-zero on failures.
+    
+    Args:
+        workers: Maximum number of concurrent workers
+    """
+    from .propagate_commands import propagate_command
+    if propagate_command(workers):
+        sys.exit(1)
 
 
+def _compact_progress(project_dir: str) -> None:
+    """
+    Compact the project's dev/progress.md if it grew past the automatic threshold.
+    
+    Args:
+        project_dir: Project root directory
+    """
+    from .progress_commands import STATUS_COMPACTED, auto_compact_progress
+    report = auto_compact_progress(project_dir)
+    if report:
+        from .project_commands import print_write_statuses
+        print_write_statuses({report["path"]: STATUS_COMPACTED})
+
+
+def _get_rule_selection(project_dir: str) -> Tuple[List[str], List[str]]:
+    """
+    Get the rule packs a project is rendered with: its detected stacks and the plugin packs recorded for it.
+    
+    Args:
+        project_dir: Project root directory
+        
+    Returns:
+        Tuple of (stacks, plugin pack names or tags)
+    """
+    from .registry import get_project
+    from .stack import detect_stacks
+    entry = get_project(project_dir)
+    return detect_stacks(project_dir), entry["packs"] if entry else []
+
+
+@traced("reset_command")
 def reset_command(
     override_global: bool = False,
-    reset_global: bool = False
+    reset_global: bool = False,
+    propagate: bool = False,
+    workers: Optional[int] = None
 ) -> None:
     """
     Reset or override project/global rules.
@@ -49,7 +114,14 @@ def reset_command(
     Args:
         override_global: Whether to override global settings for this project only
         reset_global: Whether to reset global settings
+        propagate: Whether to re-render every registered project affected by the global rules
+        workers: Maximum number of concurrent workers for propagation
     """
+    # Propagate only: resume or finish a previous propagation without touching global settings
+    if propagate and not reset_global:
+        _propagate(workers)
+        return
+    
     # If reset_global is True, update global settings
     if reset_global:
         print("\nReset global settings...")
@@ -58,57 +130,74 @@ def reset_command(
         
         # After updating global settings, also update current project rules if in a project
         cwd = os.getcwd()
-        windsurf_rules = os.path.join(cwd, '.windsurfrules')
-        cursor_rules = os.path.join(cwd, '.cursorrules')
+        editor_type = detect_editor_types(cwd)
         
-        if os.path.exists(windsurf_rules) or os.path.exists(cursor_rules):
-            editor_type = "windsurf" if os.path.exists(windsurf_rules) else "cursor"
+        if editor_type:
             print("\nUpdating current project rules to reflect new global settings...")
-            from .project_commands import create_project_rules_file
-            rules_file_path = create_project_rules_file(editor_type)
-            print(f"Project rules updated: {rules_file_path}")
+            from .project_commands import create_project_rules_files, print_write_statuses, render_project_rules
+            from .registry import record_project
+            stacks, packs = _get_rule_selection(cwd)
+            rules_content = render_project_rules(stacks=stacks, packs=packs)
+            print_write_statuses(create_project_rules_files(editor_type, cwd, rules_content))
+            record_project(cwd, editor_type, rules_content, stacks=stacks, packs=packs)
+            _compact_progress(cwd)
         
+        if propagate:
+            _propagate(workers)
         return
     
-    # Check if in a project directory
+    # Check if in a project directory, and which editors it is set up for
     cwd = os.getcwd()
-    windsurf_rules = os.path.join(cwd, '.windsurfrules')
-    cursor_rules = os.path.join(cwd, '.cursorrules')
+    editor_type = detect_editor_types(cwd)
     
-    if not os.path.exists(windsurf_rules) and not os.path.exists(cursor_rules):
-        print("Error: No .windsurfrules or .cursorrules file found in the current directory.")
+    if not editor_type:
+        print("Error: No .windsurfrules, .cursorrules or .cursor/rules found in the current directory.")
         print("Please run 'vibe start' to initialize the project.")
         sys.exit(1)
     
-    # Determine which editor type is being used
-    editor_type = "windsurf" if os.path.exists(windsurf_rules) else "cursor"
-    
     # If override_global is True, create custom global settings for this project
     if override_global:
         print("\nCreating custom global settings for this project...")
+        from .profiles import resolve_profile
         from .utils import get_user_input
         
-        # Get user preferences
+        # Get user preferences, unless the profile sets them
+        profile = resolve_profile(cwd)
         print("Please enter project-specific preferences:")
-        communication_language = get_user_input("What language would you like to use for communication in this project?", "English")
-        code_comment_language = get_user_input("What language would you like to use for code comments in this project?", "English")
-        
-        # Create or update project rules file with overridden globals
-        from .project_commands import create_project_rules_file_with_overrides
-        rules_file_path = create_project_rules_file_with_overrides(
-            editor_type, 
-            communication_language, 
-            code_comment_language
+        communication_language = profile["communication_language"] or get_user_input(
+            "What language would you like to use for communication in this project?", "English"
+        )
+        code_comment_language = profile["code_comment_language"] or get_user_input(
+            "What language would you like to use for code comments in this project?", "English"
         )
         
+        # Create or update project rules files with overridden globals
+        from .project_commands import create_project_rules_files, print_write_statuses, render_project_rules
+        stacks, packs = _get_rule_selection(cwd)
+        rules_content = render_project_rules(communication_language, code_comment_language, stacks=stacks, packs=packs)
+        statuses = create_project_rules_files(editor_type, cwd, rules_content)
+        
         print(f"Custom global settings for this project have been created.")
-        print(f"Rules file: {rules_file_path}")
+        print_write_statuses(statuses)
+        
+        from .registry import record_project
+        record_project(cwd, editor_type, rules_content, overrides={
+            "communication_language": communication_language,
+            "code_comment_language": code_comment_language
+        }, stacks=stacks, packs=packs)
+        _compact_progress(cwd)
         return
     
     # Default case: reset project rules to defaults
     print("\nResetting project rules...")
-    from .project_commands import create_project_rules_file
-    rules_file_path = create_project_rules_file(editor_type)
+    from .project_commands import create_project_rules_files, print_write_statuses, render_project_rules
+    stacks, packs = _get_rule_selection(cwd)
+    rules_content = render_project_rules(stacks=stacks, packs=packs)
+    statuses = create_project_rules_files(editor_type, cwd, rules_content)
     print(f"Project rules have been reset.")
-    print(f"Rules file: {rules_file_path}")
+    print_write_statuses(statuses)
+    
+    from .registry import record_project
+    record_project(cwd, editor_type, rules_content, stacks=stacks, packs=packs)
+    _compact_progress(cwd)
     return
\ No newline at end of file
@@ -0,0 +1,286 @@
+"""
+Token-budget compaction for vibe-coding-kit rules files.
+Estimates tokens, removes duplicated guidance, normalises whitespace and drops
+low-priority sections until a rendered rules file fits its budget.
+
+Sections are "## " headings. A section can set its priority with a marker line
+`<!-- vibe:priority=N -->` (higher is kept longer; 100 or more is never dropped).
+"""
+
+import os
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from .shards import partition_scoped_sections
+
+# Priority of sections without a marker, and of sections that are never dropped
+DEFAULT_PRIORITY = 50
+REQUIRED_PRIORITY = 100
+REQUIRED_SECTIONS = {"language rules"}
+
+# Lines shorter than this are too generic to count as duplicated guidance
+MIN_DEDUPE_WORDS = 4
+
+_PRIORITY_MARKER = re.compile(r'^\s*<!--\s*vibe:priority\s*=\s*(-?\d+)\s*-->\s*$')
+_TOKEN_PATTERN = re.compile(r'\w+|[^\w\s]')
+_LIST_PREFIX = re.compile(r'^\s*(?:[-*+]|\d+[.)])\s+')
+_ORDERED_ITEM = re.compile(r'^(\s*)\d+\. ')
+
+# Budget configuration, set from the CLI or VIBE_TOKEN_BUDGET / VIBE_STRICT_BUDGET
+_configured = False
+_budget: Optional[int] = None
+_strict = False
+
+
+class TokenBudgetError(ValueError):
+    """
+    Raised when a rendered rules file exceeds its token budget in strict mode.
+    """
+
+
+def configure(budget: Optional[int] = None, strict: Optional[bool] = None) -> None:
+    """
+    Set the token budget applied to rendered rules files.
+
+    Args:
+        budget: Maximum estimated tokens per rules file (None reads VIBE_TOKEN_BUDGET; 0 disables)
+        strict: Whether exceeding the budget is an error rather than a warning
+            (None reads VIBE_STRICT_BUDGET)
+
+    Raises:
+        TokenBudgetError: If VIBE_TOKEN_BUDGET is not a whole number
+    """
+    global _configured, _budget, _strict
+    if budget is None and os.environ.get('VIBE_TOKEN_BUDGET', '').strip():
+        value = os.environ['VIBE_TOKEN_BUDGET'].strip()
+        if not value.isdigit():
+            raise TokenBudgetError(f"VIBE_TOKEN_BUDGET must be a whole number of tokens (0 disables), got '{value}'")
+        budget = int(value)
+    if strict is None:
+        strict = os.environ.get('VIBE_STRICT_BUDGET', '') not in ('', '0')
+    _budget = budget or None
+    _strict = strict
+    _configured = True
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of model tokens in a text.
+    Words count as one token per four characters (at least one), punctuation as one token each.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Estimated token count
+    """
+    return sum((len(piece) + 3) // 4 for piece in _TOKEN_PATTERN.findall(text))
+
+
+def _line_key(line: str) -> str:
+    """
+    Normalise a guidance line for duplicate detection.
+    """
+    line = _LIST_PREFIX.sub('', line)
+    return ' '.join(line.lower().split()).rstrip('.;:')
+
+
+def _split_sections(text: str) -> List[Dict]:
+    """
+    Split Markdown into a preamble and "## " sections, reading (and removing) priority markers.
+    Headings and markers inside code blocks are left alone.
+    """
+    sections = [{"title": "", "lines": [], "priority": REQUIRED_PRIORITY}]
+    in_code = False
+    for line in text.split('\n'):
+        fence = line.lstrip().startswith('```')
+        if fence or in_code:
+            in_code = in_code != fence
+            sections[-1]["lines"].append(line)
+            continue
+        if line.startswith('## '):
+            title = line[3:].strip()
+            priority = REQUIRED_PRIORITY if title.lower() in REQUIRED_SECTIONS else DEFAULT_PRIORITY
+            sections.append({"title": title, "lines": [line], "priority": priority})
+            continue
+        marker = _PRIORITY_MARKER.match(line)
+        if marker:
+            sections[-1]["priority"] = int(marker.group(1))
+            continue
+        sections[-1]["lines"].append(line)
+    return sections
+
+
+def _dedupe(sections: List[Dict]) -> None:
+    """
+    Drop guidance lines that repeat a line from an earlier section (or earlier in the same one).
+    Headings, short lines and code blocks are never deduplicated.
+    """
+    seen = set()
+    in_code = False
+    for section in sections:
+        kept = []
+        for line in section["lines"]:
+            if line.lstrip().startswith('```'):
+                in_code = not in_code
+            key = _line_key(line)
+            if in_code or line.startswith('#') or len(key.split()) < MIN_DEDUPE_WORDS:
+                kept.append(line)
+                continue
+            if key in seen:
+                continue
+            seen.add(key)
+            kept.append(line)
+        section["lines"] = kept
+
+
+def _normalise(lines: List[str]) -> List[str]:
+    """
+    Strip trailing whitespace, collapse blank runs and renumber ordered lists; code blocks are kept as they are.
+    Items are numbered per indent: a list continues across blank lines and more deeply indented
+    child lines, and ends at the first other line indented no deeper than its items.
+    """
+    result = []
+    # Indent -> number of the last item of the list open at that indent
+    numbers: Dict[int, int] = {}
+    in_code = False
+    for line in lines:
+        fence = line.lstrip().startswith('```')
+        if fence or in_code:
+            in_code = in_code != fence
+            result.append(line)
+            continue
+        line = line.rstrip()
+        if not line:
+            if result and result[-1]:
+                result.append(line)
+            continue
+        indent = len(line) - len(line.lstrip())
+        item = _ORDERED_ITEM.match(line)
+        number = numbers.get(indent, 0) + 1 if item else 0
+        numbers = {level: value for level, value in numbers.items() if level < indent}
+        if item:
+            numbers[indent] = number
+            line = f"{item.group(1)}{number}. {line[item.end():]}"
+        result.append(line)
+    return result
+
+
+def _join(sections: List[Dict]) -> str:
+    """
+    Join sections back into a document with single blank lines between them.
+    """
+    blocks = []
+    for section in sections:
+        lines = _normalise(section["lines"])
+        while lines and not lines[-1]:
+            lines.pop()
+        if lines:
+            blocks.append('\n'.join(lines))
+    return '\n\n'.join(blocks) + '\n'
+
+
+@lru_cache(maxsize=64)
+def _compact(text: str) -> str:
+    """
+    Dedupe and normalise a rendered rules file without a budget. Cached: the result depends only
+    on the text, and the server and watcher render the same body again and again.
+    """
+    sections = _split_sections(text)
+    _dedupe(sections)
+    return _join(sections)
+
+
+def compact_rules(text: str, budget: Optional[int] = None, droppable: bool = True) -> Tuple[str, Dict]:
+    """
+    Compact a rendered rules file and fit it into a token budget.
+
+    Args:
+        text: Rendered rules content
+        budget: Maximum estimated tokens (None only dedupes and normalises)
+        droppable: Whether sections may be dropped to fit the budget
+
+    Returns:
+        Tuple of (compacted text, report with "before", "after", "budget", "dropped" and "over_budget")
+    """
+    sections = _split_sections(text)
+    _dedupe(sections)
+    compacted = _join(sections)
+
+    # Drop the lowest-priority sections first, later sections before earlier ones
+    dropped = []
+    if budget is not None and droppable:
+        candidates = sorted(
+            (index for index, section in enumerate(sections) if section["priority"] < REQUIRED_PRIORITY),
+            key=lambda index: (sections[index]["priority"], -index)
+        )
+        for index in candidates:
+            if estimate_tokens(compacted) <= budget:
+                break
+            dropped.append(sections[index]["title"])
+            sections[index]["lines"] = []
+            compacted = _join(sections)
+
+    after = estimate_tokens(compacted)
+    report = {
+        "before": estimate_tokens(text),
+        "after": after,
+        "budget": budget,
+        "dropped": dropped,
+        "over_budget": budget is not None and after > budget,
+    }
+    return compacted, report
+
+
+def apply_budget(text: str, shard: Optional[str] = None) -> str:
+    """
+    Compact rendered rules content and apply the configured token budget, reporting the result.
+    Repeated guidance, extra whitespace and priority markers are always removed; sections are
+    only dropped (and token counts reported) when a budget is configured.
+
+    Args:
+        text: Rendered rules content of one rules file
+        shard: Title of the scoped section the text holds, if it becomes a shard: its only section
+            is never dropped
+
+    Returns:
+        Compacted content
+
+    Raises:
+        TokenBudgetError: If the content is still over budget in strict mode
+    """
+    if not _configured:
+        configure()
+    if _budget is None:
+        return _compact(text)
+
+    compacted, report = compact_rules(text, _budget, droppable=shard is None)
+    label = f"'{shard}' shard" if shard else "Rules"
+    dropped = f", dropped: {', '.join(report['dropped'])}" if report["dropped"] else ""
+    print(f"{label} tokens: {report['before']} -> {report['after']} (budget {_budget}{dropped})")
+    if report["over_budget"]:
+        subject = f"The '{shard}' shard uses" if shard else "Rendered rules use"
+        message = f"{subject} {report['after']} tokens, over the budget of {_budget}."
+        if _strict:
+            raise TokenBudgetError(message)
+        print(f"Warning: {message}")
+    return compacted
+
+
+def apply_budgets(rules_content: str) -> str:
+    """
+    Compact a rendered rules body file by file: the root rules file and every scoped section,
+    which becomes a shard of its own, each fit the token budget separately.
+
+    Args:
+        rules_content: Rendered rules content
+
+    Returns:
+        Compacted content, with the scoped sections last
+
+    Raises:
+        TokenBudgetError: If a file is still over budget in strict mode
+    """
+    root_content, scoped = partition_scoped_sections(rules_content)
+    return '\n'.join([apply_budget(root_content)] + [apply_budget(text, shard=title) for title, text in scoped])
@@ -0,0 +1,339 @@
+"""
+Docs command implementation for vibe-coding-kit CLI.
+Generates the API summary in dev/code_docs.md from the project's Python sources,
+re-parsing only files whose content changed since the last run.
+"""
+
+import ast
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, Optional, Tuple
+
+from .fileio import atomic_write, write_stream_if_changed
+from .paths import get_user_cache_dir
+from .walk import walk_files
+
+DOCS_START = "<!-- vibe:docs:start -->"
+DOCS_END = "<!-- vibe:docs:end -->"
+
+# Below this many changed files, parsing inline is faster than starting a process pool
+POOL_THRESHOLD = 64
+# Signatures are rendered with the running interpreter's ast module, so every Python version has its own cache
+CACHE_VERSION = "2-py%d.%d" % sys.version_info[:2]
+
+# Operators of the expressions _format_expr() renders
+_OPERATORS = {
+    "Add": "+", "Sub": "-", "Mult": "*", "MatMult": "@", "Div": "/", "FloorDiv": "//", "Mod": "%", "Pow": "**",
+    "LShift": "<<", "RShift": ">>", "BitOr": "|", "BitAnd": "&", "BitXor": "^",
+    "UAdd": "+", "USub": "-", "Invert": "~", "Not": "not ",
+}
+
+
+def _first_line(node: ast.AST) -> str:
+    """
+    Get the first line of a node's docstring.
+    """
+    doc = ast.get_docstring(node)
+    return doc.strip().split('\n')[0].strip() if doc else ""
+
+
+def _format_expr(node: ast.AST) -> str:
+    """
+    Render an annotation, default value or base class like ast.unparse() (Python 3.9+) does.
+    Covers the expressions found in signatures; anything else is rendered as "...".
+    """
+    kind = type(node).__name__
+    if kind == 'Name':
+        return node.id
+    if kind in ('Constant', 'NameConstant'):
+        return '...' if node.value is Ellipsis else repr(node.value)
+    # Literal nodes of Python 3.6 and 3.7
+    if kind == 'Num':
+        return repr(node.n)
+    if kind in ('Str', 'Bytes'):
+        return repr(node.s)
+    if kind == 'Attribute':
+        return f"{_format_expr(node.value)}.{node.attr}"
+    if kind == 'Subscript':
+        index = node.slice.value if type(node.slice).__name__ == 'Index' else node.slice
+        if type(index).__name__ == 'Tuple' and index.elts:
+            return f"{_format_expr(node.value)}[{', '.join(_format_expr(item) for item in index.elts)}]"
+        return f"{_format_expr(node.value)}[{_format_expr(index)}]"
+    if kind == 'Tuple':
+        items = [_format_expr(item) for item in node.elts]
+        return f"({items[0]},)" if len(items) == 1 else f"({', '.join(items)})"
+    if kind == 'List':
+        return f"[{', '.join(_format_expr(item) for item in node.elts)}]"
+    if kind == 'Set':
+        return f"{{{', '.join(_format_expr(item) for item in node.elts)}}}"
+    if kind == 'Dict':
+        items = [
+            f"**{_format_expr(value)}" if key is None else f"{_format_expr(key)}: {_format_expr(value)}"
+            for key, value in zip(node.keys, node.values)
+        ]
+        return f"{{{', '.join(items)}}}"
+    if kind == 'Starred':
+        return f"*{_format_expr(node.value)}"
+    if kind == 'UnaryOp' and type(node.op).__name__ in _OPERATORS:
+        return f"{_OPERATORS[type(node.op).__name__]}{_format_expr(node.operand)}"
+    if kind == 'BinOp' and type(node.op).__name__ in _OPERATORS:
+        return f"{_format_expr(node.left)} {_OPERATORS[type(node.op).__name__]} {_format_expr(node.right)}"
+    if kind == 'Call':
+        args = [_format_expr(arg) for arg in node.args] + [
+            f"**{_format_expr(keyword.value)}" if keyword.arg is None
+            else f"{keyword.arg}={_format_expr(keyword.value)}"
+            for keyword in node.keywords
+        ]
+        return f"{_format_expr(node.func)}({', '.join(args)})"
+    return "..."
+
+
+def _format_arguments(arguments: ast.arguments) -> str:
+    """
+    Render a parameter list like ast.unparse() (Python 3.9+) does.
+    """
+    def parameter(node: ast.arg, default: Optional[ast.AST] = None) -> str:
+        text = node.arg
+        if node.annotation is not None:
+            text += f": {_format_expr(node.annotation)}"
+        if default is not None:
+            text += f"={_format_expr(default)}"
+        return text
+
+    # Positional-only parameters are new in Python 3.8
+    positional_only = getattr(arguments, 'posonlyargs', [])
+    positional = positional_only + arguments.args
+    defaults = [None] * (len(positional) - len(arguments.defaults)) + list(arguments.defaults)
+    parts = [parameter(node, default) for node, default in zip(positional, defaults)]
+    if positional_only:
+        parts.insert(len(positional_only), '/')
+    if arguments.vararg is not None:
+        parts.append(f"*{parameter(arguments.vararg)}")
+    elif arguments.kwonlyargs:
+        parts.append('*')
+    parts.extend(parameter(node, default) for node, default in zip(arguments.kwonlyargs, arguments.kw_defaults))
+    if arguments.kwarg is not None:
+        parts.append(f"**{parameter(arguments.kwarg)}")
+    return ', '.join(parts)
+
+
+def _unparse(node: ast.AST) -> str:
+    """
+    Render a signature node with ast.unparse(), or the formatters above before Python 3.9.
+    """
+    if hasattr(ast, 'unparse'):
+        return ast.unparse(node)
+    return _format_arguments(node) if isinstance(node, ast.arguments) else _format_expr(node)
+
+
+def _function_signature(node: ast.AST) -> str:
+    """
+    Render a function definition's signature.
+    """
+    prefix = "async def" if isinstance(node, ast.AsyncFunctionDef) else "def"
+    returns = f" -> {_unparse(node.returns)}" if node.returns is not None else ""
+    return f"{prefix} {node.name}({_unparse(node.args)}){returns}"
+
+
+def _class_signature(node: ast.ClassDef) -> str:
+    """
+    Render a class definition's header.
+    """
+    if node.bases:
+        return f"class {node.name}({', '.join(_unparse(base) for base in node.bases)})"
+    return f"class {node.name}"
+
+
+def _is_public(name: str) -> bool:
+    return not name.startswith('_')
+
+
+def extract_api(source: bytes) -> Dict:
+    """
+    Extract the public API of a Python module.
+
+    Args:
+        source: Module source code
+
+    Returns:
+        Dictionary with the module docstring line ("doc") and public "items",
+        each with "signature", "doc" and (for classes) "methods"
+    """
+    tree = ast.parse(source)
+    items = []
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and _is_public(node.name):
+            items.append({"signature": _function_signature(node), "doc": _first_line(node)})
+        elif isinstance(node, ast.ClassDef) and _is_public(node.name):
+            methods = [
+                {"signature": _function_signature(child), "doc": _first_line(child)}
+                for child in node.body
+                if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)) and _is_public(child.name)
+            ]
+            items.append({"signature": _class_signature(node), "doc": _first_line(node), "methods": methods})
+    return {"doc": _first_line(tree), "items": items}
+
+
+def _parse_file(job: Tuple[str, str, Optional[str]]) -> Tuple[str, str, Optional[Dict], str]:
+    """
+    Hash and, if its content changed, parse one source file. Runs in worker processes.
+
+    Args:
+        job: Tuple of (absolute path, relative path, previously cached content hash)
+
+    Returns:
+        Tuple of (relative path, content hash, API or None if unchanged, error message)
+    """
+    path, rel_path, cached_hash = job
+    try:
+        with open(path, 'rb') as f:
+            source = f.read()
+    except OSError as e:
+        return rel_path, "", None, str(e)
+    content_hash = hashlib.sha256(source).hexdigest()
+    if content_hash == cached_hash:
+        return rel_path, content_hash, None, ""
+    try:
+        return rel_path, content_hash, extract_api(source), ""
+    except (SyntaxError, ValueError) as e:
+        return rel_path, content_hash, {"doc": "", "items": []}, f"could not parse: {e}"
+
+
+def _is_test_file(rel_path: str) -> bool:
+    """
+    Check whether a path belongs to tests, which are not part of the API summary.
+    """
+    parts = rel_path.split('/')
+    return any(part in ('test', 'tests') for part in parts[:-1]) or parts[-1].startswith('test_')
+
+
+def _get_cache_path(project_dir: str) -> str:
+    key = hashlib.sha1(os.path.abspath(project_dir).encode('utf-8')).hexdigest()
+    return os.path.join(get_user_cache_dir(), 'docs', f"{key}.json")
+
+
+def _load_cache(cache_path: str) -> Dict[str, Dict]:
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache.get("files", {}) if cache.get("version") == CACHE_VERSION else {}
+
+
+def _render_docs(files: Dict[str, Dict]) -> Iterator[str]:
+    """
+    Yield the generated Markdown block, one source file at a time, in path order.
+    """
+    yield DOCS_START + "\n"
+    yield "<!-- Generated by `vibe docs`; edit outside these markers. -->\n"
+    for rel_path in sorted(files):
+        api = files[rel_path]["api"]
+        if not api["items"] and not api["doc"]:
+            continue
+        lines = ["", f"### `{rel_path}`"]
+        if api["doc"]:
+            lines.append(api["doc"])
+        lines.append("")
+        for item in api["items"]:
+            lines.append(f"- `{item['signature']}`" + (f": {item['doc']}" if item["doc"] else ""))
+            for method in item.get("methods", []):
+                lines.append(f"  - `{method['signature']}`" + (f": {method['doc']}" if method["doc"] else ""))
+        yield "\n".join(lines) + "\n"
+    yield DOCS_END + "\n"
+
+
+def _docs_chunks(docs_path: str, files: Dict[str, Dict]) -> Iterator[str]:
+    """
+    Yield the full docs file: hand-written content is kept, the generated block is replaced or appended.
+    """
+    try:
+        with open(docs_path, 'r', encoding='utf-8') as f:
+            existing = f.read()
+    except FileNotFoundError:
+        existing = "# Code Documentation\n"
+
+    start = existing.find(DOCS_START)
+    end = existing.find(DOCS_END, start)
+    if start != -1 and end != -1:
+        before, after = existing[:start], existing[end + len(DOCS_END):].lstrip('\n')
+    else:
+        before, after = existing.rstrip('\n') + "\n\n", ""
+
+    yield before
+    for chunk in _render_docs(files):
+        yield chunk
+    if after:
+        yield "\n" + after
+
+
+def docs_command(project_dir: str = None, workers: Optional[int] = None, use_cache: bool = True) -> None:
+    """
+    Regenerate the API summary in dev/code_docs.md.
+
+    Args:
+        project_dir: Project root directory (defaults to the current working directory)
+        workers: Number of parser processes (defaults to the CPU count)
+        use_cache: Whether to reuse results for unchanged files from the previous run
+    """
+    if project_dir is None:
+        project_dir = os.getcwd()
+    project_dir = os.path.abspath(project_dir)
+    cache_path = _get_cache_path(project_dir)
+    cached = _load_cache(cache_path) if use_cache else {}
+
+    files: Dict[str, Dict] = {}
+    jobs = []
+    for rel_path in walk_files(project_dir, ['.py']):
+        if _is_test_file(rel_path):
+            continue
+        path = os.path.join(project_dir, rel_path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        signature = [st.st_mtime_ns, st.st_size]
+        entry = cached.get(rel_path)
+        if entry is not None and entry["sig"] == signature:
+            files[rel_path] = entry
+            continue
+        files[rel_path] = {"sig": signature, "hash": None, "api": None}
+        jobs.append((path, rel_path, entry["hash"] if entry else None))
+
+    if len(jobs) >= POOL_THRESHOLD:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_parse_file, jobs, chunksize=64))
+    else:
+        results = [_parse_file(job) for job in jobs]
+
+    parsed = 0
+    for rel_path, content_hash, api, error in results:
+        if error and api is None:
+            print(f"Warning: {rel_path}: {error}")
+            del files[rel_path]
+            continue
+        if error:
+            print(f"Warning: {rel_path}: {error}")
+        entry = files[rel_path]
+        entry["hash"] = content_hash
+        if api is None:
+            # Touched but identical content: reuse the cached API
+            entry["api"] = cached[rel_path]["api"]
+        else:
+            entry["api"] = api
+            parsed += 1
+
+    dev_dir = os.path.join(project_dir, 'dev')
+    os.makedirs(dev_dir, exist_ok=True)
+    docs_path = os.path.join(dev_dir, 'code_docs.md')
+    status = write_stream_if_changed(docs_path, _docs_chunks(docs_path, files))
+
+    if use_cache:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        atomic_write(cache_path, json.dumps({"version": CACHE_VERSION, "files": files}))
+
+    print(f"  {status:<9} {os.path.relpath(docs_path)}")
+    print(f"Documented {len(files)} modules ({parsed} parsed, {len(files) - parsed} unchanged).")
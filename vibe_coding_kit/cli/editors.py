@@ -0,0 +1,242 @@
+"""
+Editor output targets for vibe-coding-kit CLI.
+Fans one rendered rules body out to every selected editor format and detects the formats a project already uses.
+
+Editor types are stored and passed around as comma-separated strings (e.g. "windsurf,cursor-mdc").
+"""
+
+import os
+import re
+from functools import lru_cache
+from typing import Dict, List, Set, Tuple
+
+from .shards import format_mdc_shard, format_windsurf_shard, split_scoped_rules, split_sections
+
+# Supported targets, in the order they are offered and detected
+EDITOR_TYPES = ("windsurf", "cursor", "cursor-mdc")
+
+EDITOR_LABELS = {
+    "windsurf": "Windsurf (.windsurfrules)",
+    "cursor": "Cursor (.cursorrules)",
+    "cursor-mdc": "Cursor project rules (.cursor/rules/*.mdc)",
+}
+
+# Batch mode value that uses the editors each project already has
+AUTO_EDITOR = "auto"
+
+MDC_DIR = os.path.join(".cursor", "rules")
+WINDSURF_RULES_DIR = os.path.join(".windsurf", "rules")
+# Generated rule files carry this prefix, so stale ones can be removed without touching hand-written rules
+MDC_PREFIX = "vibe-"
+# Prefix of generated scoped shards, which do not mean a project uses .cursor/rules on its own
+SHARD_PREFIX = "vibe-scoped-"
+
+STATUS_REMOVED = "removed"
+
+
+def parse_editor_types(value: str) -> str:
+    """
+    Validate and normalise a comma-separated list of editor types.
+
+    Args:
+        value: Editor types, e.g. "windsurf,cursor"
+
+    Returns:
+        Normalised comma-separated editor types, without duplicates, in the given order
+
+    Raises:
+        ValueError: If the list is empty or contains an unknown editor type
+    """
+    editor_types = []
+    for name in value.split(','):
+        name = name.strip().lower()
+        if not name or name in editor_types:
+            continue
+        if name not in EDITOR_TYPES:
+            raise ValueError(f"unknown editor type '{name}' (choose from {', '.join(EDITOR_TYPES)})")
+        editor_types.append(name)
+    if not editor_types:
+        raise ValueError("no editor type given")
+    return ','.join(editor_types)
+
+
+def describe_editor_types(editor_type: str) -> str:
+    """
+    Get a human-readable description of editor types.
+
+    Args:
+        editor_type: Comma-separated editor types
+
+    Returns:
+        Labels of the editor types, joined with commas
+    """
+    return ', '.join(EDITOR_LABELS.get(name, name) for name in editor_type.split(','))
+
+
+def detect_editor_types(project_dir: str) -> str:
+    """
+    Detect the editor formats a project already uses from the rules files and directories it contains.
+
+    Args:
+        project_dir: Project root directory
+
+    Returns:
+        Comma-separated editor types, or an empty string if none were found
+    """
+    detected = []
+    if os.path.exists(os.path.join(project_dir, ".windsurfrules")) or \
+            os.path.isdir(os.path.join(project_dir, ".windsurf")):
+        detected.append("windsurf")
+    if os.path.exists(os.path.join(project_dir, ".cursorrules")):
+        detected.append("cursor")
+    # .cursor/rules counts unless it only holds shards written for .cursorrules projects;
+    # a bare .cursor directory means a recent Cursor, which reads .cursor/rules
+    try:
+        mdc_names = os.listdir(os.path.join(project_dir, MDC_DIR))
+    except OSError:
+        mdc_names = None
+    if mdc_names is not None:
+        if "cursor" not in detected or any(not name.startswith(SHARD_PREFIX) for name in mdc_names):
+            detected.append("cursor-mdc")
+    elif not detected and os.path.isdir(os.path.join(project_dir, ".cursor")):
+        detected.append("cursor-mdc")
+    return ','.join(detected)
+
+
+def get_primary_path(project_dir: str, editor_type: str, rules_content: str) -> str:
+    """
+    Get the path recorded for a project's rules: the first output file of its first editor type
+    (for cursor-mdc, the first generated .mdc rule rather than the .cursor/rules directory).
+
+    Args:
+        project_dir: Project root directory
+        editor_type: Comma-separated editor types
+        rules_content: Rendered rules content
+
+    Returns:
+        Path of the first editor type's first output file
+    """
+    outputs = render_outputs(editor_type, rules_content)
+    return os.path.join(project_dir, outputs[0][0] if outputs else MDC_DIR)
+
+
+def _slug(title: str) -> str:
+    return re.sub(r'[^a-z0-9]+', '-', title.lower()).strip('-') or "rules"
+
+
+def split_mdc_rules(rules_content: str) -> List[Tuple[str, str]]:
+    """
+    Split a rendered rules body into one Cursor rule per "## " section.
+    Text before the first section (the document title) is dropped unless it holds more than a heading.
+
+    Args:
+        rules_content: Rendered rules content
+
+    Returns:
+        List of (file name, .mdc content) pairs
+    """
+    sections = split_sections(rules_content)
+    rules = []
+    used = set()
+    for index, lines in enumerate(sections):
+        body = '\n'.join(lines).strip('\n')
+        if index == 0:
+            if not [line for line in lines if line.strip() and not line.startswith('# ')]:
+                continue
+            title = "General"
+        else:
+            title = lines[0][3:].strip()
+        name = slug = _slug(title)
+        number = 2
+        while name in used:
+            name = f"{slug}-{number}"
+            number += 1
+        used.add(name)
+        front_matter = f"---\ndescription: {title}\nglobs:\nalwaysApply: true\n---\n"
+        rules.append((f"{MDC_PREFIX}{name}.mdc", front_matter + body + "\n"))
+    return rules
+
+
+def _shard_file_name(title: str, used: Set[str]) -> str:
+    """
+    Pick a unique generated file name stem for a scoped shard.
+    """
+    name = slug = f"{SHARD_PREFIX}{_slug(title)}"
+    number = 2
+    while name in used:
+        name = f"{slug}-{number}"
+        number += 1
+    used.add(name)
+    return name
+
+
+@lru_cache(maxsize=16)
+def render_outputs(editor_type: str, rules_content: str) -> Tuple[Tuple[str, str], ...]:
+    """
+    Build every output file for a set of editor types from one rendered body.
+    Scoped sections become shards: .windsurf/rules/*.md for Windsurf and .cursor/rules/*.mdc for
+    Cursor (a .cursorrules file cannot be scoped, so Cursor shards always go to .cursor/rules).
+    The result depends only on its arguments and is cached, so a batch converts the body once.
+
+    Args:
+        editor_type: Comma-separated editor types
+        rules_content: Rendered rules content
+
+    Returns:
+        Tuple of (path relative to the project root, content) pairs
+    """
+    root_content, shards = split_scoped_rules(rules_content)
+    used: Set[str] = set()
+    shard_names = [_shard_file_name(shard["title"], used) for shard in shards]
+
+    outputs: Dict[str, str] = {}
+    for name in editor_type.split(','):
+        if name == "windsurf":
+            outputs[".windsurfrules"] = root_content
+            for shard, stem in zip(shards, shard_names):
+                outputs[os.path.join(WINDSURF_RULES_DIR, f"{stem}.md")] = format_windsurf_shard(shard)
+            continue
+        if name == "cursor":
+            outputs[".cursorrules"] = root_content
+        elif name == "cursor-mdc":
+            for file_name, content in split_mdc_rules(root_content):
+                outputs[os.path.join(MDC_DIR, file_name)] = content
+        for shard, stem in zip(shards, shard_names):
+            outputs[os.path.join(MDC_DIR, f"{stem}.mdc")] = format_mdc_shard(shard)
+    return tuple(outputs.items())
+
+
+def find_stale_outputs(project_dir: str, editor_type: str, outputs: Tuple[Tuple[str, str], ...]) -> List[str]:
+    """
+    Find generated rule files that are no longer part of the outputs (e.g. a removed section or scope).
+    Only vibe-* files in the rules directories of the selected editors are considered.
+
+    Args:
+        project_dir: Project root directory
+        editor_type: Comma-separated editor types
+        outputs: Outputs from render_outputs()
+
+    Returns:
+        Absolute paths of stale generated files
+    """
+    names = editor_type.split(',')
+    generated_dirs = []
+    if "windsurf" in names:
+        generated_dirs.append((WINDSURF_RULES_DIR, '.md'))
+    if "cursor" in names or "cursor-mdc" in names:
+        generated_dirs.append((MDC_DIR, '.mdc'))
+
+    current = {rel_path for rel_path, _ in outputs}
+    stale = []
+    for rules_dir, suffix in generated_dirs:
+        try:
+            file_names = sorted(os.listdir(os.path.join(project_dir, rules_dir)))
+        except OSError:
+            continue
+        stale.extend(
+            os.path.join(project_dir, rules_dir, file_name)
+            for file_name in file_names
+            if file_name.startswith(MDC_PREFIX) and file_name.endswith(suffix)
+            and os.path.join(rules_dir, file_name) not in current
+        )
+    return stale
@@ -0,0 +1,207 @@
+"""
+File writing helpers for vibe-coding-kit CLI.
+Provides atomic, content-aware writes that leave unchanged files untouched. Writers serialize on an
+advisory lock; readers never lock, since every write is published by renaming a complete file into place.
+"""
+
+import hashlib
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import Iterable, Iterator, Optional, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows: writes are still atomic, only the locking is skipped
+    fcntl = None
+
+STATUS_CREATED = "created"
+STATUS_UPDATED = "updated"
+STATUS_UNCHANGED = "unchanged"
+
+
+def _get_umask() -> int:
+    """
+    Read the process umask (set and immediately restored).
+
+    Returns:
+        Current umask
+    """
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+# Read once at import time: changing the umask later from worker threads would race
+_UMASK = _get_umask()
+
+
+def content_digest(data: bytes) -> str:
+    """
+    Compute the digest used to compare file contents.
+
+    Args:
+        data: File content
+
+    Returns:
+        SHA-256 hex digest
+    """
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_digest(path: str) -> Optional[str]:
+    """
+    Compute the digest of an existing file.
+
+    Args:
+        path: File path
+
+    Returns:
+        SHA-256 hex digest, or None if the file does not exist or is a directory (e.g. .cursor/rules)
+    """
+    try:
+        with open(path, 'rb') as f:
+            return content_digest(f.read())
+    except (FileNotFoundError, IsADirectoryError):
+        return None
+
+
+@contextmanager
+def locked(path: str) -> Iterator[None]:
+    """
+    Hold an exclusive advisory lock (fcntl.flock) for updating a file, across processes and threads.
+    The lock is taken on the file's directory, so no lock files are left next to the user's files.
+    Not reentrant: do not nest two locks on the same directory.
+
+    Args:
+        path: File about to be updated (its directory must exist)
+    """
+    if fcntl is None:
+        yield
+        return
+    fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        # Closing the descriptor releases the lock
+        os.close(fd)
+
+
+def atomic_write(path: str, content: Union[str, bytes]) -> None:
+    """
+    Write a file atomically: write a temp file in the same directory, then rename it into place.
+    Readers see either the old or the new content, never a partial file.
+
+    Args:
+        path: Destination file path
+        content: Text content (written as UTF-8) or raw bytes
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    try:
+        mode = os.stat(path).st_mode & 0o777
+    except FileNotFoundError:
+        mode = 0o666 & ~_UMASK
+
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content.encode('utf-8') if isinstance(content, str) else content)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def write_if_changed(path: str, content: str) -> str:
+    """
+    Write a text file only if its content differs from what is on disk.
+    Unchanged files keep their mtime, so editors do not re-index them. The comparison and the
+    write happen under the file's lock, so concurrent writers get consistent statuses.
+
+    Args:
+        path: Destination file path
+        content: Text content (written as UTF-8)
+
+    Returns:
+        STATUS_CREATED, STATUS_UPDATED or STATUS_UNCHANGED
+    """
+    data = content.encode('utf-8')
+    with locked(path):
+        try:
+            size = os.stat(path).st_size
+        except FileNotFoundError:
+            atomic_write(path, data)
+            return STATUS_CREATED
+
+        # A size mismatch already proves the content changed, no need to read the file
+        if size == len(data) and file_digest(path) == content_digest(data):
+            return STATUS_UNCHANGED
+
+        atomic_write(path, data)
+        return STATUS_UPDATED
+
+
+def write_if_missing(path: str, content: str) -> str:
+    """
+    Create a text file atomically unless it already exists. Existing content is never modified.
+
+    Args:
+        path: Destination file path
+        content: Initial text content
+
+    Returns:
+        STATUS_CREATED or STATUS_UNCHANGED
+    """
+    with locked(path):
+        if os.path.exists(path):
+            return STATUS_UNCHANGED
+        atomic_write(path, content)
+        return STATUS_CREATED
+
+
+def write_stream_if_changed(path: str, chunks: Iterable[str]) -> str:
+    """
+    Stream text chunks into a temp file, then rename it into place only if the content changed.
+    Large generated files never have to be held in memory as one string.
+
+    Args:
+        path: Destination file path
+        chunks: Text chunks (written as UTF-8)
+
+    Returns:
+        STATUS_CREATED, STATUS_UPDATED or STATUS_UNCHANGED
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    digest = hashlib.sha256()
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            for chunk in chunks:
+                data = chunk.encode('utf-8')
+                digest.update(data)
+                f.write(data)
+        # Only the comparison and the rename need the lock, not the slow streaming above
+        with locked(path):
+            try:
+                mode = os.stat(path).st_mode & 0o777
+                existed = True
+            except FileNotFoundError:
+                mode = 0o666 & ~_UMASK
+                existed = False
+            if existed and file_digest(path) == digest.hexdigest():
+                os.remove(tmp_path)
+                return STATUS_UNCHANGED
+            os.chmod(tmp_path, mode)
+            os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    return STATUS_UPDATED if existed else STATUS_CREATED
@@ -4,29 +4,43 @@ Handles global settings like language preferences.
 """
 
 import os
-import json
-import re
 import sys
-from pathlib import Path
 from typing import Dict
 
+from .editors import AUTO_EDITOR, describe_editor_types
+from .fileio import atomic_write, locked
+from .paths import get_global_rules_path
+from .profiles import resolve_profile
+from .tracing import span, traced
 from .utils import get_user_input, get_editor_type
 
 
-def get_templates_dir() -> str:
+def save_global_rules(communication_language: str, code_comment_language: str) -> str:
     """
-    Get the path to the templates directory.
-    
+    Publish the global rules file. The new content is renamed into place under the file's lock,
+    so concurrent runs never leave a torn file and readers need no lock.
+
+    Args:
+        communication_language: Communication language preference
+        code_comment_language: Code comment language preference
+
     Returns:
-        Path to the templates directory
+        Path to the global rules file
     """
-    package_dir = os.path.dirname(os.path.abspath(__file__))
-    templates_dir = os.path.normpath(
-        os.path.join(package_dir, '..', '..', 'templates')
-    )
-    return templates_dir
+    # Create global rules content in Markdown format
+    global_rules_content = "## Language Rules\n"
+    global_rules_content += f'communication_language: {communication_language}\n'
+    global_rules_content += f'code_comment_language: {code_comment_language}\n'
+
+    global_rules_path = get_global_rules_path()
+    # Create templates directory if it doesn't exist
+    os.makedirs(os.path.dirname(global_rules_path), exist_ok=True)
+    with locked(global_rules_path):
+        atomic_write(global_rules_path, global_rules_content)
+    return global_rules_path
 
 
+@traced("global_start_command")
 def global_start_command(
     communication_language: str = None,
     code_comment_language: str = None
@@ -34,42 +48,34 @@ def global_start_command(
     """
     Initialize global settings for vibe-coding-kit.
     Save language preferences and other global settings to a Markdown file.
+    Settings not given are taken from the profile, and prompted for only if it does not set them.
     
     Args:
         communication_language: Communication language preference
         code_comment_language: Code comment language preference
     """
     print("\nInitializing vibe-coding-kit global settings...")
+    profile = resolve_profile()
     
     # Get editor type
-    editor_type = get_editor_type()
+    editor_type = profile["editor"] if profile["editor"] not in (None, AUTO_EDITOR) else get_editor_type()
     
     # Get language preferences
+    communication_language = communication_language or profile["communication_language"]
+    code_comment_language = code_comment_language or profile["code_comment_language"]
     if communication_language is None:
         communication_language = get_user_input("What is your preferred communication language?", "English")
     
     if code_comment_language is None:
         code_comment_language = get_user_input("What is your preferred code comment language?", "English")
     
-    # Create global rules content in Markdown format
-    global_rules_content = "## Language Rules\n"
-    global_rules_content += f'communication_language: {communication_language}\n'
-    global_rules_content += f'code_comment_language: {code_comment_language}\n'
-    
     # Save to global rules markdown file
-    templates_dir = get_templates_dir()
-    global_rules_path = os.path.join(templates_dir, 'global_rules_template.md')
-    
-    # Create templates directory if it doesn't exist
-    os.makedirs(templates_dir, exist_ok=True)
-    
-    # Write global rules to file
-    with open(global_rules_path, 'w', encoding='utf-8') as f:
-        f.write(global_rules_content)
+    with span("write_global_rules"):
+        global_rules_path = save_global_rules(communication_language, code_comment_language)
     
     print("\nGlobal settings initialized successfully.")
     print(f"Global rules file saved at: {global_rules_path}")
-    print(f"Editor type: {editor_type.capitalize()}")
+    print(f"Editor type: {describe_editor_types(editor_type)}")
     print(f"Communication language set to: {communication_language}")
     print(f"Code comment language set to: {code_comment_language}")
     print("\nNow you can use 'vibe start' to initialize projects, and global settings will be automatically applied to each project.")
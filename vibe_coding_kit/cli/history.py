@@ -0,0 +1,373 @@
+"""
+Rules history store for vibe-coding-kit CLI.
+Records every render of a project's rules files as a revision in a content-addressed store under the
+user data dir. Files are split into chunks at section boundaries and each distinct chunk is stored once,
+compressed, so the sections every project shares with the templates cost nothing per project or revision.
+
+Layout of the store:
+    chunks/ab/cdef...       zlib-compressed chunk, named by the SHA-256 of its content
+    trees/ab/cdef...        JSON {relative path: {"digest", "size", "chunks"}} of a project's rules files
+    projects/<key>.jsonl    one line per revision: {"rev", "time", "note", "tree"} (the first also has "path")
+"""
+
+import hashlib
+import json
+import os
+import time
+import zlib
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .fileio import atomic_write, content_digest, locked
+from .paths import get_user_data_dir
+
+# Sections larger than this are split further at line boundaries
+MAX_CHUNK = 8 * 1024
+
+
+def history_enabled() -> bool:
+    """
+    Check whether renders are recorded (disable with VIBE_HISTORY=0).
+
+    Returns:
+        True unless VIBE_HISTORY is set to "" or "0"
+    """
+    return os.environ.get('VIBE_HISTORY', '1') not in ('', '0')
+
+
+def get_history_dir() -> str:
+    """
+    Get the root directory of the history store.
+
+    Returns:
+        Path to history/ under the user data dir
+    """
+    return os.path.join(get_user_data_dir(), 'history')
+
+
+def split_chunks(content: str) -> List[bytes]:
+    """
+    Split a rules file into chunks at its "#" headings, so a section shared by many projects
+    becomes the same chunk wherever it appears. Joined together the chunks give back the content.
+
+    Args:
+        content: Rules file content
+
+    Returns:
+        UTF-8 encoded chunks
+    """
+    chunks: List[bytes] = []
+    current: List[bytes] = []
+    size = 0
+    for line in content.encode('utf-8').splitlines(keepends=True):
+        if current and (line.startswith(b'#') or size + len(line) > MAX_CHUNK):
+            chunks.append(b''.join(current))
+            current, size = [], 0
+        current.append(line)
+        size += len(line)
+    if current:
+        chunks.append(b''.join(current))
+    return chunks
+
+
+def _object_path(kind: str, digest: str, history_dir: Optional[str] = None) -> str:
+    """
+    Get the path of a stored object (chunk, file recipe or tree).
+    """
+    return os.path.join(history_dir or get_history_dir(), kind, digest[:2], digest[2:])
+
+
+def _store_object(path: str, data: bytes) -> None:
+    """
+    Publish an immutable object (callers skip objects already in the store).
+    """
+    try:
+        atomic_write(path, data)
+    except FileNotFoundError:
+        # First object under this prefix
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        atomic_write(path, data)
+
+
+def store_file(content: str, history_dir: Optional[str] = None) -> Dict:
+    """
+    Store the chunks of a file. Chunks already in the store are not written again.
+
+    Args:
+        content: File content
+        history_dir: Store root (defaults to get_history_dir())
+
+    Returns:
+        Entry for a tree: {"digest": SHA-256 of the file, "size": bytes, "chunks": chunk digests}
+    """
+    history_dir = history_dir or get_history_dir()
+    data = content.encode('utf-8')
+    chunk_digests = []
+    for chunk in split_chunks(content):
+        chunk_digest = content_digest(chunk)
+        chunk_path = _object_path('chunks', chunk_digest, history_dir)
+        # Checked before compressing: most chunks of a new file are shared with files already stored
+        if not os.path.exists(chunk_path):
+            _store_object(chunk_path, zlib.compress(chunk))
+        chunk_digests.append(chunk_digest)
+    return {"digest": content_digest(data), "size": len(data), "chunks": chunk_digests}
+
+
+def load_file(entry: Dict) -> str:
+    """
+    Reassemble a stored file and verify its digest.
+
+    Args:
+        entry: File entry of a tree, from store_file()
+
+    Returns:
+        File content
+
+    Raises:
+        ValueError: If one of its chunks is missing or corrupt
+    """
+    history_dir = get_history_dir()
+    try:
+        parts = []
+        for chunk_digest in entry["chunks"]:
+            with open(_object_path('chunks', chunk_digest, history_dir), 'rb') as f:
+                parts.append(zlib.decompress(f.read()))
+    except (OSError, zlib.error) as e:
+        raise ValueError(f"stored file {entry['digest'][:12]} is unreadable: {e}")
+    data = b''.join(parts)
+    if content_digest(data) != entry["digest"]:
+        raise ValueError(f"stored file {entry['digest'][:12]} does not match its digest")
+    return data.decode('utf-8')
+
+
+def _store_tree(outputs: Iterable[Tuple[str, str]]) -> str:
+    """
+    Store the files of a revision; projects and revisions with the same rules files share one tree.
+    Chunks are written before the tree: a tree in the store means all its chunks are there.
+    """
+    history_dir = get_history_dir()
+    files = {rel_path: store_file(content, history_dir) for rel_path, content in outputs}
+    data = json.dumps(files, sort_keys=True).encode('utf-8')
+    digest = content_digest(data)
+    tree_path = _object_path('trees', digest, history_dir)
+    if not os.path.exists(tree_path):
+        _store_object(tree_path, data)
+    return digest
+
+
+def load_tree(digest: str) -> Dict[str, Dict]:
+    """
+    Read the files of a revision.
+
+    Args:
+        digest: Tree digest of a revision
+
+    Returns:
+        Mapping of relative path to file entry ({"digest", "size", "chunks"})
+    """
+    with open(_object_path('trees', digest), 'rb') as f:
+        return json.loads(f.read().decode('utf-8'))
+
+
+def _log_path(project_dir: str) -> str:
+    """
+    Get the revision log of a project.
+    """
+    key = hashlib.sha1(os.path.abspath(project_dir).encode('utf-8')).hexdigest()
+    return os.path.join(get_history_dir(), 'projects', f"{key}.jsonl")
+
+
+def _parse_lines(lines: Iterable[bytes]) -> List[Dict]:
+    """
+    Parse complete log lines. Lines are appended with a single write, so a lock-free reader can only
+    see the last line incomplete; a line cut short by a crash is skipped too.
+    """
+    records = []
+    for line in lines:
+        if line.endswith(b'\n'):
+            try:
+                records.append(json.loads(line.decode('utf-8')))
+            except ValueError:
+                continue
+    return records
+
+
+def _read_log(log_path: str) -> List[Dict]:
+    try:
+        with open(log_path, 'rb') as f:
+            return _parse_lines(f)
+    except FileNotFoundError:
+        return []
+
+
+def _last_record(log_path: str) -> Optional[Dict]:
+    """
+    Read the latest revision from the end of the log, without reading the whole log.
+    """
+    try:
+        with open(log_path, 'rb') as f:
+            size = f.seek(0, os.SEEK_END)
+            offset = size
+            while offset > 0:
+                offset = max(0, offset - 4096)
+                f.seek(offset)
+                lines = f.read(size - offset).splitlines(keepends=True)
+                # The first line of a tail read from the middle of the file may be cut
+                for line in reversed(lines if offset == 0 else lines[1:]):
+                    records = _parse_lines([line])
+                    if records:
+                        return records[0]
+    except FileNotFoundError:
+        pass
+    return None
+
+
+def list_revisions(project_dir: str) -> List[Dict]:
+    """
+    List the recorded revisions of a project.
+
+    Args:
+        project_dir: Project root directory
+
+    Returns:
+        Revisions with "rev", "time", "note", "tree" (digest, see load_tree()) and "files"
+        (relative path -> file digest), oldest first
+    """
+    trees: Dict[str, Dict[str, str]] = {}
+    revisions = []
+    for record in _read_log(_log_path(project_dir)):
+        if record["tree"] not in trees:
+            trees[record["tree"]] = {
+                rel_path: entry["digest"] for rel_path, entry in load_tree(record["tree"]).items()
+            }
+        revisions.append({
+            "rev": record["rev"],
+            "time": record["time"],
+            "note": record.get("note", ""),
+            "tree": record["tree"],
+            "files": trees[record["tree"]],
+        })
+    return revisions
+
+
+def get_revision(project_dir: str, rev: int) -> Optional[Dict]:
+    """
+    Look up one revision of a project.
+
+    Args:
+        project_dir: Project root directory
+        rev: Revision number
+
+    Returns:
+        Revision, or None if the project has no such revision
+    """
+    return next((revision for revision in list_revisions(project_dir) if revision["rev"] == rev), None)
+
+
+def get_latest_files(project_dir: str) -> Optional[Dict[str, str]]:
+    """
+    Get the files of a project's latest revision, reading only the end of its log.
+
+    Args:
+        project_dir: Project root directory
+
+    Returns:
+        Mapping of relative path to file digest, or None if the project has no revisions
+    """
+    last = _last_record(_log_path(project_dir))
+    if last is None:
+        return None
+    return {rel_path: entry["digest"] for rel_path, entry in load_tree(last["tree"]).items()}
+
+
+def record_revision(project_dir: str, outputs: Iterable[Tuple[str, str]], note: str = "") -> Optional[int]:
+    """
+    Record the rules files a project now has. Nothing is recorded if they match the latest revision.
+
+    Args:
+        project_dir: Project root directory
+        outputs: (path relative to the project root, content) pairs of every rules file written
+        note: Short description, e.g. "rollback to 3"
+
+    Returns:
+        New revision number, or None if nothing changed
+    """
+    tree = _store_tree(outputs)
+    log_path = _log_path(project_dir)
+    os.makedirs(os.path.dirname(log_path), exist_ok=True)
+    # Numbering reads the latest revision and appends the next one: concurrent renders must not collide
+    with locked(log_path):
+        last = _last_record(log_path)
+        if last is not None and last["tree"] == tree:
+            return None
+        record = {"rev": last["rev"] + 1 if last else 1, "time": time.time(), "note": note, "tree": tree}
+        if last is None:
+            record["path"] = os.path.abspath(project_dir)
+        line = (json.dumps(record, sort_keys=True) + '\n').encode('utf-8')
+        fd = os.open(log_path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o666)
+        try:
+            # Terminate a line a crashed writer left incomplete, so it cannot swallow this one
+            size = os.fstat(fd).st_size
+            if size and os.pread(fd, 1, size - 1) != b'\n':
+                line = b'\n' + line
+            os.write(fd, line)
+        finally:
+            os.close(fd)
+    return record["rev"]
+
+
+def record_render(project_dir: str, outputs: Iterable[Tuple[str, str]]) -> None:
+    """
+    Record a render of a project's rules files. History errors are reported but never fatal.
+
+    Args:
+        project_dir: Project root directory
+        outputs: (path relative to the project root, content) pairs of every rules file written
+    """
+    try:
+        record_revision(project_dir, outputs)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Warning: Could not record rules history: {e}")
+
+
+def _directory_usage(directory: str) -> Tuple[int, int]:
+    """
+    Count the files under a directory and their total size.
+    """
+    count = size = 0
+    for root, _, names in os.walk(directory):
+        for name in names:
+            count += 1
+            size += os.path.getsize(os.path.join(root, name))
+    return count, size
+
+
+def store_stats() -> Dict:
+    """
+    Measure the store: what it holds on disk against the rules content its revisions describe.
+
+    Returns:
+        Dictionary with "projects", "revisions", "chunks", "chunk_bytes" (compressed, on disk), "trees",
+        "stored_bytes" (everything in the store) and "content_bytes" (size of every file of every revision)
+    """
+    history_dir = get_history_dir()
+    chunks, chunk_bytes = _directory_usage(os.path.join(history_dir, 'chunks'))
+    trees, tree_bytes = _directory_usage(os.path.join(history_dir, 'trees'))
+    projects, log_bytes = _directory_usage(os.path.join(history_dir, 'projects'))
+    tree_sizes: Dict[str, int] = {}
+    revisions = content_bytes = 0
+    projects_dir = os.path.join(history_dir, 'projects')
+    for name in (os.listdir(projects_dir) if os.path.isdir(projects_dir) else []):
+        for record in _read_log(os.path.join(projects_dir, name)):
+            revisions += 1
+            if record["tree"] not in tree_sizes:
+                tree_sizes[record["tree"]] = sum(entry["size"] for entry in load_tree(record["tree"]).values())
+            content_bytes += tree_sizes[record["tree"]]
+    return {
+        "projects": projects,
+        "revisions": revisions,
+        "chunks": chunks,
+        "chunk_bytes": chunk_bytes,
+        "trees": trees,
+        "stored_bytes": chunk_bytes + tree_bytes + log_bytes,
+        "content_bytes": content_bytes,
+    }
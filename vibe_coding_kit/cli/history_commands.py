@@ -0,0 +1,152 @@
+"""
+History and rollback command implementations for vibe-coding-kit CLI.
+Lists the recorded revisions of a project's rules files and restores an earlier one.
+"""
+
+import json
+import os
+import sys
+import time
+from typing import Dict, List, Optional
+
+from .history import get_revision, list_revisions, load_file, load_tree, record_revision, store_stats
+
+
+def describe_changes(previous: Optional[Dict], revision: Dict) -> str:
+    """
+    Summarize which files a revision added (+), changed (~) or removed (-).
+
+    Args:
+        previous: The revision before, or None for the first one
+        revision: Revision to describe
+
+    Returns:
+        Space-separated changes, e.g. "~.windsurfrules +.cursorrules"
+    """
+    before = previous["files"] if previous else {}
+    after = revision["files"]
+    changes = []
+    for rel_path in sorted(set(before) | set(after)):
+        if rel_path not in before:
+            changes.append(f"+{rel_path}")
+        elif rel_path not in after:
+            changes.append(f"-{rel_path}")
+        elif before[rel_path] != after[rel_path]:
+            changes.append(f"~{rel_path}")
+    return ' '.join(changes)
+
+
+def _format_size(size: int) -> str:
+    return f"{size / 1024:.1f} KB" if size < 1024 * 1024 else f"{size / (1024 * 1024):.1f} MB"
+
+
+def print_stats() -> None:
+    """
+    Print how much the store holds against the rules content it describes.
+    """
+    stats = store_stats()
+    stored = stats["stored_bytes"]
+    print(f"\nRules history: {stats['revisions']} revisions of {stats['projects']} projects")
+    print(f"  content described: {_format_size(stats['content_bytes'])}")
+    print(f"  stored:            {_format_size(stored)} ({stats['chunks']} chunks, {stats['trees']} distinct trees)")
+    if stored:
+        print(f"  ratio:             {stats['content_bytes'] / stored:.1f}x")
+
+
+def history_command(project_dir: str = '.', as_json: bool = False, show_stats: bool = False) -> None:
+    """
+    List the revisions recorded for a project's rules files, newest first.
+
+    Args:
+        project_dir: Project root directory
+        as_json: Whether to print the revisions as JSON
+        show_stats: Whether to print store-wide statistics instead
+    """
+    if show_stats:
+        if as_json:
+            print(json.dumps(store_stats(), indent=2))
+        else:
+            print_stats()
+        return
+
+    project_dir = os.path.abspath(os.path.expanduser(project_dir))
+    revisions = list_revisions(project_dir)
+    rows: List[Dict] = []
+    previous = None
+    for revision in revisions:
+        rows.append(dict(revision, changes=describe_changes(previous, revision)))
+        previous = revision
+    rows.reverse()
+
+    if as_json:
+        print(json.dumps({"path": project_dir, "revisions": rows}, indent=2))
+        return
+    if not rows:
+        print(f"\nNo rules history for {project_dir}.")
+        return
+
+    print(f"\nRules history of {project_dir} ({len(rows)} revisions):")
+    for row in rows:
+        stamp = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(row["time"]))
+        note = f" ({row['note']})" if row["note"] else ""
+        changes = row["changes"].split()
+        summary = ' '.join(changes[:3]) + (f" and {len(changes) - 3} more" if len(changes) > 3 else "")
+        print(f"  {row['rev']:>5}  {stamp}  {summary or 'no changes'}{note}")
+    print(f"\nRestore one with: vibe rollback {project_dir} REV")
+
+
+def rollback_command(project_dir: str, rev: int, dry_run: bool = False) -> None:
+    """
+    Restore the rules files a project had at a recorded revision, and record the result as a new revision.
+    Files of the current revision that the old one did not have are removed.
+
+    Args:
+        project_dir: Project root directory
+        rev: Revision number to restore
+        dry_run: Whether to only print what would change
+    """
+    from .editors import STATUS_REMOVED
+    from .fileio import write_if_changed
+    from .project_commands import print_write_statuses
+
+    project_dir = os.path.abspath(os.path.expanduser(project_dir))
+    if not os.path.isdir(project_dir):
+        print(f"Error: {project_dir} is not a directory.")
+        sys.exit(1)
+    target = get_revision(project_dir, rev)
+    if target is None:
+        print(f"Error: {project_dir} has no rules revision {rev} (see 'vibe history {project_dir}').")
+        sys.exit(1)
+
+    # Reassemble every file first, so a damaged store never leaves a half-restored project
+    try:
+        outputs = [(rel_path, load_file(entry)) for rel_path, entry in sorted(load_tree(target["tree"]).items())]
+    except (OSError, ValueError) as e:
+        print(f"Error: Cannot restore revision {rev}: {e}")
+        sys.exit(1)
+    revisions = list_revisions(project_dir)
+    latest = revisions[-1]["files"] if revisions else {}
+    removed = sorted(set(latest) - set(target["files"]))
+
+    if dry_run:
+        print(f"\nRolling back {project_dir} to revision {rev} would change: "
+              f"{describe_changes(revisions[-1] if revisions else None, target) or 'nothing'}")
+        return
+
+    statuses = {}
+    for rel_path, content in outputs:
+        file_path = os.path.join(project_dir, rel_path)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        statuses[file_path] = write_if_changed(file_path, content)
+    for rel_path in removed:
+        file_path = os.path.join(project_dir, rel_path)
+        if os.path.exists(file_path):
+            os.remove(file_path)
+            statuses[file_path] = STATUS_REMOVED
+
+    new_rev = record_revision(project_dir, outputs, note=f"rollback to {rev}")
+    print(f"\nRolled back {project_dir} to revision {rev}:")
+    print_write_statuses(statuses)
+    if new_rev is not None:
+        print(f"Recorded as revision {new_rev}.")
+    print("The next re-render after a template change (vibe reset --propagate, vibe watch) replaces these files again.")
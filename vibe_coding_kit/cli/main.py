@@ -5,11 +5,12 @@ Provides command line interface for interacting with vibe-coding-kit.
 
 import os
 import sys
-import argparse
-from pathlib import Path
-from typing import List
 
-from .commands import start_command, reset_command
+from . import tracing
+from .parser import create_parser
+
+# Command modules are imported lazily in main() so that --help and
+# other no-op invocations stay fast.
 
 
 def print_welcome_badge() -> None:
@@ -55,53 +56,6 @@ def print_welcome_badge() -> None:
     print(badge)
 
 
-def create_parser() -> argparse.ArgumentParser:
-    """
-    Create the argument parser for the CLI.
-    
-    Returns:
-        Configured argument parser
-    """
-    parser = argparse.ArgumentParser(
-        prog='vibe',
-        description='Vibe-coding-kit: Enhance code maintainability through Windsurf/Cursor rules'
-    )
-    
-    subparsers = parser.add_subparsers(dest='command')
-    
-    # Start command - initialize project or global settings
-    start_parser = subparsers.add_parser(
-        'start',
-        help='Initialize project structure or set global language preferences'
-    )
-    start_parser.add_argument(
-        '--global',
-        dest='is_global',
-        action='store_true',
-        help='Apply global settings (set language preferences)'
-    )
-    
-    # Reset command - reset existing project rules to defaults
-    reset_parser = subparsers.add_parser(
-        'reset',
-        help='Reset project rules to defaults (keeping global settings)'
-    )
-    reset_parser.add_argument(
-        '--override',
-        dest='override_global',
-        action='store_true',
-        help='Override global settings for this project only'
-    )
-    reset_parser.add_argument(
-        '--global',
-        dest='reset_global',
-        action='store_true',
-        help='Reset global settings'
-    )
-    
-    return parser
-
-
 def is_first_run() -> bool:
     """
     Check if this is the first run of vibe-coding-kit.
@@ -109,30 +63,24 @@ def is_first_run() -> bool:
     Returns:
         True if this is the first run (global rules don't exist yet), False otherwise
     """
-    # Determine the location of global rules file
-    package_dir = os.path.dirname(os.path.abspath(__file__))
-    base_dir = os.path.normpath(os.path.join(package_dir, '..', '..'))
-    global_rules_path = os.path.join(base_dir, 'templates', 'global_rules_template.md')
+    from .paths import get_global_rules_path
     
-    # Check if global rules file exists
-    return not os.path.exists(global_rules_path)
+    # The file is only ever published by rename, so if it exists it is complete
+    return not os.path.exists(get_global_rules_path())
 
 
 def main() -> None:
     """
     Main entry point for the CLI.
     """
-    # Check if this is the first run and no command is specified
-    if is_first_run():
-        print("Welcome to vibe-coding-kit!")
-        print("This appears to be your first run. We'll set up global settings first.")
-        start_command(is_global=True)
-        print("\nGlobal setup complete. Now you can use 'vibe start' to initialize projects.")
-        return
-
-    # Normal command parsing
-    parser = create_parser()
-    args = parser.parse_args()
+    tracing.configure_from_env()
+    
+    # Parse arguments first so --help and bare invocations never touch the rules machinery
+    with tracing.span("parse_args"):
+        parser = create_parser()
+        args = parser.parse_args()
+    if args.trace:
+        tracing.configure(args.trace)
     
     if args.command is None:
         # Show welcome badge before help info
@@ -140,18 +88,165 @@ def main() -> None:
         parser.print_help()
         sys.exit(0)
     
-    if args.command == 'start':
-        print_welcome_badge()
-        start_command(
-            is_global=getattr(args, 'is_global', False)
+    if args.command == 'status':
+        # Read-only command: no first-run setup needed
+        from .status_commands import status_command
+        status_command(show_all=args.show_all, as_json=args.as_json, shell_manifest=args.shell_manifest)
+        return
+    
+    if args.command == 'history':
+        # Reads the history store only: no first-run setup needed
+        from .history_commands import history_command
+        history_command(args.project, as_json=args.as_json, show_stats=args.show_stats)
+        return
+    
+    if args.command == 'rollback':
+        from .history_commands import rollback_command
+        rollback_command(args.project, args.rev, dry_run=args.dry_run)
+        return
+    
+    if args.command == 'docs':
+        # Project-local command: does not depend on global settings
+        from .docs_commands import docs_command
+        docs_command(args.path, workers=args.workers, use_cache=args.use_cache)
+        return
+    
+    if args.command == 'check':
+        from .check_commands import check_command
+        check_command(
+            args.path,
+            max_lines=args.max_lines,
+            as_json=args.as_json,
+            workers=args.workers,
+            use_cache=args.use_cache
         )
-    elif args.command == 'reset':
-        print_welcome_badge()
-        reset_command(
-            override_global=getattr(args, 'override_global', False),
-            reset_global=getattr(args, 'reset_global', False)
+        return
+    
+    if args.command == 'todos':
+        from .todos_commands import todos_command
+        todos_command(
+            args.paths,
+            heading=args.heading,
+            keyword=args.keyword,
+            include_done=args.include_done,
+            summary=args.summary,
+            as_json=args.as_json,
+            refresh=args.refresh,
+            workers=args.workers
+        )
+        return
+    
+    if args.command == 'compact':
+        from .progress_commands import compact_command
+        compact_command(
+            args.path,
+            keep_entries=args.keep_entries,
+            keep_bytes=args.keep_bytes,
+            dry_run=args.dry_run
         )
+        return
+    
+    if args.command == 'packs':
+        from .packs_commands import packs_command
+        packs_command(tag=args.tag, language=args.language, refresh=args.refresh, as_json=args.as_json)
+        return
+    
+    if args.command == 'org':
+        from .org_commands import org_command
+        org_command(refresh=args.refresh, as_json=args.as_json)
+        return
     
+    if args.command == 'profile':
+        from .profile_commands import profile_command
+        profile_command(args.path, profile=args.profile, as_json=args.as_json)
+        return
+    
+    with tracing.span("import_commands"):
+        from .commands import start_command, reset_command
+    
+    # Settings from flags, VIBE_* variables and config files; a selected profile disables every prompt
+    if args.command in ('start', 'reset'):
+        from .profiles import ProfileError, configure as configure_profile, is_headless, resolve_profile
+        configure_profile(args.profile, {
+            "editor": getattr(args, 'editor', None),
+            "communication_language": args.communication_language,
+            "code_comment_language": args.code_comment_language,
+            "packs": getattr(args, 'packs', None),
+        })
+        try:
+            resolve_profile()
+        except ProfileError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
     
+    # Check if this is the first run before executing a command
+    with tracing.span("is_first_run"):
+        first_run = is_first_run()
+    if first_run:
+        print("Welcome to vibe-coding-kit!")
+        print("This appears to be your first run. We'll set up global settings first.")
+        start_command(is_global=True)
+        print("\nGlobal setup complete. Now you can use 'vibe start' to initialize projects.")
+        return
+    
+    from .compaction import TokenBudgetError, configure as configure_budget
+    try:
+        if args.command in ('start', 'reset'):
+            configure_budget(args.token_budget, args.strict_budget)
+        
+        if args.command == 'start':
+            project_dirs = None
+            editor_type = args.editor
+            if args.batch or args.paths or args.batch_file:
+                from .batch_commands import read_project_dirs
+                batch_file = args.batch_file
+                if batch_file is None and not args.paths:
+                    batch_file = '-'
+                # The editor cannot be prompted for once stdin holds the project list or is not a terminal
+                if editor_type is None and not is_headless() and (batch_file == '-' or not sys.stdin.isatty()):
+                    editor_type = resolve_profile()["editor"]
+                    if editor_type is None:
+                        print("Error: No editor given for a non-interactive batch start: "
+                              "pass --editor, set VIBE_EDITOR or select a profile that sets one")
+                        sys.exit(1)
+                project_dirs = read_project_dirs(args.paths, batch_file)
+            else:
+                print_welcome_badge()
+            start_command(
+                is_global=getattr(args, 'is_global', False),
+                project_dirs=project_dirs,
+                editor_type=editor_type,
+                workers=args.workers,
+                packs=args.packs
+            )
+        elif args.command == 'watch':
+            from .watch_commands import watch_command
+            watch_command(
+                debounce=args.debounce,
+                use_polling=args.use_polling,
+                interval=args.interval,
+                workers=args.workers
+            )
+        elif args.command == 'serve':
+            from .serve_commands import serve_command
+            serve_command(
+                host=args.host,
+                port=args.port,
+                socket_path=args.socket_path,
+                workers=args.workers
+            )
+        elif args.command == 'reset':
+            print_welcome_badge()
+            reset_command(
+                override_global=getattr(args, 'override_global', False),
+                reset_global=getattr(args, 'reset_global', False),
+                propagate=args.propagate,
+                workers=args.workers
+            )
+    except TokenBudgetError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+
 if __name__ == '__main__':
     main()
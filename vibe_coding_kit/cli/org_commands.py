@@ -0,0 +1,64 @@
+"""
+Org command implementation for vibe-coding-kit CLI.
+Shows where the organisation template comes from and the state of its cached copy, and refreshes it.
+"""
+
+import json
+import os
+import sys
+import time
+
+from .org_source import (
+    STATUS_UNAVAILABLE, get_org_cache_dir, get_org_source, get_org_ttl, is_remote_source, load_state,
+    refresh_org_template,
+)
+from .paths import get_org_template_path
+
+
+def _format_time(timestamp: float) -> str:
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(timestamp))
+
+
+def org_command(refresh: bool = False, as_json: bool = False) -> None:
+    """
+    Report the organisation template source, checking a remote source now if asked.
+
+    Args:
+        refresh: Whether to check a remote source even within its TTL
+        as_json: Whether to print the report as JSON
+    """
+    source = get_org_source()
+    path = get_org_template_path()
+    if source is None or not is_remote_source(source):
+        report = {"source": source, "path": path, "exists": os.path.exists(path)}
+    elif refresh:
+        report = refresh_org_template(force=True)
+    else:
+        report = dict(load_state(), path=path)
+        if report.get("source") != source:
+            report = {"source": source, "path": path}
+
+    if as_json:
+        print(json.dumps(report, indent=2))
+    elif source is None or not is_remote_source(source):
+        state = "" if report["exists"] else " (does not exist)"
+        print(f"Organisation template: {path}{state}")
+        if source is None:
+            print("Set VIBE_ORG_SOURCE to a directory, git+<repository> or http(s) URL to share one.")
+    else:
+        print(f"Organisation template source: {source}")
+        if "status" in report:
+            print(f"  check:         {report['status']}" + (f" ({report['error']})" if report.get("error") else ""))
+        if "version" not in report:
+            print("  not fetched yet (it is fetched on the next render, or with --refresh)")
+        else:
+            versions_dir = os.path.join(get_org_cache_dir(), 'versions')
+            print(f"  version:       {report['version'][:12]}"
+                  + (f" (commit {report['commit'][:12]})" if report.get("commit") else ""))
+            print(f"  cached copy:   {path}")
+            print(f"  last updated:  {_format_time(report.get('updated_at', report['checked_at']))}")
+            print(f"  last checked:  {_format_time(report['checked_at'])} "
+                  f"(next check after {_format_time(report['checked_at'] + get_org_ttl())})")
+            print(f"  versions kept: {len(os.listdir(versions_dir)) if os.path.isdir(versions_dir) else 0}")
+    if report.get("status") == STATUS_UNAVAILABLE:
+        sys.exit(1)
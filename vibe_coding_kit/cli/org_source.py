@@ -0,0 +1,258 @@
+"""
+Organisation template source for vibe-coding-kit CLI.
+Keeps a local, versioned copy of the organisation rules layer from a shared source, so an org-wide
+template change reaches every machine on its next render without reinstalling the kit. Renders within
+the TTL do no network access; after it, a conditional fetch only downloads a template that changed.
+
+Sources (VIBE_ORG_SOURCE):
+    /path/to/dir or file.md         read in place (e.g. a checkout kept up to date by other means)
+    git+<repository>[#ref[:path]]   shallow-fetched into the cache; a new commit is a new version
+    http(s)://host/path.md          fetched with If-None-Match / If-Modified-Since
+
+Cache layout, under <cache dir>/org:
+    state.json                      source, current version, validators, time of the last check
+    versions/<sha256>.md            the last KEEP_VERSIONS versions fetched
+    org_rules_template.md           the current version, which rules are rendered from
+    git/                            shallow repository of a git source
+"""
+
+import json
+import os
+import subprocess
+import time
+from typing import Dict, Optional, Tuple
+
+from .fileio import atomic_write, content_digest, locked
+from .paths import ORG_TEMPLATE_NAME, REMOTE_ORG_PREFIXES, get_org_template_path, get_user_cache_dir
+
+DEFAULT_TTL = 3600.0
+DEFAULT_TIMEOUT = 5.0
+# After a failed fetch, renders use the cached version and the next fetch waits this long
+RETRY_AFTER = 60.0
+KEEP_VERSIONS = 10
+
+STATUS_LOCAL = "local"
+STATUS_FRESH = "fresh"
+STATUS_UPDATED = "updated"
+STATUS_NOT_MODIFIED = "not modified"
+STATUS_OFFLINE = "offline"
+STATUS_UNAVAILABLE = "unavailable"
+
+# Remote sources checked by this process: source -> time.monotonic() of the check
+_checked: Dict[str, float] = {}
+
+
+def get_org_source() -> Optional[str]:
+    """
+    Get the configured organisation template source.
+
+    Returns:
+        Value of VIBE_ORG_SOURCE, or None to use templates/org_rules_template.md
+    """
+    return os.environ.get('VIBE_ORG_SOURCE', '').strip() or None
+
+
+def is_remote_source(source: str) -> bool:
+    """
+    Check whether a source is fetched into the cache (git or HTTP) rather than read in place.
+    """
+    return source.startswith(REMOTE_ORG_PREFIXES)
+
+
+def get_org_ttl() -> float:
+    """
+    Get how long a fetched template is used before checking the source again.
+
+    Returns:
+        Seconds from VIBE_ORG_TTL (default 3600)
+    """
+    try:
+        return float(os.environ.get('VIBE_ORG_TTL') or DEFAULT_TTL)
+    except ValueError:
+        return DEFAULT_TTL
+
+
+def get_org_cache_dir() -> str:
+    """
+    Get the cache directory of a remote organisation template.
+
+    Returns:
+        Path to org/ under the user cache dir
+    """
+    return os.path.join(get_user_cache_dir(), 'org')
+
+
+def load_state() -> Dict:
+    """
+    Read the cache state of the remote source.
+
+    Returns:
+        State dictionary (empty if nothing was fetched yet)
+    """
+    try:
+        with open(os.path.join(get_org_cache_dir(), 'state.json'), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def fetch_http(url: str, state: Dict, timeout: float) -> Tuple[Optional[bytes], Dict]:
+    """
+    Fetch a template over HTTP, sending the validators of the cached version.
+
+    Returns:
+        Tuple of (content, or None if not modified; new validators)
+    """
+    from urllib.error import HTTPError
+    from urllib.request import Request, urlopen
+
+    headers = {"User-Agent": "vibe-coding-kit"}
+    if state.get("etag"):
+        headers["If-None-Match"] = state["etag"]
+    if state.get("last_modified"):
+        headers["If-Modified-Since"] = state["last_modified"]
+    try:
+        with urlopen(Request(url, headers=headers), timeout=timeout) as response:
+            return response.read(), {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }
+    except HTTPError as e:
+        if e.code == 304:
+            return None, {}
+        raise OSError(f"HTTP {e.code} {e.reason}")
+
+
+def fetch_git(source: str, state: Dict, timeout: float) -> Tuple[Optional[bytes], Dict]:
+    """
+    Fetch the latest commit of a git source (depth 1) and read the template from it.
+
+    Returns:
+        Tuple of (content, or None if the commit did not change; {"commit": hash})
+    """
+    repository, _, ref = source[len('git+'):].partition('#')
+    ref, _, template_path = ref.partition(':')
+    repository_dir = os.path.join(get_org_cache_dir(), 'git')
+
+    def git(*args: str) -> bytes:
+        try:
+            # capture_output= is new in Python 3.7
+            return subprocess.run(
+                ['git', '-C', repository_dir] + list(args),
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True, timeout=timeout,
+            ).stdout
+        except subprocess.CalledProcessError as e:
+            raise OSError(f"git {args[0]} failed: {e.stderr.decode('utf-8', 'replace').strip()}")
+        except subprocess.TimeoutExpired:
+            raise OSError(f"git {args[0]} timed out after {timeout:g} s")
+
+    if not os.path.isdir(os.path.join(repository_dir, '.git')):
+        os.makedirs(repository_dir, exist_ok=True)
+        git('init', '-q')
+    git('fetch', '-q', '--depth', '1', repository, ref or 'HEAD')
+    commit = git('rev-parse', 'FETCH_HEAD').decode('utf-8').strip()
+    if commit == state.get("commit"):
+        return None, {}
+    return git('show', f"FETCH_HEAD:{template_path or ORG_TEMPLATE_NAME}"), {"commit": commit}
+
+
+def _publish(cache_dir: str, content: bytes) -> str:
+    """
+    Store a fetched version and make it current. Called under the cache directory's lock.
+
+    Returns:
+        Version (SHA-256 of the content)
+    """
+    content.decode('utf-8')
+    version = content_digest(content)
+    versions_dir = os.path.join(cache_dir, 'versions')
+    os.makedirs(versions_dir, exist_ok=True)
+    version_path = os.path.join(versions_dir, f"{version}.md")
+    if not os.path.exists(version_path):
+        atomic_write(version_path, content)
+    # Bump the mtime of a version seen again, so pruning keeps the recent ones
+    os.utime(version_path)
+    atomic_write(os.path.join(cache_dir, ORG_TEMPLATE_NAME), content)
+
+    names = sorted(os.listdir(versions_dir), key=lambda name: os.path.getmtime(os.path.join(versions_dir, name)))
+    for name in names[:-KEEP_VERSIONS]:
+        os.remove(os.path.join(versions_dir, name))
+    return version
+
+
+def refresh_org_template(force: bool = False) -> Dict:
+    """
+    Bring the cached copy of a remote source up to date if its TTL expired (or if forced).
+    Concurrent processes fetch one at a time; the others then find the cache fresh.
+
+    Args:
+        force: Whether to check the source even within the TTL
+
+    Returns:
+        Report with "source", "status" (one of the STATUS_* values), "path", the cache state and,
+        when a fetch failed, "error"
+    """
+    source = get_org_source()
+    path = get_org_template_path()
+    if source is None or not is_remote_source(source):
+        return {"source": source, "status": STATUS_LOCAL, "path": path}
+
+    cache_dir = get_org_cache_dir()
+    os.makedirs(cache_dir, exist_ok=True)
+    state_path = os.path.join(cache_dir, 'state.json')
+    report = {"source": source, "path": path}
+    with locked(state_path):
+        state = load_state()
+        if state.get("source") != source:
+            state = {"source": source}
+        have_copy = os.path.exists(path) and "version" in state
+        now = time.time()
+        if have_copy and not force and state.get("checked_at", 0) + get_org_ttl() > now:
+            report["status"] = STATUS_FRESH
+        else:
+            # Without a cached copy, validators would only get a 304 for content we do not have
+            validators = state if have_copy else {}
+            timeout = float(os.environ.get('VIBE_ORG_TIMEOUT') or DEFAULT_TIMEOUT)
+            try:
+                if source.startswith('git+'):
+                    content, updates = fetch_git(source, validators, timeout)
+                else:
+                    content, updates = fetch_http(source, validators, timeout)
+                version = _publish(cache_dir, content) if content is not None else state.get("version")
+            except (OSError, ValueError) as e:
+                report["status"] = STATUS_OFFLINE if have_copy else STATUS_UNAVAILABLE
+                report["error"] = str(e)
+                state["checked_at"] = now - max(0.0, get_org_ttl() - RETRY_AFTER)
+            else:
+                report["status"] = STATUS_UPDATED if version != state.get("version") else STATUS_NOT_MODIFIED
+                state.update(updates, version=version, checked_at=now)
+                if report["status"] == STATUS_UPDATED:
+                    state["updated_at"] = now
+            atomic_write(state_path, json.dumps(state, indent=2))
+    _checked[source] = time.monotonic()
+    report.update(state)
+    return report
+
+
+def sync_org_template() -> str:
+    """
+    Get the organisation template to render from, refreshing a remote source whose TTL expired.
+    Checks the cache at most once per TTL per process; fetch errors fall back to the cached version.
+
+    Returns:
+        Path to the organisation template (it may not exist)
+    """
+    source = get_org_source()
+    if source is None or not is_remote_source(source):
+        return get_org_template_path()
+    if _checked.get(source, float('-inf')) + get_org_ttl() <= time.monotonic():
+        try:
+            report = refresh_org_template()
+        except (OSError, ValueError) as e:
+            _checked[source] = time.monotonic()
+            report = {"status": STATUS_UNAVAILABLE, "error": str(e)}
+        if report["status"] == STATUS_OFFLINE:
+            print(f"Warning: Could not update the organisation template ({report['error']}); using the cached version.")
+        elif report["status"] == STATUS_UNAVAILABLE:
+            print(f"Warning: Could not fetch the organisation template ({report['error']}); rendering without it.")
+    return get_org_template_path()
@@ -0,0 +1,55 @@
+"""
+Packs command implementation for vibe-coding-kit CLI.
+Lists the rule packs installed as plugins, from the cached pack manifest.
+"""
+
+import json
+from typing import Optional
+
+from .rule_packs import PLUGIN_GROUP, get_manifest_path, load_manifest
+
+
+def packs_command(
+    tag: Optional[str] = None,
+    language: Optional[str] = None,
+    refresh: bool = False,
+    as_json: bool = False
+) -> None:
+    """
+    List installed plugin rule packs, optionally filtered by tag or language.
+    Only pack metadata is read; pack content is never loaded.
+
+    Args:
+        tag: Only list packs with this tag
+        language: Only list packs for this language (stack)
+        refresh: Whether to rebuild the cached manifest
+        as_json: Whether to print the packs as JSON
+    """
+    packs = [
+        pack for pack in load_manifest(refresh)
+        if (tag is None or tag.lower() in pack["tags"])
+        and (language is None or language.lower() in pack["languages"])
+    ]
+
+    if as_json:
+        print(json.dumps(packs, indent=2))
+        return
+
+    if not packs:
+        print("No rule packs installed." if tag is None and language is None else "No matching rule packs.")
+        print(f"Packages register packs under the '{PLUGIN_GROUP}' entry point group.")
+        return
+
+    for pack in packs:
+        source = f"{pack['dist']} {pack['version']}".strip() or pack["entry_point"]
+        print(f"{pack['name']:<20} priority {pack['priority']:<4} {source}")
+        if pack["description"]:
+            print(f"  {pack['description']}")
+        details = []
+        if pack["languages"]:
+            details.append(f"languages: {', '.join(pack['languages'])}")
+        if pack["tags"]:
+            details.append(f"tags: {', '.join(pack['tags'])}")
+        if details:
+            print(f"  {'; '.join(details)}")
+    print(f"\n{len(packs)} packs (manifest: {get_manifest_path()})")
@@ -0,0 +1,381 @@
+"""
+Argument parser for the vibe-coding-kit CLI.
+Defines the vibe command and its subcommands.
+"""
+
+import argparse
+
+from .tool_parsers import add_tool_parsers
+
+
+def editor_types_argument(value: str) -> str:
+    """
+    Argparse type for --editor: a comma-separated list of editor types, or "auto".
+    
+    Args:
+        value: Command line value
+        
+    Returns:
+        Normalised editor types, or "auto"
+    """
+    # Imported here so that parsing other commands does not load the editors module
+    from .editors import AUTO_EDITOR, parse_editor_types
+    
+    if value.strip().lower() == AUTO_EDITOR:
+        return AUTO_EDITOR
+    try:
+        return parse_editor_types(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def add_budget_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Add the token budget options shared by commands that render rules files.
+    
+    Args:
+        parser: Subcommand parser to extend
+    """
+    parser.add_argument(
+        '--token-budget',
+        type=int,
+        default=None,
+        metavar='TOKENS',
+        help='Compact rendered rules files to fit this many estimated tokens (or set VIBE_TOKEN_BUDGET)'
+    )
+    parser.add_argument(
+        '--strict-budget',
+        action='store_true',
+        default=None,
+        help='Fail instead of warning when a rules file is still over budget after compaction'
+    )
+
+
+def add_profile_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Add the headless profile options shared by commands that can prompt.
+    
+    Args:
+        parser: Subcommand parser to extend
+    """
+    parser.add_argument(
+        '--profile',
+        metavar='NAME',
+        help='Use this profile from .vibe/config.json or the user config, and never prompt (or set VIBE_PROFILE)'
+    )
+    parser.add_argument(
+        '--communication-language',
+        metavar='LANGUAGE',
+        help='Communication language, instead of prompting or the profile (or set VIBE_COMMUNICATION_LANGUAGE)'
+    )
+    parser.add_argument(
+        '--code-comment-language',
+        metavar='LANGUAGE',
+        help='Code comment language, instead of prompting or the profile (or set VIBE_CODE_COMMENT_LANGUAGE)'
+    )
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """
+    Create the argument parser for the CLI.
+    
+    Returns:
+        Configured argument parser
+    """
+    parser = argparse.ArgumentParser(
+        prog='vibe',
+        description='Vibe-coding-kit: Enhance code maintainability through Windsurf/Cursor rules'
+    )
+    
+    parser.add_argument(
+        '--trace',
+        dest='trace',
+        action='store_const',
+        const='stderr',
+        help='Write timing spans for every phase to stderr as JSON lines '
+             '(set VIBE_TRACE_FORMAT=chrome for Chrome trace events)'
+    )
+    parser.add_argument(
+        '--trace-file',
+        dest='trace',
+        metavar='FILE',
+        help='Write timing spans to FILE instead of stderr'
+    )
+    
+    subparsers = parser.add_subparsers(dest='command')
+    
+    # Start command - initialize project or global settings
+    start_parser = subparsers.add_parser(
+        'start',
+        help='Initialize project structure or set global language preferences'
+    )
+    start_parser.add_argument(
+        '--global',
+        dest='is_global',
+        action='store_true',
+        help='Apply global settings (set language preferences)'
+    )
+    start_parser.add_argument(
+        'paths',
+        nargs='*',
+        metavar='PATH',
+        help='Project roots to initialize in batch mode'
+    )
+    start_parser.add_argument(
+        '--batch',
+        action='store_true',
+        help='Initialize many projects at once (reads roots from stdin if no PATH or --batch-file is given)'
+    )
+    start_parser.add_argument(
+        '--batch-file',
+        metavar='FILE',
+        help="File with one project root per line ('-' for stdin)"
+    )
+    start_parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Number of worker threads for batch mode'
+    )
+    start_parser.add_argument(
+        '--editor',
+        type=editor_types_argument,
+        default=None,
+        metavar='EDITORS',
+        help="Comma-separated editors: windsurf, cursor, cursor-mdc (.cursor/rules), "
+             "or 'auto' to keep each project's existing editors (skips the editor prompt; or set VIBE_EDITOR)"
+    )
+    start_parser.add_argument(
+        '--pack',
+        dest='packs',
+        action='append',
+        default=None,
+        metavar='NAME',
+        help='Add the installed plugin rule packs with this name or tag (repeatable; see vibe packs)'
+    )
+    add_budget_arguments(start_parser)
+    add_profile_arguments(start_parser)
+    
+    # Reset command - reset existing project rules to defaults
+    reset_parser = subparsers.add_parser(
+        'reset',
+        help='Reset project rules to defaults (keeping global settings)'
+    )
+    reset_parser.add_argument(
+        '--override',
+        dest='override_global',
+        action='store_true',
+        help='Override global settings for this project only'
+    )
+    reset_parser.add_argument(
+        '--global',
+        dest='reset_global',
+        action='store_true',
+        help='Reset global settings'
+    )
+    reset_parser.add_argument(
+        '--propagate',
+        action='store_true',
+        help='Re-render every registered project affected by the global rules (resumes if used without --global)'
+    )
+    reset_parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Maximum number of concurrent workers for --propagate'
+    )
+    add_budget_arguments(reset_parser)
+    add_profile_arguments(reset_parser)
+    
+    # Status command - report projects with stale rules from the registry
+    status_parser = subparsers.add_parser(
+        'status',
+        help='Report initialized projects whose rules are stale'
+    )
+    status_parser.add_argument(
+        '--all',
+        dest='show_all',
+        action='store_true',
+        help='List up-to-date projects too'
+    )
+    status_parser.add_argument(
+        '--json',
+        dest='as_json',
+        action='store_true',
+        help='Print the report as JSON'
+    )
+    status_parser.add_argument(
+        '--shell-manifest',
+        dest='shell_manifest',
+        action='store_true',
+        help='Refresh the staleness manifest of the shell cd hook quietly instead'
+    )
+    
+    # History command - recorded revisions of a project's rules files
+    history_parser = subparsers.add_parser(
+        'history',
+        help="List the recorded revisions of a project's rules files"
+    )
+    history_parser.add_argument(
+        'project',
+        nargs='?',
+        default='.',
+        help='Project root directory (default: current directory)'
+    )
+    history_parser.add_argument(
+        '--stats',
+        dest='show_stats',
+        action='store_true',
+        help='Report the size of the history store across all projects instead'
+    )
+    history_parser.add_argument(
+        '--json',
+        dest='as_json',
+        action='store_true',
+        help='Print the revisions as JSON'
+    )
+    
+    # Rollback command - restore a recorded revision
+    rollback_parser = subparsers.add_parser(
+        'rollback',
+        help='Restore the rules files a project had at a recorded revision'
+    )
+    rollback_parser.add_argument('project', help='Project root directory')
+    rollback_parser.add_argument('rev', type=int, help="Revision number from 'vibe history'")
+    rollback_parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='Only show which files would change'
+    )
+    
+    # Watch command - keep projects in sync with the templates
+    watch_parser = subparsers.add_parser(
+        'watch',
+        help='Watch templates and registered projects and re-render rules files on change'
+    )
+    watch_parser.add_argument(
+        '--debounce',
+        type=float,
+        default=0.5,
+        help='Seconds to wait for a burst of saves to settle (default: 0.5)'
+    )
+    watch_parser.add_argument(
+        '--poll',
+        dest='use_polling',
+        action='store_true',
+        help='Poll file stats instead of using inotify'
+    )
+    watch_parser.add_argument(
+        '--interval',
+        type=float,
+        default=2.0,
+        help='Polling interval in seconds (default: 2.0)'
+    )
+    watch_parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Maximum number of concurrent workers for re-rendering'
+    )
+    
+    # Serve command - local render server for editor plugins and CI
+    serve_parser = subparsers.add_parser(
+        'serve',
+        help='Run a local server that renders rules and reports staleness on request'
+    )
+    serve_parser.add_argument(
+        '--socket',
+        dest='socket_path',
+        default=None,
+        metavar='PATH',
+        help='Listen on this Unix socket instead of TCP (or set VIBE_SERVE_SOCKET)'
+    )
+    serve_parser.add_argument(
+        '--host',
+        default='127.0.0.1',
+        help='Address to listen on for TCP (default: 127.0.0.1; requests need the token in serve_token under the data dir)'
+    )
+    serve_parser.add_argument(
+        '--port',
+        type=int,
+        default=8765,
+        help='TCP port (default: 8765)'
+    )
+    serve_parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Number of request handler threads'
+    )
+    
+    # Project tools - docs, check, todos and compact
+    add_tool_parsers(subparsers)
+    
+    # Packs command - list installed plugin rule packs
+    packs_parser = subparsers.add_parser(
+        'packs',
+        help='List the rule packs installed as plugins'
+    )
+    packs_parser.add_argument(
+        '--tag',
+        default=None,
+        help='Only list packs with this tag'
+    )
+    packs_parser.add_argument(
+        '--language',
+        default=None,
+        help='Only list packs for this language (stack)'
+    )
+    packs_parser.add_argument(
+        '--refresh',
+        action='store_true',
+        help='Rebuild the cached pack manifest (imports every plugin)'
+    )
+    packs_parser.add_argument(
+        '--json',
+        dest='as_json',
+        action='store_true',
+        help='Print the packs as JSON'
+    )
+    
+    # Org command - organisation template source and its cached copy
+    org_parser = subparsers.add_parser(
+        'org',
+        help='Show the organisation template source (VIBE_ORG_SOURCE) and its cached copy'
+    )
+    org_parser.add_argument(
+        '--refresh',
+        action='store_true',
+        help='Check a remote source now instead of waiting for the TTL (conditional fetch)'
+    )
+    org_parser.add_argument(
+        '--json',
+        dest='as_json',
+        action='store_true',
+        help='Print the report as JSON'
+    )
+    
+    # Profile command - show the settings a command would run with
+    profile_parser = subparsers.add_parser(
+        'profile',
+        help='Show the headless settings resolved for a project and where each comes from'
+    )
+    profile_parser.add_argument(
+        'path',
+        nargs='?',
+        default='.',
+        help='Project directory (default: current directory)'
+    )
+    profile_parser.add_argument(
+        '--profile',
+        metavar='NAME',
+        help='Resolve this profile instead of the default one'
+    )
+    profile_parser.add_argument(
+        '--json',
+        dest='as_json',
+        action='store_true',
+        help='Print the settings as JSON'
+    )
+    
+    return parser
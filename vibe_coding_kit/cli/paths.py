@@ -0,0 +1,127 @@
+"""
+Path helpers for vibe-coding-kit CLI.
+Locates the templates directory and the per-user cache and data directories.
+"""
+
+import os
+
+
+def get_templates_dir() -> str:
+    """
+    Get the path to the templates directory.
+
+    Returns:
+        Path to the templates directory
+    """
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.normpath(os.path.join(package_dir, '..', '..', 'templates'))
+
+
+def get_global_rules_path() -> str:
+    """
+    Get the path to the global rules file.
+
+    Returns:
+        Path to global_rules_template.md
+    """
+    return os.path.join(get_templates_dir(), 'global_rules_template.md')
+
+
+def get_project_template_path() -> str:
+    """
+    Get the path to the project rules template.
+
+    Returns:
+        Path to project_rules_template.md
+    """
+    return os.path.join(get_templates_dir(), 'project_rules_template.md')
+
+
+ORG_TEMPLATE_NAME = 'org_rules_template.md'
+
+# VIBE_ORG_SOURCE values fetched into the cache rather than read in place
+REMOTE_ORG_PREFIXES = ('http://', 'https://', 'git+')
+
+
+def get_org_template_path() -> str:
+    """
+    Get the path to the optional organisation rules template, layered between
+    the global rules and the project template. With VIBE_ORG_SOURCE set it is the shared
+    organisation template: a local file or directory read in place, or the cached copy of a remote source.
+
+    Returns:
+        Path to org_rules_template.md
+    """
+    source = os.environ.get('VIBE_ORG_SOURCE', '').strip()
+    if not source:
+        return os.path.join(get_templates_dir(), ORG_TEMPLATE_NAME)
+    if source.startswith(REMOTE_ORG_PREFIXES):
+        return os.path.join(get_user_cache_dir(), 'org', ORG_TEMPLATE_NAME)
+    source = os.path.expanduser(source)
+    return os.path.join(source, ORG_TEMPLATE_NAME) if os.path.isdir(source) else source
+
+
+def get_packs_dir() -> str:
+    """
+    Get the directory of stack-specific rule packs (one <stack>.md per stack).
+
+    Returns:
+        Path to the packs directory inside the templates directory
+    """
+    return os.path.join(get_templates_dir(), 'packs')
+
+
+def get_pack_path(stack: str) -> str:
+    """
+    Get the path to the rule pack of a stack.
+
+    Args:
+        stack: Stack name, e.g. "python"
+
+    Returns:
+        Path to <stack>.md in the packs directory (it may not exist)
+    """
+    return os.path.join(get_packs_dir(), f'{stack}.md')
+
+
+def get_user_cache_dir() -> str:
+    """
+    Get the per-user cache directory ($VIBE_CACHE_DIR, else $XDG_CACHE_HOME/vibe-coding-kit).
+    The directory is not created.
+
+    Returns:
+        Path to the cache directory
+    """
+    if os.environ.get('VIBE_CACHE_DIR'):
+        return os.environ['VIBE_CACHE_DIR']
+    base_dir = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base_dir, 'vibe-coding-kit')
+
+
+def get_user_data_dir() -> str:
+    """
+    Get the per-user data directory ($VIBE_DATA_DIR, else $XDG_DATA_HOME/vibe-coding-kit).
+    The directory is not created.
+
+    Returns:
+        Path to the data directory
+    """
+    if os.environ.get('VIBE_DATA_DIR'):
+        return os.environ['VIBE_DATA_DIR']
+    base_dir = os.environ.get('XDG_DATA_HOME') or os.path.join(os.path.expanduser('~'), '.local', 'share')
+    return os.path.join(base_dir, 'vibe-coding-kit')
+
+
+
+def get_user_config_path() -> str:
+    """
+    Get the per-user config file with headless profiles ($VIBE_CONFIG, else
+    $XDG_CONFIG_HOME/vibe-coding-kit/config.json).
+
+    Returns:
+        Path to the user config file
+    """
+    if os.environ.get('VIBE_CONFIG'):
+        return os.environ['VIBE_CONFIG']
+    base_dir = os.environ.get('XDG_CONFIG_HOME') or os.path.join(os.path.expanduser('~'), '.config')
+    return os.path.join(base_dir, 'vibe-coding-kit', 'config.json')
@@ -0,0 +1,44 @@
+"""
+Profile command implementation for vibe-coding-kit CLI.
+Shows the settings a command would run with in a project, and the source of each one.
+"""
+
+import json
+import os
+import sys
+from typing import Optional
+
+from .paths import get_user_config_path
+from .profiles import SETTINGS, ProfileError, configure, get_project_config_path, resolve_profile
+
+
+def profile_command(project_dir: str = '.', profile: Optional[str] = None, as_json: bool = False) -> None:
+    """
+    Print the resolved settings of a project.
+
+    Args:
+        project_dir: Project root directory
+        profile: Profile name to resolve instead of the default one
+        as_json: Whether to print the settings as JSON
+    """
+    project_dir = os.path.abspath(os.path.expanduser(project_dir))
+    configure(profile)
+    try:
+        resolved = resolve_profile(project_dir)
+    except ProfileError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    if as_json:
+        print(json.dumps(dict(resolved, path=project_dir), indent=2))
+        return
+
+    print(f"Profile: {resolved['profile'] or 'none'} ({'headless' if resolved['headless'] else 'interactive'})")
+    for setting in SETTINGS:
+        value = resolved[setting]
+        if value is None:
+            print(f"  {setting:<22} -")
+            continue
+        shown = ', '.join(value) if isinstance(value, list) else value
+        print(f"  {setting:<22} {shown or '(none)'}  [{resolved['sources'][setting]}]")
+    print(f"\nConfig files: {get_project_config_path(project_dir)}, {get_user_config_path()}")
@@ -0,0 +1,218 @@
+"""
+Headless profiles for vibe-coding-kit CLI.
+Resolves the settings commands would otherwise prompt for, each from the first source that sets it:
+command line flags, VIBE_* environment variables, the project's .vibe/config.json, then the user config.
+Once a profile is selected (--profile, VIBE_PROFILE or "profile" in a config file) commands never prompt.
+
+Both config files use the same JSON format:
+    {
+        "profile": "ci",
+        "profiles": {
+            "ci": {"editor": "windsurf,cursor", "communication_language": "English",
+                   "code_comment_language": "English", "stacks": ["python"], "packs": ["web"]}
+        }
+    }
+"""
+
+import json
+import os
+from typing import Dict, List, Optional, Tuple
+
+from .cache import cached_load, file_signature
+from .paths import get_user_config_path
+
+# Settings a profile can hold; each can also be set with VIBE_<SETTING>, e.g. VIBE_EDITOR
+SETTINGS = ("editor", "communication_language", "code_comment_language", "stacks", "packs")
+LIST_SETTINGS = ("stacks", "packs")
+
+PROJECT_CONFIG = os.path.join('.vibe', 'config.json')
+
+# Command line layer, set by configure()
+_cli_profile: Optional[str] = None
+_cli_settings: Dict = {}
+# Resolved profiles, keyed by directory, command line, environment and config file signatures
+_resolved: Dict[Tuple, Dict] = {}
+
+
+class ProfileError(ValueError):
+    """
+    Raised when a config file is invalid or the selected profile does not exist.
+    """
+
+
+def configure(profile: Optional[str] = None, settings: Optional[Dict] = None) -> None:
+    """
+    Set the command line layer of profile resolution.
+
+    Args:
+        profile: Profile name from --profile
+        settings: Settings given as flags (None values are ignored)
+    """
+    global _cli_profile, _cli_settings
+    _cli_profile = profile or None
+    _cli_settings = {setting: value for setting, value in (settings or {}).items() if value is not None}
+
+
+def get_project_config_path(project_dir: str) -> str:
+    """
+    Get the config file of a project.
+
+    Args:
+        project_dir: Project root directory
+
+    Returns:
+        Path to .vibe/config.json in the project
+    """
+    return os.path.join(os.path.abspath(project_dir), PROJECT_CONFIG)
+
+
+def _parse_config(config_path: str) -> Dict:
+    """
+    Parse a config file; a missing file is an empty config.
+    """
+    try:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        raise ProfileError(f"Cannot read {config_path}: {e}")
+    if not isinstance(config, dict) or not isinstance(config.get("profiles", {}), dict):
+        raise ProfileError(f"{config_path} must be a JSON object with a \"profiles\" object")
+    return config
+
+
+def load_config(config_path: str) -> Dict:
+    """
+    Load a config file. Cached until the file changes.
+
+    Args:
+        config_path: Path to a project or user config file
+
+    Returns:
+        Config dictionary (empty if the file does not exist)
+
+    Raises:
+        ProfileError: If the file is not a valid config
+    """
+    return cached_load('config', config_path, _parse_config)
+
+
+def _normalize(setting: str, value, source: str):
+    """
+    Validate one setting value from a source.
+    """
+    if setting in LIST_SETTINGS:
+        if isinstance(value, str):
+            value = value.split(',')
+        if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+            raise ProfileError(f"{source}: '{setting}' must be a list of names")
+        return sorted({item.strip() for item in value if item.strip()})
+    if not isinstance(value, str) or not value.strip():
+        raise ProfileError(f"{source}: '{setting}' must be a non-empty string")
+    if setting == "editor":
+        from .editors import AUTO_EDITOR, parse_editor_types
+        if value.strip().lower() == AUTO_EDITOR:
+            return AUTO_EDITOR
+        try:
+            return parse_editor_types(value)
+        except ValueError as e:
+            raise ProfileError(f"{source}: {e}")
+    return value.strip()
+
+
+def _env_settings() -> Dict[str, str]:
+    return {
+        setting: os.environ[f"VIBE_{setting.upper()}"] for setting in SETTINGS
+        if os.environ.get(f"VIBE_{setting.upper()}")
+    }
+
+
+def resolve_profile(project_dir: Optional[str] = None) -> Dict:
+    """
+    Resolve the settings for a directory. Cached per directory until the environment,
+    the command line layer or one of the config files changes.
+
+    Args:
+        project_dir: Project root directory (defaults to the current working directory)
+
+    Returns:
+        Dictionary with "profile" (selected name or None), "headless" (True if a profile is selected),
+        every setting of SETTINGS (None if no source sets it) and "sources" (setting -> where it came from).
+        Callers must not modify it.
+
+    Raises:
+        ProfileError: If a config file is invalid or the selected profile does not exist
+    """
+    project_dir = os.path.abspath(project_dir or os.getcwd())
+    project_config = get_project_config_path(project_dir)
+    user_config = get_user_config_path()
+    env = _env_settings()
+    key = (
+        project_dir, _cli_profile, json.dumps(_cli_settings, sort_keys=True), os.environ.get('VIBE_PROFILE'),
+        json.dumps(env, sort_keys=True), user_config, file_signature(project_config), file_signature(user_config)
+    )
+    profile = _resolved.get(key)
+    if profile is not None:
+        return profile
+
+    configs = [(project_config, load_config(project_config)), (user_config, load_config(user_config))]
+    name = _cli_profile or os.environ.get('VIBE_PROFILE') or next(
+        (config["profile"] for _, config in configs if config.get("profile")), None
+    )
+    layers: List[Tuple[str, Dict]] = [("command line", _cli_settings), ("environment", env)]
+    if name:
+        for config_path, config in configs:
+            values = config.get("profiles", {}).get(name)
+            if values is not None:
+                if not isinstance(values, dict):
+                    raise ProfileError(f"{config_path}: profile '{name}' must be a JSON object")
+                layers.append((config_path, values))
+        if len(layers) == 2:
+            raise ProfileError(f"No profile named '{name}' in {project_config} or {user_config}")
+
+    profile = {"profile": name, "headless": bool(name), "sources": {}}
+    for setting in SETTINGS:
+        profile[setting] = None
+        for source, values in layers:
+            if values.get(setting) is not None:
+                profile[setting] = _normalize(setting, values[setting], source)
+                profile["sources"][setting] = source
+                break
+    _resolved[key] = profile
+    return profile
+
+
+def is_headless() -> bool:
+    """
+    Check whether prompts must be skipped: a profile is selected for the current directory.
+
+    Returns:
+        True if commands run without prompts
+    """
+    try:
+        return resolve_profile()["headless"]
+    except ProfileError:
+        # Reported by the command that resolves the profile; a broken config never enables prompts
+        return bool(_cli_profile or os.environ.get('VIBE_PROFILE'))
+
+
+def language_overrides(profile: Dict) -> Optional[Dict[str, str]]:
+    """
+    Get the project language overrides a profile sets. A language the profile leaves unset
+    is taken from the global rules.
+
+    Args:
+        profile: Resolved profile from resolve_profile()
+
+    Returns:
+        Overrides for render_project_rules() and the registry, or None if the profile sets no language
+    """
+    if profile["communication_language"] is None and profile["code_comment_language"] is None:
+        return None
+    from .project_commands import get_global_rules
+    global_rules = get_global_rules()
+    return {
+        setting: profile[setting] or global_rules[setting]
+        for setting in ("communication_language", "code_comment_language")
+    }
@@ -0,0 +1,298 @@
+"""
+Compact command implementation for vibe-coding-kit CLI.
+Keeps dev/progress.md bounded by moving older entries into dated archive files with an index.
+
+Entries are the "## " sections of progress.md; everything before the first entry is kept as is.
+"""
+
+import os
+import sys
+import time
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from .fileio import atomic_write, locked
+
+DEFAULT_KEEP_ENTRIES = 20
+DEFAULT_KEEP_BYTES = 32 * 1024
+# Size above which `vibe start` / `vibe reset` compact progress.md automatically
+DEFAULT_AUTO_THRESHOLD = 128 * 1024
+
+ARCHIVE_DIR = "progress_archive"
+ARCHIVE_NOTE = "> Older entries are archived in `dev/progress_archive/` (see `index.md`)."
+INDEX_HEADER = (
+    "# Progress Archive\n\n"
+    "| Archive | Entries | First entry | Last entry | Rotated |\n"
+    "|---|---|---|---|---|\n"
+)
+
+# Write status reported for a progress.md that was compacted
+STATUS_COMPACTED = "compacted"
+
+# Seconds the replaced progress.md is still watched for appends from writers that had it open
+LATE_APPEND_GRACE = 0.05
+
+# Attempts before giving up when progress.md keeps changing during a rotation
+MAX_ATTEMPTS = 5
+
+
+def split_entries(text: str) -> Tuple[str, List[str]]:
+    """
+    Split progress.md into its preamble and "## " entries, ignoring headings inside code blocks.
+
+    Args:
+        text: Content of progress.md
+
+    Returns:
+        Tuple of (preamble, entries); joined together they give back the text unchanged
+    """
+    preamble = []
+    entries: List[List[str]] = []
+    in_code = False
+    for line in text.splitlines(keepends=True):
+        if line.lstrip().startswith('```'):
+            in_code = not in_code
+        if not in_code and line.startswith('## '):
+            entries.append([line])
+        elif entries:
+            entries[-1].append(line)
+        else:
+            preamble.append(line)
+    return ''.join(preamble), [''.join(lines) for lines in entries]
+
+
+def _select_kept(entries: List[str], keep_entries: int, keep_bytes: int) -> int:
+    """
+    Count how many trailing entries fit the limits. The newest entry is always kept.
+    """
+    kept = 0
+    size = 0
+    for entry in reversed(entries):
+        size += len(entry.encode('utf-8'))
+        if kept and (kept >= keep_entries or size > keep_bytes):
+            break
+        kept += 1
+    return kept
+
+
+def _entry_title(entry: str) -> str:
+    return entry.split('\n', 1)[0][3:].strip().replace('|', '\\|')
+
+
+def _with_note(preamble: str) -> str:
+    """
+    Add the archive pointer to the preamble, once.
+    """
+    if ARCHIVE_NOTE in preamble:
+        return preamble
+    return preamble.rstrip('\n') + "\n\n" + ARCHIVE_NOTE + "\n\n"
+
+
+def _archive_entries(archive_dir: str, entries: List[str], now: float) -> Optional[str]:
+    """
+    Append entries to today's archive file and add a row to the index.
+    Entries the archive already ends with (from an interrupted or retried rotation) are not written twice.
+
+    Returns:
+        Path of the archive file, or None if every entry was already archived
+    """
+    date = time.strftime('%Y-%m-%d', time.localtime(now))
+    archive_path = os.path.join(archive_dir, f"{date}.md")
+    # Appending is a read-modify-write: concurrent rotations must not drop each other's entries
+    os.makedirs(archive_dir, exist_ok=True)
+    with locked(archive_path):
+        try:
+            with open(archive_path, 'r', encoding='utf-8') as f:
+                existing = f.read()
+        except FileNotFoundError:
+            existing = f"# Progress Archive {date}\n\n"
+
+        done = next(
+            (count for count in range(len(entries), 0, -1) if existing.endswith(''.join(entries[:count]))),
+            0
+        )
+        entries = entries[done:]
+        if not entries:
+            return None
+
+        separator = "" if existing.endswith("\n\n") or not existing else "\n"
+        atomic_write(archive_path, existing + separator + ''.join(entries))
+
+        index_path = os.path.join(archive_dir, "index.md")
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                index = f.read()
+        except FileNotFoundError:
+            index = INDEX_HEADER
+        rotated = time.strftime('%Y-%m-%d %H:%M', time.localtime(now))
+        row = (
+            f"| [{date}.md]({date}.md) | {len(entries)} | {_entry_title(entries[0])} "
+            f"| {_entry_title(entries[-1])} | {rotated} |\n"
+        )
+        atomic_write(index_path, index + row)
+        return archive_path
+
+
+def compact_progress(
+    project_dir: str,
+    keep_entries: int = DEFAULT_KEEP_ENTRIES,
+    keep_bytes: int = DEFAULT_KEEP_BYTES,
+    dry_run: bool = False
+) -> Dict:
+    """
+    Move all but the most recent progress entries into the archive.
+    Archives are written before progress.md is replaced, and the replacement is atomic.
+    Appends made to progress.md while the rotation runs (e.g. by an agent), or shortly after the
+    rename by writers that still had the old file open, are carried over to the new file; if the
+    file is rewritten instead, the rotation starts over from the new content.
+    Entries are never archived twice.
+
+    Args:
+        project_dir: Project root directory
+        keep_entries: Maximum number of entries kept in progress.md
+        keep_bytes: Maximum size of the entries kept in progress.md
+        dry_run: Whether to only report what would be archived
+
+    Returns:
+        Report with "path", "before" and "after" sizes in bytes, "archived" and "kept" entry counts,
+        and "archive" (path of the archive file written, or None)
+
+    Raises:
+        FileNotFoundError: If the project has no dev/progress.md
+        RuntimeError: If progress.md was rewritten during every attempt
+    """
+    dev_dir = os.path.join(project_dir, 'dev')
+    progress_path = os.path.join(dev_dir, 'progress.md')
+
+    for _ in range(MAX_ATTEMPTS):
+        # Keep the old file open: appends that land in it after it is read can still be recovered
+        with open(progress_path, 'rb') as f:
+            data = f.read()
+            text = data.decode('utf-8')
+            preamble, entries = split_entries(text)
+            kept = _select_kept(entries, keep_entries, keep_bytes)
+            archived = entries[:len(entries) - kept]
+            hot = (_with_note(preamble) + ''.join(entries[len(entries) - kept:])).encode('utf-8')
+            report = {
+                "path": progress_path,
+                "before": len(data),
+                "after": len(hot),
+                "archived": len(archived),
+                "kept": kept,
+                "archive": None,
+            }
+            if not archived or dry_run:
+                return report
+
+            report["archive"] = _archive_entries(os.path.join(dev_dir, ARCHIVE_DIR), archived, time.time())
+
+            # Carry over whatever was appended meanwhile, unless the file was replaced or truncated
+            hot += f.read()
+            current = os.stat(progress_path)
+            if current.st_ino != os.fstat(f.fileno()).st_ino or current.st_size != f.tell():
+                continue
+            atomic_write(progress_path, hot)
+
+            # Writers that opened the old file before the rename may still append to it for a moment
+            late = 0
+            deadline = time.monotonic() + LATE_APPEND_GRACE
+            while True:
+                chunk = f.read()
+                if chunk:
+                    with open(progress_path, 'ab') as out:
+                        out.write(chunk)
+                    late += len(chunk)
+                elif time.monotonic() >= deadline:
+                    break
+                else:
+                    time.sleep(0.005)
+            report["after"] = len(hot) + late
+            return report
+
+    raise RuntimeError(f"{progress_path} kept changing during compaction, try again later")
+
+
+@lru_cache(maxsize=8)
+def _parse_threshold(value: str) -> int:
+    """
+    Parse VIBE_PROGRESS_MAX_BYTES. Cached, so a batch warns about an invalid value once.
+    """
+    if not value:
+        return DEFAULT_AUTO_THRESHOLD
+    if not value.isdigit():
+        print(f"Warning: VIBE_PROGRESS_MAX_BYTES must be a whole number of bytes (0 disables), got '{value}'; "
+              f"using {DEFAULT_AUTO_THRESHOLD}")
+        return DEFAULT_AUTO_THRESHOLD
+    return int(value)
+
+
+def get_auto_threshold() -> int:
+    """
+    Get the progress.md size that triggers automatic compaction.
+
+    Returns:
+        Threshold in bytes from VIBE_PROGRESS_MAX_BYTES (0 disables automatic compaction),
+        or the default if it is not set or not a whole number
+    """
+    return _parse_threshold(os.environ.get('VIBE_PROGRESS_MAX_BYTES', '').strip())
+
+
+def auto_compact_progress(project_dir: str) -> Optional[Dict]:
+    """
+    Compact progress.md with the default limits if it grew past the automatic threshold.
+    Errors are reported but never fatal.
+
+    Args:
+        project_dir: Project root directory
+
+    Returns:
+        Compaction report, or None if nothing was archived
+    """
+    threshold = get_auto_threshold()
+    try:
+        if not threshold or os.path.getsize(os.path.join(project_dir, 'dev', 'progress.md')) <= threshold:
+            return None
+        report = compact_progress(project_dir)
+        return report if report["archived"] else None
+    except FileNotFoundError:
+        return None
+    except (OSError, RuntimeError, UnicodeDecodeError) as e:
+        print(f"Warning: Could not compact progress.md: {e}")
+        return None
+
+
+def compact_command(
+    project_dir: str = None,
+    keep_entries: int = DEFAULT_KEEP_ENTRIES,
+    keep_bytes: int = DEFAULT_KEEP_BYTES,
+    dry_run: bool = False
+) -> None:
+    """
+    Compact a project's dev/progress.md and report what was archived.
+
+    Args:
+        project_dir: Project root directory (defaults to the current working directory)
+        keep_entries: Maximum number of entries kept in progress.md
+        keep_bytes: Maximum size of the entries kept in progress.md
+        dry_run: Whether to only report what would be archived
+    """
+    if project_dir is None:
+        project_dir = os.getcwd()
+
+    try:
+        report = compact_progress(project_dir, keep_entries, keep_bytes, dry_run)
+    except FileNotFoundError:
+        print("Error: No dev/progress.md found. Please run 'vibe start' to initialize the project.")
+        sys.exit(1)
+    except (OSError, RuntimeError, UnicodeDecodeError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    if not report["archived"]:
+        print(f"{os.path.relpath(report['path'])} is within limits ({report['kept']} entries, {report['before']} bytes).")
+        return
+    verb = "Would archive" if dry_run else "Archived"
+    print(f"{verb} {report['archived']} entries, keeping {report['kept']}: "
+          f"{report['before']} -> {report['after']} bytes")
+    if report["archive"]:
+        print(f"  updated   {os.path.relpath(report['archive'])}")
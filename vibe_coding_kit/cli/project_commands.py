@@ -6,190 +6,393 @@ Handles project initialization and rules file creation.
 import os
 import re
 import sys
-from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
+from .cache import cached_load
+from .compaction import apply_budgets
+from .editors import (
+    AUTO_EDITOR, STATUS_REMOVED, describe_editor_types, detect_editor_types, find_stale_outputs,
+    get_primary_path, render_outputs,
+)
+from .fileio import STATUS_CREATED, STATUS_UNCHANGED, STATUS_UPDATED, write_if_changed, write_if_missing
+from .history import history_enabled, record_render
+from .org_source import sync_org_template
+from .paths import get_global_rules_path, get_pack_path, get_project_template_path
+from .profiles import language_overrides, resolve_profile
+from .progress_commands import STATUS_COMPACTED, auto_compact_progress
+from .registry import record_project
+from .rule_packs import find_unknown_requests, get_pack_plan, select_packs
+from .stack import detect_stacks
+from .template_engine import Plan, TemplateError, compile_template, render_layers
+from .tracing import traced
 from .utils import get_user_input, get_editor_type
 
 
-def create_project_structure() -> None:
+# Documentation files created in the dev directory, with their initial content
+DEV_DOC_FILES = {
+    "todo.md": "# Todo\n",
+    "progress.md": "# Progress\n",
+    "project_description.md": "# Project Description\n",
+    "code_docs.md": "# Code Documentation\n",
+}
+
+
+@traced("create_project_structure")
+def create_project_structure(project_dir: str = None) -> Dict[str, str]:
     """
     Create project structure for documentation and code organization.
+    Existing documentation files are left untouched, except that an oversized progress.md is compacted.
+    
+    Args:
+        project_dir: Project root directory (defaults to the current working directory)
+        
+    Returns:
+        Mapping of documentation file path to its write status ("created", "unchanged" or "compacted")
     """
+    if project_dir is None:
+        project_dir = os.getcwd()
+    
     # Create dev directory for documentation
-    dev_dir = os.path.join(os.getcwd(), "dev")
+    dev_dir = os.path.join(project_dir, "dev")
     os.makedirs(dev_dir, exist_ok=True)
     
     # Create documentation files
-    for filename in ["todo.md", "progress.md", "project_description.md", "code_docs.md"]:
+    statuses = {}
+    for filename, initial_content in DEV_DOC_FILES.items():
         file_path = os.path.join(dev_dir, filename)
-        if not os.path.exists(file_path):
-            with open(file_path, 'w', encoding='utf-8') as f:
-                if filename == "todo.md":
-                    f.write("# Todo\n")
-                elif filename == "progress.md":
-                    f.write("# Progress\n")
-                elif filename == "project_description.md":
-                    f.write("# Project Description\n")
-                elif filename == "code_docs.md":
-                    f.write("# Code Documentation\n")
+        statuses[file_path] = write_if_missing(file_path, initial_content)
+    
+    if auto_compact_progress(project_dir):
+        statuses[os.path.join(dev_dir, "progress.md")] = STATUS_COMPACTED
+    
+    return statuses
+
+def print_write_statuses(statuses: Dict[str, str]) -> None:
+    """
+    Print one "<status> <path>" line per written file, so automation can tell no-op runs from updates.
+    
+    Args:
+        statuses: Mapping of file path to write status
+    """
+    for file_path, status in statuses.items():
+        print(f"  {status:<9} {os.path.relpath(file_path)}")
+
+
+DEFAULT_GLOBAL_RULES = {
+    "communication_language": "English",
+    "code_comment_language": "English"
+}
+
 
+def _parse_global_rules(global_rules_path: str) -> Dict:
+    """
+    Parse global rules from a global_rules_template.md file.
+    
+    Args:
+        global_rules_path: Path to the global rules file
+        
+    Returns:
+        Dictionary of global rules
+    """
+    if not os.path.exists(global_rules_path):
+        return dict(DEFAULT_GLOBAL_RULES)
+    
+    with open(global_rules_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    
+    # Extract rules using regex patterns for Markdown format
+    comm_lang_match = re.search(r'communication_language:\s*(.*?)$', content, re.MULTILINE)
+    code_lang_match = re.search(r'code_comment_language:\s*(.*?)$', content, re.MULTILINE)
+    
+    return {
+        "communication_language": comm_lang_match.group(1).strip() if comm_lang_match else "English",
+        "code_comment_language": code_lang_match.group(1).strip() if code_lang_match else "English"
+    }
+
+
+@traced("get_global_rules")
 def get_global_rules() -> Dict:
     """
     Get global rules from global_rules_template.md file.
+    The parsed result is cached until the file changes.
     
     Returns:
         Dictionary of global rules
     """
-    # Get package directory path
-    package_dir = os.path.dirname(os.path.abspath(__file__))
-    base_dir = os.path.normpath(os.path.join(package_dir, '..', '..'))
-    global_rules_path = os.path.join(base_dir, 'templates', 'global_rules_template.md')
+    try:
+        return dict(cached_load('global_rules', get_global_rules_path(), _parse_global_rules))
+    except Exception as e:
+        print(f"Error reading global rules: {e}")
+        return dict(DEFAULT_GLOBAL_RULES)
+
+
+# Built-in global layer: document header and language rules
+GLOBAL_LAYER_TEMPLATE = (
+    "# Project Rules\n\n"
+    "## Language Rules\n\n"
+    "communication_language: User prefers to use {{communication_language}} to communicate.\n"
+    "code_comment_language: All code (including codes, comments, plotting information) should be in "
+    "{{code_comment_language}} no matter what language is used to communicate.\n\n"
+)
+
+_global_layer_plan = None
+
+
+def _compile_layer_file(template_path: str) -> Plan:
+    """
+    Read a layer template, strip its top-level header and compile it.
     
-    if not os.path.exists(global_rules_path):
-        return {
-            "communication_language": "English",
-            "code_comment_language": "English"
-        }
+    Args:
+        template_path: Path to the layer template
+        
+    Returns:
+        Render plan, empty if the template does not exist
+    """
+    if not os.path.exists(template_path):
+        return []
+    
+    with open(template_path, 'r', encoding='utf-8') as f:
+        template_content = f.read()
+    
+    # Skip header if it exists
+    if template_content.startswith('# '):
+        template_content = '\n'.join(template_content.split('\n')[1:])
     
-    # Parse the global rules markdown file
     try:
-        with open(global_rules_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Extract rules using regex patterns for Markdown format
-        comm_lang_match = re.search(r'communication_language:\s*(.*?)$', content, re.MULTILINE)
-        code_lang_match = re.search(r'code_comment_language:\s*(.*?)$', content, re.MULTILINE)
+        return compile_template(template_content)
+    except TemplateError as e:
+        print(f"Warning: {template_path}: {e}; using the template as plain text.")
+        return [template_content]
+
+
+def get_layer_plan(template_path: str) -> Plan:
+    """
+    Get the compiled plan of a layer template.
+    The plan is cached until the template file changes.
+    
+    Args:
+        template_path: Path to the layer template
         
-        return {
-            "communication_language": comm_lang_match.group(1).strip() if comm_lang_match else "English",
-            "code_comment_language": code_lang_match.group(1).strip() if code_lang_match else "English"
-        }
+    Returns:
+        Render plan, empty if the template does not exist or cannot be read
+    """
+    try:
+        return cached_load('template_plan', template_path, _compile_layer_file)
     except Exception as e:
-        print(f"Error reading global rules: {e}")
-        return {
-            "communication_language": "English",
-            "code_comment_language": "English"
-        }
+        print(f"Warning: Could not read template file: {e}")
+        return []
+
+
+def get_rules_layers(stacks: Iterable[str] = (), packs: Iterable[str] = ()) -> List[Plan]:
+    """
+    Get the compiled layers of a project rules file: global, organisation, project,
+    then the rule pack of each stack (stacks without a pack add nothing) and the selected plugin packs.
+    
+    Args:
+        stacks: Stacks detected in the project, e.g. ["python"]
+        packs: Plugin pack names or tags chosen for the project
+    
+    Returns:
+        List of render plans in rendering order
+    """
+    global _global_layer_plan
+    if _global_layer_plan is None:
+        _global_layer_plan = compile_template(GLOBAL_LAYER_TEMPLATE)
+    layers = [
+        _global_layer_plan,
+        get_layer_plan(sync_org_template()),
+        get_layer_plan(get_project_template_path()),
+    ]
+    layers.extend(get_layer_plan(get_pack_path(stack)) for stack in sorted(stacks))
+    layers.extend(get_pack_plan(pack) for pack in select_packs(stacks, packs))
+    return layers
 
 
-def create_project_rules_file(editor_type: str = "windsurf") -> str:
+@traced("render_project_rules")
+def render_project_rules(
+    communication_language: str = None,
+    code_comment_language: str = None,
+    context: Optional[Dict] = None,
+    stacks: Iterable[str] = (),
+    packs: Iterable[str] = ()
+) -> str:
     """
-    Create project rules file for Windsurf or Cursor based on global settings.
+    Render project rules content from global settings and the template layers.
     
     Args:
-        editor_type: The editor type ("windsurf" or "cursor")
+        communication_language: Communication language override (global setting if not given)
+        code_comment_language: Code comment language override (global setting if not given)
+        context: Extra placeholder and section values for the templates
+        stacks: Stacks whose rule packs are appended, e.g. ["python"]
+        packs: Plugin pack names or tags chosen for the project
+    
+    Returns:
+        Rendered rules content, with the scoped sections (each compacted as its own shard) last
+        
+    Raises:
+        TokenBudgetError: If the content exceeds the token budget in strict mode
+    """
+    render_context = get_global_rules()
+    if context:
+        render_context.update(context)
+    if communication_language is not None:
+        render_context['communication_language'] = communication_language
+    if code_comment_language is not None:
+        render_context['code_comment_language'] = code_comment_language
+    
+    # Compaction stage: the root rules file and every scoped shard must each fit the token budget
+    return apply_budgets(render_layers(get_rules_layers(stacks, packs), render_context))
+
+
+@traced("create_project_rules_files")
+def create_project_rules_files(
+    editor_type: str = "windsurf",
+    project_dir: str = None,
+    rules_content: str = None
+) -> Dict[str, str]:
+    """
+    Write the project rules for every selected editor from one rendered body.
+    Scoped sections are written as shards next to the root rules file; generated rule files
+    whose section or scope no longer exists are removed.
+    
+    Args:
+        editor_type: Comma-separated editor types ("windsurf", "cursor", "cursor-mdc")
+        project_dir: Project root directory (defaults to the current working directory)
+        rules_content: Pre-rendered rules content, rendered from global settings if not given
         
     Returns:
-        Path to the created rules file
+        Mapping of output path to write status ("created", "updated", "unchanged" or "removed")
     """
-    # Get global rules
-    global_rules = get_global_rules()
+    if project_dir is None:
+        project_dir = os.getcwd()
+    if rules_content is None:
+        rules_content = render_project_rules()
     
-    # Create project rules in Markdown format
-    project_rules_content = "# Project Rules\n\n"
-    project_rules_content += "## Language Rules\n\n"
-    project_rules_content += f"communication_language: User prefers to use {global_rules.get('communication_language', 'English')} to communicate.\n"
-    project_rules_content += f"code_comment_language: All code (including codes, comments, plotting information) should be in {global_rules.get('code_comment_language', 'English')} no matter what language is used to communicate.\n\n"
+    outputs = render_outputs(editor_type, rules_content)
+    statuses = {}
+    for rel_path, content in outputs:
+        file_path = os.path.join(project_dir, rel_path)
+        if os.path.dirname(rel_path):
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        # Write rules to file only if the content changed
+        statuses[file_path] = write_if_changed(file_path, content)
     
-    # Add project rules template content if exists
-    templates_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'templates')
-    template_path = os.path.join(templates_dir, 'project_rules_template.md')
-    if os.path.exists(template_path):
+    for stale_path in find_stale_outputs(project_dir, editor_type, outputs):
         try:
-            with open(template_path, 'r', encoding='utf-8') as f:
-                template_content = f.read()
-            
-            # Skip header if it exists
-            if template_content.startswith('# '):
-                template_content = '\n'.join(template_content.split('\n')[1:])
-            
-            project_rules_content += template_content
-        except Exception as e:
-            print(f"Warning: Could not read template file: {e}")
+            os.remove(stale_path)
+        except FileNotFoundError:
+            # A concurrent run removed it first
+            continue
+        statuses[stale_path] = STATUS_REMOVED
     
-    # Create rules file path
-    file_name = ".windsurfrules" if editor_type == "windsurf" else ".cursorrules"
-    rules_file_path = os.path.join(os.getcwd(), file_name)
+    # Keep a revision of the rules the project now has, unless nothing changed
+    if history_enabled() and any(status != STATUS_UNCHANGED for status in statuses.values()):
+        record_render(project_dir, outputs)
+    return statuses
+
+
+def summarize_statuses(statuses: Dict[str, str]) -> str:
+    """
+    Combine the write statuses of a project's rules outputs into one.
     
-    # Write rules to file
-    with open(rules_file_path, 'w', encoding='utf-8') as f:
-        f.write(project_rules_content)
+    Args:
+        statuses: Mapping of output path to write status
+        
+    Returns:
+        STATUS_CREATED if every output was created, STATUS_UNCHANGED if none changed, STATUS_UPDATED otherwise
+    """
+    changed = [status for status in statuses.values() if status != STATUS_UNCHANGED]
+    if not changed:
+        return STATUS_UNCHANGED
+    if len(changed) == len(statuses) and all(status == STATUS_CREATED for status in changed):
+        return STATUS_CREATED
+    return STATUS_UPDATED
+
+
+def create_project_rules_file(
+    editor_type: str = "windsurf",
+    project_dir: str = None,
+    rules_content: str = None
+) -> Tuple[str, str]:
+    """
+    Create project rules files for Windsurf and/or Cursor based on global settings.
     
-    return rules_file_path
+    Args:
+        editor_type: Comma-separated editor types ("windsurf", "cursor", "cursor-mdc")
+        project_dir: Project root directory (defaults to the current working directory)
+        rules_content: Pre-rendered rules content, rendered from global settings if not given
+        
+    Returns:
+        Tuple of (path of the first editor's rules, combined write status: "created", "updated" or "unchanged")
+    """
+    if project_dir is None:
+        project_dir = os.getcwd()
+    if rules_content is None:
+        rules_content = render_project_rules()
+    statuses = create_project_rules_files(editor_type, project_dir, rules_content)
+    return get_primary_path(project_dir, editor_type, rules_content), summarize_statuses(statuses)
 
 
 def create_project_rules_file_with_overrides(
     editor_type: str = "windsurf",
     communication_language: str = "English",
-    code_comment_language: str = "English"
-) -> str:
+    code_comment_language: str = "English",
+    project_dir: str = None
+) -> Tuple[str, str]:
     """
     Create project rules file with custom overrides for global settings.
     
     Args:
-        editor_type: The editor type ("windsurf" or "cursor")
+        editor_type: Comma-separated editor types ("windsurf", "cursor", "cursor-mdc")
         communication_language: User's preferred communication language for this project
         code_comment_language: User's preferred code comment language for this project
+        project_dir: Project root directory (defaults to the current working directory)
         
     Returns:
-        Path to the created rules file
-    """
-    # Create project rules in Markdown format
-    project_rules_content = "# Project Rules\n\n"
-    project_rules_content += "## Language Rules\n\n"
-    project_rules_content += f"communication_language: User prefers to use {communication_language} to communicate.\n"
-    project_rules_content += f"code_comment_language: All code (including codes, comments, plotting information) should be in {code_comment_language} no matter what language is used to communicate.\n\n"
-    
-    # Add project rules template content if exists
-    templates_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'templates')
-    template_path = os.path.join(templates_dir, 'project_rules_template.md')
-    if os.path.exists(template_path):
-        try:
-            with open(template_path, 'r', encoding='utf-8') as f:
-                template_content = f.read()
-            
-            # Skip header if it exists
-            if template_content.startswith('# '):
-                template_content = '\n'.join(template_content.split('\n')[1:])
-            
-            project_rules_content += template_content
-        except Exception as e:
-            print(f"Warning: Could not read template file: {e}")
-    
-    # Create rules file path
-    file_name = ".windsurfrules" if editor_type == "windsurf" else ".cursorrules"
-    rules_file_path = os.path.join(os.getcwd(), file_name)
-    
-    # Write rules to file
-    with open(rules_file_path, 'w', encoding='utf-8') as f:
-        f.write(project_rules_content)
-    
-    return rules_file_path
+        Tuple of (path to the rules file, write status: "created", "updated" or "unchanged")
+    """
+    rules_content = render_project_rules(communication_language, code_comment_language)
+    return create_project_rules_file(editor_type, project_dir, rules_content)
 
 
-def project_start_command() -> None:
+def project_start_command(packs: Iterable[str] = ()) -> None:
     """
     Initialize a project for vibe-coding-kit.
-    Create project structure and rules file.
+    Create project structure and rules file, with the settings of the project's profile if it has one.
+    
+    Args:
+        packs: Plugin pack names or tags to add to the project's rules
     """
     print("\nInitializing vibe-coding-kit for this project...")
+    project_dir = os.getcwd()
+    profile = resolve_profile(project_dir)
     
-    # Get editor type
-    editor_type = get_editor_type()
+    # Get editor types, suggesting the ones the project already uses
+    detected = detect_editor_types(project_dir)
+    editor_type = detected if profile["editor"] == AUTO_EDITOR else profile["editor"]
+    editor_type = editor_type or get_editor_type(detected)
     
     # Create project structure (documentation and source directories)
-    create_project_structure()
+    doc_statuses = create_project_structure()
     print("Project structure initialization successful.")
-    print("Created 'dev' directory and documentation files.")
+    print_write_statuses(doc_statuses)
     
-    # Create project rules file
-    rules_file_path = create_project_rules_file(editor_type)
-    print(f"Created project rules file: {rules_file_path}")
-    print(f"Editor type: {editor_type.capitalize()}")
+    # Pick stack-specific rule packs from the languages the project uses
+    stacks = profile["stacks"] if profile["stacks"] is not None else detect_stacks(project_dir)
+    if stacks:
+        print(f"Detected stack: {', '.join(stacks)}")
+    
+    packs = sorted(set(packs) | set(profile["packs"] or ()))
+    for name in find_unknown_requests(packs):
+        print(f"Warning: No installed rule pack is named or tagged '{name}'.")
+    
+    # Create project rules files for every selected editor from a single render
+    overrides = language_overrides(profile)
+    rules_content = render_project_rules(**(overrides or {}), stacks=stacks, packs=packs)
+    print_write_statuses(create_project_rules_files(editor_type, project_dir, rules_content))
+    record_project(project_dir, editor_type, rules_content, overrides, stacks=stacks, packs=packs)
+    print(f"Editor type: {describe_editor_types(editor_type)}")
     
     # Check if global rules file exists
-    base_dir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
-    global_rules_path = os.path.join(base_dir, 'templates', 'global_rules_template.md')
-    if not os.path.exists(global_rules_path):
+    if not os.path.exists(get_global_rules_path()):
         print(f"\nHint: You have not set global preferences. Run 'vibe start --global' to set.")
@@ -0,0 +1,165 @@
+"""
+Propagate command implementation for vibe-coding-kit CLI.
+Re-renders every registered project derived from the global rules after a global change.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .editors import get_primary_path
+from .fileio import STATUS_UNCHANGED, content_digest
+from .project_commands import create_project_rules_file, render_project_rules
+from .registry import find_stale_projects, make_entry, record_projects
+
+# Registry entries are flushed in chunks, so an interrupted run keeps its progress
+FLUSH_EVERY = 100
+
+# Renders (rules content, digest) for a list of stacks, optional language overrides and plugin packs
+Renderer = Callable[..., Tuple[str, str]]
+
+
+def make_renderer() -> Renderer:
+    """
+    Create a thread-safe renderer that renders the rules once per distinct stacks, overrides and packs,
+    so projects sharing them share one render.
+
+    Returns:
+        Function taking (stacks, overrides=None, packs=()) and returning (rules content, digest)
+    """
+    rendered: Dict[str, Tuple[str, str]] = {}
+    lock = threading.Lock()
+
+    def render(
+        stacks: List[str],
+        overrides: Optional[Dict[str, str]] = None,
+        packs: List[str] = ()
+    ) -> Tuple[str, str]:
+        overrides = overrides or {}
+        key = json.dumps([sorted(stacks), overrides, sorted(packs)], sort_keys=True)
+        with lock:
+            if key not in rendered:
+                content = render_project_rules(
+                    overrides.get("communication_language"),
+                    overrides.get("code_comment_language"),
+                    stacks=stacks,
+                    packs=packs
+                )
+                rendered[key] = (content, content_digest(content.encode('utf-8')))
+            return rendered[key]
+
+    return render
+
+
+def rerender_project(
+    entry: Dict,
+    rules_content: str,
+    rules_digest: str,
+    trust_registry: bool = True
+) -> Tuple[Dict, str, str]:
+    """
+    Re-render one registered project's rules file if its content would change.
+
+    Args:
+        entry: Registry entry of the project
+        rules_content: Rendered rules content for the project
+        rules_digest: Digest of the rendered content
+        trust_registry: Whether to skip the write when the registry says the
+            last render already produced this content
+
+    Returns:
+        Tuple of (entry, status, error message)
+    """
+    if not os.path.isdir(entry["path"]):
+        return entry, "missing", "project directory no longer exists"
+
+    # Output identical to the last render: only the registry digests need refreshing
+    if trust_registry and entry["rules_digest"] == rules_digest and os.path.exists(entry["rules_file"]):
+        return entry, STATUS_UNCHANGED, ""
+
+    try:
+        _, status = create_project_rules_file(entry["editor"], entry["path"], rules_content)
+    except Exception as e:
+        return entry, "failed", str(e)
+    return entry, status, ""
+
+
+def _flush(entries: List[Dict]) -> None:
+    """
+    Record completed projects in the registry and clear the pending list.
+
+    Args:
+        entries: Pending registry entries
+    """
+    if not entries:
+        return
+    try:
+        record_projects(entries)
+    except (sqlite3.Error, OSError) as e:
+        print(f"Warning: Could not update project registry: {e}")
+    del entries[:]
+
+
+def propagate_command(workers: Optional[int] = None) -> int:
+    """
+    Re-render every registered project that follows the global rules and is stale.
+    Completed projects are recorded as they finish, so re-running after an
+    interruption resumes with the projects that are still stale.
+
+    Args:
+        workers: Maximum number of concurrent worker threads
+
+    Returns:
+        Number of projects that failed
+    """
+    # Projects with overridden languages do not derive from the global rules
+    stale = [entry for entry in find_stale_projects() if entry["overrides"] is None]
+    if not stale:
+        print("\nAll registered projects are up to date.")
+        return 0
+
+    print(f"\nPropagating rules to {len(stale)} stale projects...")
+    # Projects are rendered with the rule packs of the stacks and packs recorded for them
+    render = make_renderer()
+    jobs = [(entry, ) + render(entry["stacks"], packs=entry["packs"]) for entry in stale]
+
+    counts = {}
+    failures = 0
+    pending = []
+    report_every = max(1, len(stale) // 20)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(rerender_project, entry, rules_content, rules_digest)
+            for entry, rules_content, rules_digest in jobs
+        ]
+        try:
+            for done, future in enumerate(as_completed(futures), 1):
+                entry, status, error = future.result()
+                rules_content, rules_digest = render(entry["stacks"], packs=entry["packs"])
+                counts[status] = counts.get(status, 0) + 1
+                if error:
+                    failures += 1
+                    print(f"  {status:<9} {entry['path']}: {error}")
+                else:
+                    pending.append(make_entry(
+                        entry["path"], entry["editor"], get_primary_path(entry["path"], entry["editor"], rules_content),
+                        rules_digest=rules_digest, stacks=entry["stacks"], packs=entry["packs"]
+                    ))
+                if len(pending) >= FLUSH_EVERY:
+                    _flush(pending)
+                if done % report_every == 0 or done == len(stale):
+                    print(f"Progress: {done}/{len(stale)}")
+        except KeyboardInterrupt:
+            for future in futures:
+                future.cancel()
+            _flush(pending)
+            print("\nInterrupted. Run 'vibe reset --propagate' to resume.")
+            raise
+    _flush(pending)
+
+    summary = ", ".join(f"{count} {status}" for status, count in sorted(counts.items()))
+    print(f"\nPropagation complete: {summary}.")
+    return failures
@@ -0,0 +1,317 @@
+"""
+Project registry for vibe-coding-kit CLI.
+Records initialized projects and the template digests their rules were rendered from,
+so staleness can be checked without re-rendering or walking the filesystem.
+"""
+
+import json
+import os
+import sqlite3
+import time
+from typing import Dict, Iterable, List, Optional
+
+from .cache import cached_load
+from .editors import get_primary_path
+from .fileio import content_digest, file_digest
+from .paths import (
+    get_global_rules_path, get_org_template_path, get_pack_path, get_packs_dir, get_project_template_path,
+    get_user_data_dir,
+)
+from .rule_packs import pack_digest_key, select_packs
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    path TEXT PRIMARY KEY,
+    editor TEXT NOT NULL,
+    rules_file TEXT NOT NULL,
+    global_digest TEXT NOT NULL,
+    template_digest TEXT NOT NULL,
+    rules_digest TEXT,
+    overrides TEXT,
+    updated_at REAL NOT NULL,
+    stacks TEXT,
+    packs TEXT
+)
+"""
+
+# Columns added after the first release, with their definitions, for migrating older registries
+_ADDED_COLUMNS = {
+    "stacks": "TEXT",
+    "packs": "TEXT",
+}
+
+
+def get_registry_path() -> str:
+    """
+    Get the path to the registry database.
+
+    Returns:
+        Path to registry.sqlite3 under the user data dir
+    """
+    return os.path.join(get_user_data_dir(), 'registry.sqlite3')
+
+
+def connect() -> sqlite3.Connection:
+    """
+    Open the registry database, creating it if needed.
+
+    Returns:
+        SQLite connection with rows accessible by column name
+    """
+    registry_path = get_registry_path()
+    os.makedirs(os.path.dirname(registry_path), exist_ok=True)
+    conn = sqlite3.connect(registry_path, timeout=30)
+    conn.row_factory = sqlite3.Row
+    conn.execute(_SCHEMA)
+    columns = {row["name"] for row in conn.execute("PRAGMA table_info(projects)")}
+    for column, definition in _ADDED_COLUMNS.items():
+        if column not in columns:
+            conn.execute(f"ALTER TABLE projects ADD COLUMN {column} {definition}")
+    return conn
+
+
+def get_source_paths() -> List[str]:
+    """
+    Get the files project rules are rendered from.
+
+    Returns:
+        Paths of the global rules, organisation template, project template and existing rule packs
+    """
+    try:
+        pack_names = sorted(name for name in os.listdir(get_packs_dir()) if name.endswith('.md'))
+    except OSError:
+        pack_names = []
+    return [get_global_rules_path(), get_org_template_path(), get_project_template_path()] + [
+        os.path.join(get_packs_dir(), name) for name in pack_names
+    ]
+
+
+def _source_digest(path: str) -> str:
+    """
+    Get the cached digest of a source file.
+
+    Returns:
+        SHA-256 hex digest, or an empty string if the file does not exist
+    """
+    return cached_load('digest', path, lambda source_path: file_digest(source_path) or "")
+
+
+def source_digests(stacks: Iterable[str] = (), packs: Iterable[str] = ()) -> Dict[str, str]:
+    """
+    Get digests of the current rules sources. Cached until the source files change.
+
+    Args:
+        stacks: Stacks whose rule packs the rules were rendered with
+        packs: Plugin pack names or tags chosen for the project
+
+    Returns:
+        Dictionary with "global" and "template" digests (empty string if a file does not exist).
+        The template digest covers the organisation layer and the rule packs too, when they exist;
+        plugin packs count by name and version, so their content is not loaded.
+    """
+    template_digest = _source_digest(get_project_template_path())
+    org_digest = _source_digest(get_org_template_path())
+    if org_digest:
+        template_digest = content_digest(f"{org_digest}:{template_digest}".encode('utf-8'))
+    pack_digests = [
+        f"{stack}={digest}" for stack, digest in
+        ((stack, _source_digest(get_pack_path(stack))) for stack in sorted(stacks)) if digest
+    ]
+    pack_digests.extend(pack_digest_key(pack) for pack in select_packs(stacks, packs))
+    if pack_digests:
+        template_digest = content_digest(f"{template_digest}:{':'.join(pack_digests)}".encode('utf-8'))
+    return {
+        "global": _source_digest(get_global_rules_path()),
+        "template": template_digest,
+    }
+
+
+def make_entry(
+    project_dir: str,
+    editor_type: str,
+    rules_file_path: str,
+    overrides: Optional[Dict[str, str]] = None,
+    rules_digest: Optional[str] = None,
+    stacks: Iterable[str] = (),
+    packs: Iterable[str] = ()
+) -> Dict:
+    """
+    Build a registry entry for a project whose rules file was just rendered.
+
+    Args:
+        project_dir: Project root directory
+        editor_type: Comma-separated editor types
+        rules_file_path: Path to the first output file (see get_primary_path())
+        overrides: Project-specific language overrides, None if the project follows global rules
+        rules_digest: Digest of the rendered rules content (None if unknown: the next re-render rewrites the files)
+        stacks: Stacks whose rule packs the rules were rendered with
+        packs: Plugin pack names or tags chosen for the project
+
+    Returns:
+        Registry entry dictionary
+    """
+    stacks = sorted(stacks)
+    packs = sorted(packs)
+    digests = source_digests(stacks, packs)
+    return {
+        "path": os.path.abspath(project_dir),
+        "editor": editor_type,
+        "rules_file": os.path.abspath(rules_file_path),
+        "global_digest": digests["global"],
+        "template_digest": digests["template"],
+        "rules_digest": rules_digest,
+        "overrides": overrides,
+        "updated_at": time.time(),
+        "stacks": stacks,
+        "packs": packs,
+    }
+
+
+def record_projects(entries: Iterable[Dict]) -> None:
+    """
+    Insert or update registry entries in a single transaction.
+
+    Args:
+        entries: Entries built with make_entry()
+    """
+    rows = [
+        (
+            entry["path"], entry["editor"], entry["rules_file"], entry["global_digest"],
+            entry["template_digest"], entry["rules_digest"],
+            json.dumps(entry["overrides"]) if entry["overrides"] is not None else None,
+            entry["updated_at"], ','.join(entry["stacks"]), ','.join(entry["packs"]),
+        )
+        for entry in entries
+    ]
+    conn = connect()
+    try:
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO projects "
+                "(path, editor, rules_file, global_digest, template_digest, rules_digest, overrides, updated_at, "
+                "stacks, packs) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+    finally:
+        conn.close()
+    # Keep the shell cd hook from warning about projects that were just re-rendered
+    from .shell_manifest import mark_projects_fresh
+    mark_projects_fresh(row[0] for row in rows)
+
+
+def record_project(
+    project_dir: str,
+    editor_type: str,
+    rules_content: str,
+    overrides: Optional[Dict[str, str]] = None,
+    stacks: Iterable[str] = (),
+    packs: Iterable[str] = ()
+) -> None:
+    """
+    Record a rendered project in the registry. Registry errors are reported but never fatal.
+
+    Args:
+        project_dir: Project root directory
+        editor_type: Comma-separated editor types
+        rules_content: Rendered rules content the project's files were written from
+        overrides: Project-specific language overrides, None if the project follows global rules
+        stacks: Stacks whose rule packs the rules were rendered with
+        packs: Plugin pack names or tags chosen for the project
+    """
+    try:
+        record_projects([make_entry(
+            project_dir, editor_type, get_primary_path(project_dir, editor_type, rules_content), overrides,
+            rules_digest=content_digest(rules_content.encode('utf-8')), stacks=stacks, packs=packs
+        )])
+    except (sqlite3.Error, OSError) as e:
+        print(f"Warning: Could not update project registry: {e}")
+
+
+def _parse_row(row: sqlite3.Row) -> Dict:
+    """
+    Turn a registry row into an entry, decoding the overrides, stacks and packs columns.
+    """
+    entry = dict(row)
+    entry["overrides"] = json.loads(entry["overrides"]) if entry["overrides"] else None
+    entry["stacks"] = entry["stacks"].split(',') if entry["stacks"] else []
+    entry["packs"] = entry["packs"].split(',') if entry["packs"] else []
+    return entry
+
+
+def list_projects() -> List[Dict]:
+    """
+    List all registered projects.
+
+    Returns:
+        Registry entries sorted by project path
+    """
+    conn = connect()
+    try:
+        rows = conn.execute("SELECT * FROM projects ORDER BY path").fetchall()
+    finally:
+        conn.close()
+    return [_parse_row(row) for row in rows]
+
+
+def get_project(project_dir: str) -> Optional[Dict]:
+    """
+    Look up a registered project. Registry errors are treated as "not registered".
+
+    Args:
+        project_dir: Project root directory
+
+    Returns:
+        Registry entry, or None if the project is not registered
+    """
+    try:
+        conn = connect()
+        try:
+            row = conn.execute("SELECT * FROM projects WHERE path = ?", (os.path.abspath(project_dir),)).fetchone()
+        finally:
+            conn.close()
+    except (sqlite3.Error, OSError):
+        return None
+    return _parse_row(row) if row is not None else None
+
+
+def get_stale_reasons(entry: Dict, digests: Dict[str, str]) -> List[str]:
+    """
+    Compare a registry entry against the current source digests.
+
+    Args:
+        entry: Registry entry
+        digests: Current digests from source_digests() (the template digest is recomputed
+            for entries rendered with rule packs)
+
+    Returns:
+        List of reasons the project is stale (empty if up to date)
+    """
+    reasons = []
+    if entry["stacks"] or entry["packs"]:
+        template_digest = source_digests(entry["stacks"], entry["packs"])["template"]
+    else:
+        template_digest = digests["template"]
+    if entry["template_digest"] != template_digest:
+        reasons.append("project template changed")
+    # Projects with overridden languages do not depend on the global rules
+    if entry["overrides"] is None and entry["global_digest"] != digests["global"]:
+        reasons.append("global rules changed")
+    return reasons
+
+
+def find_stale_projects() -> List[Dict]:
+    """
+    Find registered projects whose rules were rendered from outdated sources.
+
+    Returns:
+        Stale registry entries, each with an added "reasons" list
+    """
+    digests = source_digests()
+    stale = []
+    for entry in list_projects():
+        reasons = get_stale_reasons(entry, digests)
+        if reasons:
+            entry["reasons"] = reasons
+            stale.append(entry)
+    return stale
+
@@ -0,0 +1,289 @@
+"""
+Plugin rule packs for vibe-coding-kit CLI.
+Discovers rule packs that installed packages register under the "vibe_coding_kit.rule_packs" entry point
+group, indexes their metadata in a cached manifest and loads a pack's content only when a project selects it.
+
+A pack is a dict exported by the plugin, e.g. in setup.py:
+    entry_points={"vibe_coding_kit.rule_packs": ["django = my_rules.packs:DJANGO"]}
+with DJANGO = {"tags": ["web"], "languages": ["python"], "priority": 40,
+"description": "...", "content": <str or function returning str>} (or "path" to a Markdown
+file next to the module instead of "content").
+"""
+
+import importlib
+import json
+import os
+import sys
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .compaction import DEFAULT_PRIORITY
+from .fileio import atomic_write
+from .paths import get_user_cache_dir
+from .shards import split_sections
+from .template_engine import Plan, TemplateError, compile_template
+
+PLUGIN_GROUP = "vibe_coding_kit.rule_packs"
+
+# Bumped when the manifest format changes, so old manifests are rebuilt
+MANIFEST_VERSION = 2
+
+# In-process manifest: (environment fingerprint, packs)
+_manifest: Optional[Tuple[List, List[Dict]]] = None
+# Compiled pack content: "entry point@version" -> plan
+_plans: Dict[str, Plan] = {}
+
+
+def get_manifest_path() -> str:
+    """
+    Get the path to the cached rule pack manifest.
+
+    Returns:
+        Path to rule_packs.json under the user cache dir
+    """
+    return os.path.join(get_user_cache_dir(), 'rule_packs.json')
+
+
+def _environment_fingerprint() -> List:
+    """
+    Fingerprint the import path: installing or removing a package changes the mtime of its
+    site-packages directory, which invalidates the manifest without reading any package metadata.
+    The working directory (on the path under `python -m`) changes all the time and is left out.
+    """
+    cwd = os.getcwd()
+    fingerprint = []
+    for entry in sys.path:
+        if not entry or entry == cwd:
+            continue
+        try:
+            fingerprint.append([entry, os.stat(entry).st_mtime_ns])
+        except OSError:
+            continue
+    return fingerprint
+
+
+def _iter_entry_points() -> List[Tuple]:
+    """
+    List the entry points registered in PLUGIN_GROUP with the distribution providing each, as
+    (entry point, "module:attribute", distribution name, version) tuples.
+    Entry points only know their distribution from Python 3.10, so the distributions are walked instead;
+    before Python 3.8 setuptools' pkg_resources is used.
+    """
+    try:
+        from importlib.metadata import distributions
+    except ImportError:
+        try:
+            import pkg_resources
+        except ImportError:
+            print("Warning: Rule pack plugins need Python 3.8 or setuptools installed; none are loaded.")
+            return []
+        return [
+            (point, f"{point.module_name}:{'.'.join(point.attrs)}", point.dist.project_name, point.dist.version)
+            for point in pkg_resources.iter_entry_points(PLUGIN_GROUP)
+        ]
+
+    points = []
+    seen = set()
+    for dist in distributions():
+        name = dist.metadata["Name"]
+        # A distribution found twice on the import path is used from the first entry, like imports are
+        if name in seen:
+            continue
+        seen.add(name)
+        points.extend(
+            (point, point.value, name, dist.version) for point in dist.entry_points if point.group == PLUGIN_GROUP
+        )
+    return points
+
+
+def _describe(entry_point, value: str, dist: str, version: str) -> Dict:
+    """
+    Load a pack's metadata from its entry point. Content functions and files are not read.
+    """
+    pack = entry_point.load()
+    if not isinstance(pack, dict):
+        raise TypeError("a rule pack must be a dict")
+    if pack.get("content") is None and not pack.get("path"):
+        raise ValueError("a rule pack needs 'content' or 'path'")
+    return {
+        "name": str(pack.get("name") or entry_point.name),
+        "entry_point": value,
+        "dist": dist,
+        "version": version,
+        "tags": sorted(str(tag).lower() for tag in pack.get("tags", ())),
+        "languages": sorted(str(language).lower() for language in pack.get("languages", ())),
+        "priority": int(pack.get("priority", DEFAULT_PRIORITY)),
+        "description": str(pack.get("description", "")),
+    }
+
+
+def _build_manifest() -> List[Dict]:
+    """
+    Index every registered pack. Broken plugins are reported and skipped.
+    """
+    packs = []
+    for entry_point, value, dist, version in _iter_entry_points():
+        try:
+            packs.append(_describe(entry_point, value, dist, version))
+        except Exception as e:
+            print(f"Warning: Skipping rule pack '{entry_point.name}' ({value}): {e}")
+    return sorted(packs, key=lambda pack: pack["name"])
+
+
+def load_manifest(refresh: bool = False) -> List[Dict]:
+    """
+    Get the metadata of every registered rule pack.
+    The manifest is cached in memory and on disk until a directory on the import path changes,
+    so plugins are only imported when packages are installed or removed.
+
+    Args:
+        refresh: Whether to rebuild the manifest even if it looks current
+
+    Returns:
+        Pack metadata dicts with "name", "entry_point", "dist", "version", "tags",
+        "languages", "priority" and "description", sorted by name
+    """
+    global _manifest
+    fingerprint = _environment_fingerprint()
+    if not refresh and _manifest is not None and _manifest[0] == fingerprint:
+        return _manifest[1]
+
+    manifest_path = get_manifest_path()
+    if not refresh:
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+            if stored.get("version") == MANIFEST_VERSION and stored.get("fingerprint") == fingerprint:
+                _manifest = (fingerprint, stored["packs"])
+                return stored["packs"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+    packs = _build_manifest()
+    _manifest = (fingerprint, packs)
+    try:
+        os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+        atomic_write(manifest_path, json.dumps(
+            {"version": MANIFEST_VERSION, "fingerprint": fingerprint, "packs": packs}, indent=2
+        ))
+    except OSError:
+        pass
+    return packs
+
+
+def select_packs(stacks: Iterable[str] = (), requested: Iterable[str] = ()) -> List[Dict]:
+    """
+    Select the plugin packs for a project: packs for one of its stacks, and packs requested by name or tag.
+
+    Args:
+        stacks: Stacks detected in the project, e.g. ["python"]
+        requested: Pack names or tags chosen for the project
+
+    Returns:
+        Selected pack metadata, highest priority first
+    """
+    stacks = set(stacks)
+    requested = {name.lower() for name in requested}
+    if not stacks and not requested:
+        return []
+    selected = [
+        pack for pack in load_manifest()
+        if stacks.intersection(pack["languages"]) or pack["name"].lower() in requested
+        or requested.intersection(pack["tags"])
+    ]
+    return sorted(selected, key=lambda pack: (-pack["priority"], pack["name"]))
+
+
+def find_unknown_requests(requested: Iterable[str]) -> List[str]:
+    """
+    Find requested pack names or tags that match no registered pack.
+
+    Args:
+        requested: Pack names or tags
+
+    Returns:
+        Requests without a matching pack
+    """
+    known = set()
+    for pack in load_manifest():
+        known.add(pack["name"].lower())
+        known.update(pack["tags"])
+    return [name for name in requested if name.lower() not in known]
+
+
+def pack_digest_key(pack: Dict) -> str:
+    """
+    Identify a pack's content for staleness checks without loading it.
+
+    Args:
+        pack: Pack metadata
+
+    Returns:
+        String naming the pack, its distribution and version
+    """
+    return f"{pack['name']}@{pack['dist']}=={pack['version']}"
+
+
+def _with_priority(content: str, priority: int) -> str:
+    """
+    Give the pack's sections its priority, unless a section sets its own.
+    """
+    if priority == DEFAULT_PRIORITY:
+        return content
+    sections = split_sections(content)
+    for lines in sections[1:]:
+        if not any(line.strip().startswith('<!-- vibe:priority') for line in lines):
+            lines.insert(1, f"<!-- vibe:priority={priority} -->")
+    return '\n'.join('\n'.join(lines) for lines in sections)
+
+
+def _load_content(pack: Dict) -> str:
+    """
+    Import a pack's module and read its content.
+    """
+    module_name, _, attribute = pack["entry_point"].partition(':')
+    module = importlib.import_module(module_name.strip())
+    value = module
+    for part in attribute.strip().split('.'):
+        if part:
+            value = getattr(value, part)
+
+    content = value.get("content")
+    if callable(content):
+        content = content()
+    if content is None:
+        path = os.path.join(os.path.dirname(os.path.abspath(module.__file__)), value["path"])
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+    return str(content)
+
+
+def get_pack_plan(pack: Dict) -> Plan:
+    """
+    Get the compiled content of a plugin pack, loading it on first use.
+
+    Args:
+        pack: Pack metadata from the manifest
+
+    Returns:
+        Render plan, empty if the pack cannot be loaded
+    """
+    key = f"{pack['entry_point']}@{pack['version']}"
+    if key in _plans:
+        return _plans[key]
+
+    try:
+        content = _load_content(pack)
+    except Exception as e:
+        print(f"Warning: Could not load rule pack '{pack['name']}': {e}")
+        return []
+    # Skip the pack's title, like the other layers
+    if content.startswith('# '):
+        content = content.split('\n', 1)[1] if '\n' in content else ''
+    content = _with_priority(content.strip('\n') + '\n\n', pack["priority"])
+    try:
+        plan = compile_template(content)
+    except TemplateError as e:
+        print(f"Warning: Rule pack '{pack['name']}': {e}; using it as plain text.")
+        plan = [content]
+    _plans[key] = plan
+    return plan
@@ -0,0 +1,147 @@
+"""
+Client for the vibe-coding-kit render server.
+A small blocking client over a persistent connection, for editor plugins, CI jobs and tests
+that talk to `vibe serve` instead of starting the CLI for every render.
+"""
+
+import http.client
+import json
+import socket
+from typing import Dict, List, Optional
+
+from .serve_commands import DEFAULT_HOST, DEFAULT_PORT, get_default_socket
+from .serve_security import read_token
+
+
+class ServeError(Exception):
+    """
+    Raised when the server answers with an error status.
+    """
+
+    def __init__(self, status: int, message: str):
+        super().__init__(f"{status}: {message}")
+        self.status = status
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """
+    HTTP connection over a Unix socket.
+    """
+
+    def __init__(self, socket_path: str, timeout: float):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+class ServeClient:
+    """
+    Blocking client for `vibe serve`. Not thread-safe: use one client per thread.
+    """
+
+    def __init__(
+        self,
+        socket_path: Optional[str] = None,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        timeout: float = 30.0,
+        token: Optional[str] = None
+    ):
+        """
+        Args:
+            socket_path: Unix socket of the server (defaults to VIBE_SERVE_SOCKET, else TCP is used)
+            host: Server address for TCP
+            port: Server port for TCP
+            timeout: Socket timeout in seconds
+            token: Bearer token for TCP (defaults to the one in the token file the server wrote)
+        """
+        socket_path = socket_path or get_default_socket()
+        self.headers: Dict[str, str] = {}
+        if socket_path:
+            self.connection = _UnixHTTPConnection(socket_path, timeout)
+        else:
+            self.connection = http.client.HTTPConnection(host, port, timeout=timeout)
+            token = token or read_token()
+            if token:
+                self.headers["Authorization"] = f"Bearer {token}"
+
+    def request(self, method: str, path: str, payload: Optional[Dict] = None) -> Dict:
+        """
+        Send a request and decode the JSON response. A connection the server closed is reopened once.
+
+        Args:
+            method: HTTP method
+            path: Request path with query string
+            payload: JSON body
+
+        Returns:
+            Decoded response
+
+        Raises:
+            ServeError: If the server answers with an error status
+            OSError: If the server cannot be reached
+        """
+        body = json.dumps(payload).encode('utf-8') if payload is not None else None
+        headers = dict(self.headers)
+        if body is not None:
+            headers["Content-Type"] = "application/json"
+        for attempt in range(2):
+            try:
+                self.connection.request(method, path, body=body, headers=headers)
+                response = self.connection.getresponse()
+                data = response.read()
+                break
+            except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+                self.connection.close()
+                if attempt:
+                    raise
+        result = json.loads(data.decode('utf-8'))
+        if response.status != 200:
+            raise ServeError(response.status, result.get("error", ""))
+        return result
+
+    def health(self) -> Dict:
+        return self.request("GET", "/health")
+
+    def status(self, show_all: bool = False) -> Dict:
+        return self.request("GET", "/status?all=1" if show_all else "/status")
+
+    def stale(self, project_dir: str) -> Dict:
+        from urllib.parse import quote
+        return self.request("GET", f"/stale?path={quote(project_dir)}")
+
+    def render(
+        self,
+        project_dir: str,
+        editor_type: Optional[str] = None,
+        stacks: Optional[List[str]] = None,
+        packs: Optional[List[str]] = None,
+        overrides: Optional[Dict[str, str]] = None,
+        write: bool = False
+    ) -> Dict:
+        """
+        Render a project's rules on the server.
+
+        Args:
+            project_dir: Project root directory (as seen by the server)
+            editor_type: Comma-separated editor types (the registered or detected ones if not given)
+            stacks: Stacks for rule packs (the registered or detected ones if not given)
+            packs: Plugin pack names or tags (the registered ones if not given)
+            overrides: Language overrides (the registered ones if not given)
+            write: Whether the server should also write the rules files and record the project
+
+        Returns:
+            Render response with "outputs" (relative path -> content) and the effective options
+        """
+        payload = {"path": project_dir, "write": write}
+        for key, value in (("editor", editor_type), ("stacks", stacks), ("packs", packs), ("overrides", overrides)):
+            if value is not None:
+                payload[key] = value
+        return self.request("POST", "/render", payload)
+
+    def close(self) -> None:
+        self.connection.close()
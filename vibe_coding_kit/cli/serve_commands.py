@@ -0,0 +1,369 @@
+"""
+Serve command implementation for vibe-coding-kit CLI.
+Runs a local render server, so editor plugins and CI jobs get rules, status and staleness without
+paying interpreter startup and template parsing on every call; parsed templates stay warm in memory.
+
+The protocol is HTTP/1.1 with JSON bodies and keep-alive, over a Unix socket or localhost TCP:
+    GET  /health              server liveness and request count
+    GET  /status[?all=1]      registered projects with stale reasons, like `vibe status --json`
+    GET  /stale?path=DIR      stale reasons of one registered project
+    POST /render              render rules: {"path", "editor", "stacks", "packs", "overrides", "write"}
+
+Requests with an Origin header or a Host other than localhost are refused, POST bodies must be sent as
+application/json, and over TCP every request needs the bearer token from serve_security.get_token_path().
+Only registered projects can be written to.
+"""
+
+import asyncio
+import json
+import os
+import signal
+import socket
+import stat
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from .serve_security import RequestError, check_request, ensure_token, get_token_path, validate_render_payload
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Largest request body accepted
+MAX_BODY = 1024 * 1024
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    401: "Unauthorized",
+    403: "Forbidden",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    415: "Unsupported Media Type",
+    500: "Internal Server Error",
+}
+
+
+def get_default_socket() -> Optional[str]:
+    """
+    Get the Unix socket the server and its clients use by default.
+
+    Returns:
+        Path from VIBE_SERVE_SOCKET, or None to use localhost TCP
+    """
+    return os.environ.get('VIBE_SERVE_SOCKET') or None
+
+
+def handle_render(payload: Dict) -> Dict:
+    """
+    Render a project's rules. Options missing from the request come from the registry entry of
+    the project, or are detected; nothing is written unless "write" is true, and only for a
+    registered project.
+
+    Args:
+        payload: Request with "path" and optional "editor", "stacks", "packs", "overrides" and "write"
+
+    Returns:
+        Response with the effective options, the content "digest", "outputs" (path relative to the
+        project root -> content) and, when written, "statuses"
+    """
+    from .editors import detect_editor_types, parse_editor_types, render_outputs
+    from .fileio import content_digest
+    from .project_commands import create_project_rules_files, render_project_rules
+    from .registry import get_project, record_project
+    from .stack import detect_stacks
+
+    validate_render_payload(payload)
+    project_dir = os.path.abspath(os.path.expanduser(payload["path"]))
+    if not os.path.isdir(project_dir):
+        raise RequestError(404, f"{project_dir} is not a directory")
+
+    entry = get_project(project_dir)
+    if payload.get("write") and entry is None:
+        raise RequestError(403, f"{project_dir} is not registered: run 'vibe start' there before writing to it")
+    entry = entry or {}
+    try:
+        editor_type = parse_editor_types(
+            payload.get("editor") or entry.get("editor") or detect_editor_types(project_dir) or "windsurf"
+        )
+    except ValueError as e:
+        raise RequestError(400, str(e))
+    stacks = payload.get("stacks")
+    if stacks is None:
+        stacks = entry["stacks"] if entry else detect_stacks(project_dir)
+    packs = payload.get("packs")
+    if packs is None:
+        packs = entry.get("packs", [])
+    overrides = payload.get("overrides", entry.get("overrides"))
+
+    rules_content = render_project_rules(
+        (overrides or {}).get("communication_language"),
+        (overrides or {}).get("code_comment_language"),
+        stacks=stacks,
+        packs=packs
+    )
+    response = {
+        "path": project_dir,
+        "editor": editor_type,
+        "stacks": sorted(stacks),
+        "packs": sorted(packs),
+        "overrides": overrides,
+        "digest": content_digest(rules_content.encode('utf-8')),
+        "outputs": dict(render_outputs(editor_type, rules_content)),
+    }
+    if payload.get("write"):
+        statuses = create_project_rules_files(editor_type, project_dir, rules_content)
+        record_project(project_dir, editor_type, rules_content, overrides, stacks=stacks, packs=packs)
+        response["statuses"] = {os.path.relpath(path, project_dir): status for path, status in statuses.items()}
+    return response
+
+
+def handle_status(query: Dict) -> Dict:
+    """
+    Report stale projects (or every project with ?all=1).
+    """
+    from .status_commands import get_status_report
+    return get_status_report(show_all=query.get("all", ["0"])[0] not in ("", "0"))
+
+
+def handle_stale(query: Dict) -> Dict:
+    """
+    Report whether one registered project is stale.
+    """
+    from .registry import get_project, get_stale_reasons, source_digests
+
+    if not query.get("path"):
+        raise RequestError(400, "'path' is required")
+    entry = get_project(query["path"][0])
+    if entry is None:
+        raise RequestError(404, f"{os.path.abspath(query['path'][0])} is not registered")
+    reasons = get_stale_reasons(entry, source_digests())
+    return {"path": entry["path"], "stale": bool(reasons), "reasons": reasons}
+
+
+class RenderServer:
+    """
+    Asyncio HTTP server answering render and status requests; handlers run on a thread pool
+    so slow disk or registry access never blocks other connections.
+    """
+
+    def __init__(self, workers: Optional[int] = None, token: Optional[str] = None):
+        """
+        Args:
+            workers: Number of handler threads
+            token: Bearer token clients must send (None on a Unix socket)
+        """
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.token = token
+        self.started = time.time()
+        self.requests = 0
+        self.routes: Dict[Tuple[str, str], Callable[[Dict, Dict], Dict]] = {
+            ("GET", "/health"): lambda query, payload: self.health(),
+            ("GET", "/status"): lambda query, payload: handle_status(query),
+            ("GET", "/stale"): lambda query, payload: handle_stale(query),
+            ("POST", "/render"): lambda query, payload: handle_render(payload),
+        }
+
+    def health(self) -> Dict:
+        return {
+            "ok": True,
+            "pid": os.getpid(),
+            "uptime": round(time.time() - self.started, 3),
+            "requests": self.requests,
+        }
+
+    async def dispatch(self, method: str, target: str, headers: Dict[str, str], body: bytes) -> Tuple[int, Dict]:
+        """
+        Check one request and route it to its handler.
+
+        Returns:
+            Tuple of (HTTP status, JSON response)
+        """
+        self.requests += 1
+        try:
+            check_request(method, headers, self.token)
+        except RequestError as e:
+            return e.status, {"error": str(e)}
+        url = urlsplit(target)
+        route = self.routes.get((method, url.path))
+        if route is None:
+            if any(path == url.path for _, path in self.routes):
+                return 405, {"error": f"{method} is not allowed on {url.path}"}
+            return 404, {"error": f"no such endpoint: {url.path}"}
+        try:
+            payload = json.loads(body.decode('utf-8')) if body else {}
+            if not isinstance(payload, dict):
+                raise ValueError("the request body must be a JSON object")
+        except ValueError as e:
+            return 400, {"error": f"invalid JSON: {e}"}
+
+        loop = asyncio.get_event_loop()
+        try:
+            return 200, await loop.run_in_executor(self.executor, route, parse_qs(url.query), payload)
+        except RequestError as e:
+            return e.status, {"error": str(e)}
+        except Exception as e:
+            return 500, {"error": f"{type(e).__name__}: {e}"}
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Serve requests on one connection until the client closes it or asks to.
+        """
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if not line.strip():
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                parts = request_line.decode('latin-1').split()
+                keep_alive = len(parts) == 3 and parts[2] == "HTTP/1.1" and \
+                    headers.get("connection", "").lower() != "close"
+                length = int(headers.get("content-length") or 0) if len(parts) == 3 else -1
+                if length < 0:
+                    status, response, keep_alive = 400, {"error": "malformed request"}, False
+                elif length > MAX_BODY:
+                    status, response, keep_alive = 413, {"error": f"body larger than {MAX_BODY} bytes"}, False
+                else:
+                    body = await reader.readexactly(length) if length else b""
+                    status, response = await self.dispatch(parts[0].upper(), parts[1], headers, body)
+
+                data = json.dumps(response).encode('utf-8')
+                writer.write((
+                    f"HTTP/1.1 {status} {_REASONS.get(status, 'Error')}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+                ).encode('latin-1') + data)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host: str, port: int, socket_path: Optional[str]) -> None:
+        """
+        Listen and serve until cancelled (SIGTERM cancels too, so the socket file is cleaned up).
+        """
+        # asyncio.current_task() is new in Python 3.7
+        current_task = getattr(asyncio, 'current_task', None) or asyncio.Task.current_task
+        try:
+            asyncio.get_event_loop().add_signal_handler(signal.SIGTERM, current_task().cancel)
+        except (NotImplementedError, RuntimeError):
+            pass
+        if socket_path:
+            _remove_stale_socket(socket_path)
+            server = await asyncio.start_unix_server(self.handle_connection, path=socket_path)
+            os.chmod(socket_path, 0o600)
+            address = socket_path
+        else:
+            server = await asyncio.start_server(self.handle_connection, host=host, port=port)
+            address = "http://%s:%d" % server.sockets[0].getsockname()[:2]
+        print(f"Serving rules on {address} (pid {os.getpid()}), press Ctrl+C to stop.")
+        if self.token is not None:
+            print(f"Clients must send 'Authorization: Bearer <token>' with the token in {get_token_path()}.")
+        sys.stdout.flush()
+        try:
+            # Runs until cancelled (Server.serve_forever() is new in Python 3.7)
+            await asyncio.get_event_loop().create_future()
+        finally:
+            server.close()
+            await server.wait_closed()
+            if socket_path:
+                _remove_stale_socket(socket_path)
+
+
+def _remove_stale_socket(socket_path: str) -> None:
+    """
+    Remove a socket file left behind by a server that is gone; refuse to remove anything else.
+    """
+    try:
+        mode = os.lstat(socket_path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise OSError(f"{socket_path} exists and is not a socket")
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(socket_path)
+    except OSError:
+        os.remove(socket_path)
+    else:
+        raise OSError(f"another server is listening on {socket_path}")
+    finally:
+        probe.close()
+
+
+def _run(coroutine) -> None:
+    """
+    Run a coroutine on a new event loop, cancelling it on Ctrl+C so its cleanup runs
+    (asyncio.run() is new in Python 3.7).
+    """
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    task = loop.create_task(coroutine)
+    try:
+        loop.run_until_complete(task)
+    except KeyboardInterrupt:
+        task.cancel()
+        try:
+            loop.run_until_complete(task)
+        except asyncio.CancelledError:
+            pass
+        raise
+    finally:
+        all_tasks = getattr(asyncio, 'all_tasks', None) or asyncio.Task.all_tasks
+        pending = [pending_task for pending_task in all_tasks(loop) if not pending_task.done()]
+        for pending_task in pending:
+            pending_task.cancel()
+        if pending:
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        loop.close()
+
+
+def serve_command(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    socket_path: Optional[str] = None,
+    workers: Optional[int] = None
+) -> None:
+    """
+    Run the render server until interrupted.
+
+    Args:
+        host: Address to listen on for TCP (keep it local: Host headers must name localhost)
+        port: TCP port
+        socket_path: Unix socket to listen on instead of TCP (defaults to VIBE_SERVE_SOCKET)
+        workers: Number of handler threads
+    """
+    socket_path = socket_path or get_default_socket()
+    # Warm the template caches before the first request
+    from .project_commands import render_project_rules
+    render_project_rules()
+
+    try:
+        # Over TCP any local user can connect: require the token only this user can read
+        server = RenderServer(workers, token=None if socket_path else ensure_token())
+    except OSError as e:
+        print(f"Error: Could not create the server token {get_token_path()}: {e}")
+        sys.exit(1)
+    try:
+        _run(server.serve(host, port, socket_path))
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        print("\nServer stopped.")
+    except OSError as e:
+        print(f"Error: Could not start the server: {e}")
+        sys.exit(1)
+    finally:
+        server.executor.shutdown(wait=False)
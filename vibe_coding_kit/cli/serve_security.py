@@ -0,0 +1,153 @@
+"""
+Request checks for the vibe-coding-kit render server.
+Keeps web pages and other users from driving `vibe serve`: requests must look like a local client's
+(no Origin header, a localhost Host header, JSON bodies), TCP clients must send the bearer token kept in
+a file only the user can read, and render options are validated before they reach a template.
+"""
+
+import hmac
+import os
+import re
+import secrets
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+from .fileio import locked
+from .paths import get_user_data_dir
+
+# Host header names of a local server; a DNS-rebinding page would send its own host name
+LOCAL_HOSTS = ("localhost", "127.0.0.1", "::1")
+
+OVERRIDE_KEYS = ("communication_language", "code_comment_language")
+# Longest language override accepted (a language name)
+MAX_OVERRIDE_LENGTH = 64
+# Stack, pack and tag names: pack paths are built from them
+_NAME = re.compile(r'^\w[\w.+-]*$')
+
+
+class RequestError(Exception):
+    """
+    Raised by a handler to answer with an error status.
+    """
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def get_token_path() -> str:
+    """
+    Get the file holding the bearer token TCP clients must send.
+
+    Returns:
+        Path to serve_token under the user data dir
+    """
+    return os.path.join(get_user_data_dir(), 'serve_token')
+
+
+def read_token(token_path: Optional[str] = None) -> Optional[str]:
+    """
+    Read the bearer token.
+
+    Args:
+        token_path: Token file (defaults to get_token_path())
+
+    Returns:
+        The token, or None if there is no token file yet
+    """
+    try:
+        with open(token_path or get_token_path(), 'r', encoding='utf-8') as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+def ensure_token() -> str:
+    """
+    Get the bearer token, creating the token file (mode 0600) if there is none yet.
+    A token file other users can read is replaced with a new token.
+
+    Returns:
+        The token
+    """
+    token_path = get_token_path()
+    os.makedirs(os.path.dirname(token_path), exist_ok=True)
+    with locked(token_path):
+        try:
+            if os.lstat(token_path).st_mode & 0o077:
+                os.remove(token_path)
+        except FileNotFoundError:
+            pass
+        token = read_token(token_path)
+        if token is None:
+            token = secrets.token_urlsafe(32)
+            flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_NOFOLLOW', 0)
+            with os.fdopen(os.open(token_path, flags, 0o600), 'w', encoding='utf-8') as f:
+                f.write(token + "\n")
+    return token
+
+
+def check_request(method: str, headers: Dict[str, str], token: Optional[str]) -> None:
+    """
+    Reject requests a local client would not send.
+
+    Args:
+        method: HTTP method
+        headers: Request headers, with lower-case names
+        token: Bearer token clients must send, or None (on a Unix socket its permissions suffice)
+
+    Raises:
+        RequestError: 403 for cross-origin or non-local requests, 401 without the token,
+            415 for a body that is not sent as JSON
+    """
+    # Browsers send Origin on cross-origin requests, so a web page cannot use a simple POST
+    if "origin" in headers:
+        raise RequestError(403, "cross-origin requests are not accepted")
+    try:
+        hostname = urlsplit("//" + headers.get("host", "")).hostname
+    except ValueError:
+        hostname = None
+    if hostname not in LOCAL_HOSTS:
+        raise RequestError(403, "the Host header must name localhost")
+    if token is not None:
+        scheme, _, value = headers.get("authorization", "").partition(' ')
+        if scheme.lower() != "bearer" or not hmac.compare_digest(value.strip().encode('utf-8'), token.encode('utf-8')):
+            raise RequestError(401, f"missing or wrong bearer token (the token is in {get_token_path()})")
+    if method == "POST":
+        content_type = headers.get("content-type", "").split(';')[0].strip().lower()
+        if content_type != "application/json":
+            raise RequestError(415, "the request body must be sent as Content-Type: application/json")
+
+
+def validate_render_payload(payload: Dict) -> None:
+    """
+    Check the options of a render request before they reach the registry or a template.
+
+    Args:
+        payload: Decoded request body
+
+    Raises:
+        RequestError: 400 naming the first invalid option
+    """
+    if not isinstance(payload.get("path"), str) or not payload["path"]:
+        raise RequestError(400, "'path' must be a non-empty string")
+    if payload.get("editor") is not None and not isinstance(payload["editor"], str):
+        raise RequestError(400, "'editor' must be a string such as \"windsurf,cursor\"")
+    for key in ("stacks", "packs"):
+        names = payload.get(key)
+        if names is not None and (
+            not isinstance(names, list) or not all(isinstance(name, str) and _NAME.match(name) for name in names)
+        ):
+            raise RequestError(400, f"'{key}' must be a list of names")
+    overrides = payload.get("overrides")
+    if overrides is not None:
+        if not isinstance(overrides, dict) or not set(overrides) <= set(OVERRIDE_KEYS):
+            raise RequestError(400, f"'overrides' must be an object with {' and/or '.join(OVERRIDE_KEYS)}")
+        for key, value in overrides.items():
+            if not isinstance(value, str) or not value.strip() or len(value) > MAX_OVERRIDE_LENGTH \
+                    or not value.isprintable():
+                raise RequestError(
+                    400, f"'overrides.{key}' must be a single line of at most {MAX_OVERRIDE_LENGTH} characters"
+                )
+    if not isinstance(payload.get("write", False), bool):
+        raise RequestError(400, "'write' must be true or false")
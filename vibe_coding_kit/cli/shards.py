@@ -0,0 +1,159 @@
+"""
+Scoped rule shards for vibe-coding-kit CLI.
+Moves rules sections marked with a scope out of the root rules file into shards that editors
+load only for matching paths, and leaves a short index of them in the root file.
+
+A "## " section is scoped by a marker line anywhere in it:
+`<!-- vibe:scope=web/, services/**/*.py -->` (directories end with "/", everything else is a glob).
+"""
+
+import re
+from typing import Dict, List, Tuple
+
+_SCOPE_MARKER = re.compile(r'^\s*<!--\s*vibe:scope\s*=\s*(.*?)\s*-->\s*$')
+
+# Heading of the index section added to the root rules file
+INDEX_TITLE = "Path-Specific Rules"
+
+
+def split_sections(text: str) -> List[List[str]]:
+    """
+    Split Markdown into the text before the first "## " heading and one list of lines per section.
+    Headings inside code blocks do not start a section.
+
+    Args:
+        text: Markdown text
+
+    Returns:
+        List of line lists; the first one is the preamble (possibly empty)
+    """
+    sections: List[List[str]] = [[]]
+    in_code = False
+    for line in text.split('\n'):
+        if line.lstrip().startswith('```'):
+            in_code = not in_code
+        if not in_code and line.startswith('## '):
+            sections.append([])
+        sections[-1].append(line)
+    return sections
+
+
+def parse_scope(value: str) -> List[str]:
+    """
+    Turn a scope marker value into editor globs.
+
+    Args:
+        value: Comma-separated directories ("web/") and globs ("**/*.py")
+
+    Returns:
+        Globs relative to the project root, e.g. ["web/**", "**/*.py"]
+    """
+    globs = []
+    for pattern in value.split(','):
+        pattern = pattern.strip()
+        if pattern.startswith('./'):
+            pattern = pattern[2:]
+        if not pattern:
+            continue
+        if pattern.endswith('/'):
+            pattern += '**'
+        if pattern not in globs:
+            globs.append(pattern)
+    return globs
+
+
+def _scope_globs(lines: List[str]) -> List[str]:
+    """
+    Get the globs of a section's first scope marker (empty if the section is not scoped).
+    """
+    marker = next((match for match in map(_SCOPE_MARKER.match, lines) if match), None)
+    return parse_scope(marker.group(1)) if marker else []
+
+
+def partition_scoped_sections(rules_content: str) -> Tuple[str, List[Tuple[str, str]]]:
+    """
+    Separate scoped sections from a rendered rules body, keeping their scope markers, so the root
+    rules file and each shard can be compacted on their own before split_scoped_rules() builds them.
+
+    Args:
+        rules_content: Rendered rules content
+
+    Returns:
+        Tuple of (content without the scoped sections, (title, text) of each scoped section)
+    """
+    sections = split_sections(rules_content)
+    root = [sections[0]]
+    scoped = []
+    for lines in sections[1:]:
+        if _scope_globs(lines):
+            scoped.append((lines[0][3:].strip(), '\n'.join(lines).strip('\n') + '\n'))
+        else:
+            root.append(lines)
+    return '\n'.join('\n'.join(lines) for lines in root), scoped
+
+
+def split_scoped_rules(rules_content: str) -> Tuple[str, List[Dict]]:
+    """
+    Separate scoped sections from a rendered rules body.
+
+    Args:
+        rules_content: Rendered rules content
+
+    Returns:
+        Tuple of (root rules content with an index of the shards appended,
+        shards with "title", "globs" and "body"). Without scoped sections the content is returned unchanged.
+    """
+    sections = split_sections(rules_content)
+    root = [sections[0]]
+    shards = []
+    for lines in sections[1:]:
+        globs = None
+        kept = []
+        for line in lines:
+            marker = _SCOPE_MARKER.match(line)
+            if marker and globs is None:
+                globs = parse_scope(marker.group(1))
+                continue
+            kept.append(line)
+        if globs:
+            shards.append({"title": lines[0][3:].strip(), "globs": globs, "body": '\n'.join(kept).strip('\n') + '\n'})
+        else:
+            root.append(lines)
+
+    if not shards:
+        return rules_content, []
+
+    content = '\n'.join('\n'.join(lines) for lines in root).rstrip('\n')
+    index = [f"## {INDEX_TITLE}", "", "These rules are loaded only when working on matching files:"]
+    for shard in shards:
+        index.append(f"- {shard['title']}: {', '.join(f'`{pattern}`' for pattern in shard['globs'])}")
+    return content + "\n\n" + '\n'.join(index) + "\n", shards
+
+
+def format_windsurf_shard(shard: Dict) -> str:
+    """
+    Format a shard as a Windsurf rule (.windsurf/rules/*.md) triggered by its globs.
+
+    Args:
+        shard: Shard from split_scoped_rules()
+
+    Returns:
+        Rule file content
+    """
+    return f"---\ntrigger: glob\nglobs: {', '.join(shard['globs'])}\n---\n{shard['body']}"
+
+
+def format_mdc_shard(shard: Dict) -> str:
+    """
+    Format a shard as a Cursor rule (.cursor/rules/*.mdc) attached to its globs.
+
+    Args:
+        shard: Shard from split_scoped_rules()
+
+    Returns:
+        Rule file content
+    """
+    return (
+        f"---\ndescription: {shard['title']}\nglobs: {', '.join(shard['globs'])}\nalwaysApply: false\n---\n"
+        f"{shard['body']}"
+    )
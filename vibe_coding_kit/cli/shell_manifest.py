@@ -0,0 +1,120 @@
+"""
+Staleness manifest for the shell cd hook of vibe-coding-kit.
+Precomputes which registered projects are stale, in a layout a shell can check with builtin file tests
+only, so entering a directory never has to start Python unless a source file changed since.
+
+Layout, under <data dir>/shell (maintained only once the directory exists):
+    projects/<path with "/" as "%">   one marker per registered project: empty if up to date,
+                                      else the reasons it is stale
+    sources                           one line per source file: "+path" if it existed, "-path" if not
+    stamp                             its mtime is just before the markers were computed; a source
+                                      newer than the stamp (or appearing or disappearing) means the
+                                      markers may be outdated
+"""
+
+import os
+import time
+from typing import Iterable
+
+from .fileio import write_if_changed
+from .paths import get_packs_dir, get_user_data_dir
+
+
+def get_manifest_dir() -> str:
+    """
+    Get the directory of the shell staleness manifest.
+
+    Returns:
+        Path to shell/ under the user data dir
+    """
+    return os.path.join(get_user_data_dir(), 'shell')
+
+
+def manifest_enabled() -> bool:
+    """
+    Check whether the manifest is maintained: only after the shell hook (or the user) asked for it once.
+
+    Returns:
+        True if the manifest directory exists
+    """
+    return os.path.isdir(get_manifest_dir())
+
+
+def marker_name(project_dir: str) -> str:
+    """
+    Get the marker file name of a project, as the shell hook computes it with ${PWD//\\//%}.
+
+    Args:
+        project_dir: Project root directory
+
+    Returns:
+        Absolute path with every "/" replaced by "%"
+    """
+    return os.path.abspath(project_dir).replace('/', '%')
+
+
+def _write_marker(markers_dir: str, project_dir: str, reasons: Iterable[str]) -> None:
+    reasons = list(reasons)
+    try:
+        write_if_changed(os.path.join(markers_dir, marker_name(project_dir)), ', '.join(reasons) + '\n' if reasons else '')
+    except OSError:
+        # e.g. a path longer than a file name may be: the hook then treats the project as unregistered
+        pass
+
+
+def write_shell_manifest() -> int:
+    """
+    Rebuild the manifest from the registry: a marker per registered project, the source list and the stamp.
+
+    Returns:
+        Number of stale projects
+    """
+    from .registry import get_source_paths, get_stale_reasons, list_projects, source_digests
+
+    # Anything modified from here on must look newer than the stamp, even with one-second mtimes
+    stamp_time = time.time() - 1
+    manifest_dir = get_manifest_dir()
+    markers_dir = os.path.join(manifest_dir, 'projects')
+    os.makedirs(markers_dir, exist_ok=True)
+
+    digests = source_digests()
+    stale = 0
+    registered = set()
+    for entry in list_projects():
+        reasons = get_stale_reasons(entry, digests)
+        stale += bool(reasons)
+        registered.add(marker_name(entry["path"]))
+        _write_marker(markers_dir, entry["path"], reasons)
+    for name in set(os.listdir(markers_dir)) - registered:
+        try:
+            os.remove(os.path.join(markers_dir, name))
+        except FileNotFoundError:
+            pass
+
+    # The packs directory is listed too: adding or removing a pack changes its mtime
+    sources = get_source_paths() + [get_packs_dir()]
+    write_if_changed(
+        os.path.join(manifest_dir, 'sources'),
+        ''.join(f"{'+' if os.path.exists(path) else '-'}{path}\n" for path in sources)
+    )
+    stamp_path = os.path.join(manifest_dir, 'stamp')
+    with open(stamp_path, 'a'):
+        pass
+    os.utime(stamp_path, (stamp_time, stamp_time))
+    return stale
+
+
+def mark_projects_fresh(project_dirs: Iterable[str]) -> None:
+    """
+    Mark projects that were just rendered from the current sources as up to date.
+    Does nothing unless the manifest is maintained.
+
+    Args:
+        project_dirs: Project root directories
+    """
+    if not manifest_enabled():
+        return
+    markers_dir = os.path.join(get_manifest_dir(), 'projects')
+    os.makedirs(markers_dir, exist_ok=True)
+    for project_dir in project_dirs:
+        _write_marker(markers_dir, project_dir, ())
@@ -0,0 +1,146 @@
+"""
+Project stack detection for vibe-coding-kit CLI.
+Finds the languages a project uses from its manifest files and a capped, time-boxed sample of its tree,
+so stack-specific rule packs can be selected without asking the user.
+"""
+
+import os
+import time
+from typing import Dict, List, Optional
+
+from .walk import VENDORED_DIRS, walk_entries
+
+# Manifest files and the stack they indicate
+MANIFESTS = {
+    "setup.py": "python",
+    "setup.cfg": "python",
+    "pyproject.toml": "python",
+    "requirements.txt": "python",
+    "Pipfile": "python",
+    "package.json": "javascript",
+    "tsconfig.json": "typescript",
+    "go.mod": "go",
+    "Cargo.toml": "rust",
+    "pom.xml": "java",
+    "build.gradle": "java",
+    "Gemfile": "ruby",
+}
+
+# Source file extensions and the stack they indicate
+EXTENSIONS = {
+    ".py": "python",
+    ".pyi": "python",
+    ".ts": "typescript",
+    ".tsx": "typescript",
+    ".js": "javascript",
+    ".jsx": "javascript",
+    ".mjs": "javascript",
+    ".go": "go",
+    ".rs": "rust",
+    ".java": "java",
+    ".kt": "java",
+    ".rb": "ruby",
+}
+
+# Sampling limits: whichever is reached first ends the walk
+MAX_FILES = 2000
+TIME_BUDGET = 0.04
+
+# Top-level directories checked for manifests of their own (e.g. web/package.json in a monorepo)
+MAX_MANIFEST_DIRS = 256
+# Share of sampled source files a language needs to count without a manifest
+MIN_SHARE = 0.1
+MIN_FILES = 3
+
+
+def _top_level_dirs(project_dir: str) -> List[str]:
+    """
+    List the project's top-level directories worth checking for manifests, up to MAX_MANIFEST_DIRS.
+    """
+    names = []
+    try:
+        with os.scandir(project_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith('.') or entry.name in VENDORED_DIRS:
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    names.append(entry.name)
+                    if len(names) >= MAX_MANIFEST_DIRS:
+                        break
+    except OSError:
+        pass
+    return sorted(names)
+
+
+def detect_stack_details(
+    project_dir: str,
+    max_files: int = MAX_FILES,
+    time_budget: float = TIME_BUDGET
+) -> Dict:
+    """
+    Detect the stacks of a project and report how they were found.
+    Manifests in the root and its top-level directories are checked first; then the tree is walked
+    breadth first (skipping vendored and .gitignore'd paths) until max_files files were seen or
+    time_budget seconds passed, counting source files by extension.
+
+    Args:
+        project_dir: Project root directory
+        max_files: Maximum number of files to examine
+        time_budget: Maximum seconds to spend walking the tree
+
+    Returns:
+        Dictionary with "stacks" (sorted), "manifests" (relative paths found), "counts"
+        (sampled source files per stack), "files" (files examined) and "complete"
+        (whether the whole tree was walked)
+    """
+    deadline = time.perf_counter() + time_budget
+    stacks = set()
+    manifests = []
+    for rel_dir in [''] + _top_level_dirs(project_dir):
+        for name, stack in MANIFESTS.items():
+            rel_path = f"{rel_dir}/{name}" if rel_dir else name
+            if os.path.isfile(os.path.join(project_dir, rel_path)):
+                stacks.add(stack)
+                manifests.append(rel_path)
+
+    counts: Dict[str, int] = {}
+    files = 0
+    complete = True
+    for rel_path, entry in walk_entries(project_dir, respect_gitignore=True, breadth_first=True):
+        files += 1
+        stack = EXTENSIONS.get(os.path.splitext(entry.name)[1])
+        if stack is not None:
+            counts[stack] = counts.get(stack, 0) + 1
+        if files >= max_files or (files % 64 == 0 and time.perf_counter() > deadline):
+            complete = False
+            break
+
+    sources = sum(counts.values())
+    for stack, count in counts.items():
+        if count >= MIN_FILES and count >= sources * MIN_SHARE:
+            stacks.add(stack)
+    # TypeScript projects carry a package.json too; the JavaScript guidance would only repeat it
+    if "typescript" in stacks:
+        stacks.discard("javascript")
+
+    return {
+        "stacks": sorted(stacks),
+        "manifests": manifests,
+        "counts": counts,
+        "files": files,
+        "complete": complete,
+    }
+
+
+def detect_stacks(project_dir: str, max_files: Optional[int] = None) -> List[str]:
+    """
+    Detect the stacks (languages) a project uses.
+
+    Args:
+        project_dir: Project root directory
+        max_files: Maximum number of files to examine (defaults to MAX_FILES)
+
+    Returns:
+        Sorted stack names, e.g. ["go", "python"]
+    """
+    return detect_stack_details(project_dir, max_files or MAX_FILES)["stacks"]
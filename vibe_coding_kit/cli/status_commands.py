@@ -0,0 +1,67 @@
+"""
+Status command implementation for vibe-coding-kit CLI.
+Reports registered projects with stale rules files using the project registry.
+"""
+
+import json
+from typing import Dict
+
+from .registry import get_stale_reasons, list_projects, source_digests
+
+
+def get_status_report(show_all: bool = False) -> Dict:
+    """
+    Check every registered project against the current source digests.
+
+    Args:
+        show_all: Whether to list up-to-date projects too
+
+    Returns:
+        Report with "registered" and "stale" counts and "projects" (registry entries with "reasons")
+    """
+    digests = source_digests()
+    projects = list_projects()
+    for entry in projects:
+        entry["reasons"] = get_stale_reasons(entry, digests)
+    stale = [entry for entry in projects if entry["reasons"]]
+    return {
+        "registered": len(projects),
+        "stale": len(stale),
+        "projects": projects if show_all else stale,
+    }
+
+
+def status_command(show_all: bool = False, as_json: bool = False, shell_manifest: bool = False) -> None:
+    """
+    Report registered projects whose rules files are stale.
+
+    Args:
+        show_all: Whether to list up-to-date projects too
+        as_json: Whether to print the report as JSON
+        shell_manifest: Whether to refresh the shell cd hook manifest instead, printing nothing
+    """
+    if shell_manifest:
+        from .shell_manifest import write_shell_manifest
+        write_shell_manifest()
+        return
+
+    report = get_status_report(show_all=True)
+    projects = report["projects"]
+    stale = [entry for entry in projects if entry["reasons"]]
+
+    if as_json:
+        print(json.dumps({
+            "registered": report["registered"],
+            "stale": report["stale"],
+            "projects": projects if show_all else stale,
+        }, indent=2))
+        return
+
+    print(f"Registered projects: {len(projects)}")
+    print(f"Stale projects: {len(stale)}")
+    for entry in projects if show_all else stale:
+        state = "stale" if entry["reasons"] else "ok"
+        detail = f" ({', '.join(entry['reasons'])})" if entry["reasons"] else ""
+        print(f"  {state:<5} {entry['path']} [{entry['editor']}]{detail}")
+    if stale:
+        print("\nRun 'vibe reset' in a stale project to re-render its rules.")
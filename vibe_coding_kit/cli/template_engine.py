@@ -0,0 +1,123 @@
+"""
+Layered template engine for vibe-coding-kit CLI.
+Compiles Markdown templates with placeholders and optional sections into reusable
+render plans, and renders a stack of layers with a single join.
+
+Template syntax:
+    {{name}}               replaced by the context value
+    {{#name}}...{{/name}}  kept only if the context value is truthy
+    {{^name}}...{{/name}}  kept only if the context value is falsy
+Placeholders missing from the context are left verbatim.
+"""
+
+import re
+from typing import Dict, List, Sequence, Union
+
+# A plan is a JSON-serializable list, so compiled templates can be cached on disk.
+# Items are literal strings, ["var", name] or ["section", name, inverted, subplan].
+Plan = List[Union[str, list]]
+
+_TAG_PATTERN = re.compile(r'\{\{\s*([#^/]?)\s*([A-Za-z_][A-Za-z0-9_.-]*)\s*\}\}')
+
+
+class TemplateError(ValueError):
+    """
+    Raised when a template has unbalanced section tags.
+    """
+
+
+def compile_template(text: str) -> Plan:
+    """
+    Compile template text into a render plan.
+
+    Args:
+        text: Template text
+
+    Returns:
+        Render plan
+
+    Raises:
+        TemplateError: If section tags are not balanced
+    """
+    root: Plan = []
+    # Stack of (section name, plan being filled)
+    stack = [("", root)]
+    position = 0
+
+    for match in _TAG_PATTERN.finditer(text):
+        _append_text(stack[-1][1], text[position:match.start()])
+        position = match.end()
+        kind, name = match.group(1), match.group(2)
+
+        if kind in ('#', '^'):
+            section: Plan = []
+            stack[-1][1].append(["section", name, kind == '^', section])
+            stack.append((name, section))
+        elif kind == '/':
+            if len(stack) == 1 or stack[-1][0] != name:
+                raise TemplateError(f"Unexpected closing tag {{{{/{name}}}}}")
+            stack.pop()
+        else:
+            stack[-1][1].append(["var", name])
+
+    if len(stack) > 1:
+        raise TemplateError(f"Unclosed section {{{{#{stack[-1][0]}}}}}")
+    _append_text(root, text[position:])
+    return root
+
+
+def _append_text(plan: Plan, text: str) -> None:
+    """
+    Append literal text to a plan, merging it with a preceding literal.
+    """
+    if not text:
+        return
+    if plan and isinstance(plan[-1], str):
+        plan[-1] += text
+    else:
+        plan.append(text)
+
+
+def _collect(plan: Plan, context: Dict, parts: List[str]) -> None:
+    """
+    Append the rendered pieces of a plan to parts.
+    """
+    for item in plan:
+        if isinstance(item, str):
+            parts.append(item)
+        elif item[0] == "var":
+            value = context.get(item[1])
+            parts.append("{{" + item[1] + "}}" if value is None else str(value))
+        elif bool(context.get(item[1])) != item[2]:
+            _collect(item[3], context, parts)
+
+
+def render_layers(plans: Sequence[Plan], context: Dict) -> str:
+    """
+    Render a stack of compiled layers (e.g. global, organisation, project) in order.
+
+    Args:
+        plans: Compiled layer plans
+        context: Placeholder and section values
+
+    Returns:
+        Rendered text
+    """
+    parts: List[str] = []
+    for plan in plans:
+        _collect(plan, context, parts)
+    return "".join(parts)
+
+
+def render_template(text: str, context: Dict) -> str:
+    """
+    Compile and render a single template. Prefer caching compiled plans for repeated renders.
+
+    Args:
+        text: Template text
+        context: Placeholder and section values
+
+    Returns:
+        Rendered text
+    """
+    return render_layers([compile_template(text)], context)
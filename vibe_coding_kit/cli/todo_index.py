@@ -0,0 +1,277 @@
+"""
+Checklist index for vibe-coding-kit CLI.
+Parses Markdown checkbox lists from projects' dev/ directories into an SQLite index
+that only re-reads files whose mtime or size changed.
+"""
+
+import os
+import re
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .paths import get_user_data_dir
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS todo_files (
+    path TEXT PRIMARY KEY,
+    project TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS todo_files_project ON todo_files (project);
+CREATE TABLE IF NOT EXISTS todo_items (
+    file TEXT NOT NULL,
+    project TEXT NOT NULL,
+    line INTEGER NOT NULL,
+    parent INTEGER,
+    depth INTEGER NOT NULL,
+    done INTEGER NOT NULL,
+    heading TEXT NOT NULL,
+    text TEXT NOT NULL,
+    PRIMARY KEY (file, line)
+);
+CREATE INDEX IF NOT EXISTS todo_items_project ON todo_items (project, done);
+"""
+
+_HEADING = re.compile(r'^(#{1,6})\s+(.*?)\s*#*\s*$')
+_LIST_ITEM = re.compile(r'^([ \t]*)(?:[-*+]|\d+[.)])\s+(.*)$')
+_CHECKBOX = re.compile(r'^\[([ xX])\]\s*(.*)$')
+
+# A scanned checklist file: (project, path, mtime_ns, size)
+FileSignature = Tuple[str, str, int, int]
+
+
+def get_index_path() -> str:
+    """
+    Get the path to the checklist index database.
+
+    Returns:
+        Path to todos.sqlite3 under the user data dir
+    """
+    return os.path.join(get_user_data_dir(), 'todos.sqlite3')
+
+
+def connect() -> sqlite3.Connection:
+    """
+    Open the checklist index, creating it if needed.
+
+    Returns:
+        SQLite connection with rows accessible by column name
+    """
+    index_path = get_index_path()
+    os.makedirs(os.path.dirname(index_path), exist_ok=True)
+    conn = sqlite3.connect(index_path, timeout=30)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def parse_checklist(lines: Iterable[str]) -> Iterator[Dict]:
+    """
+    Parse checkbox items from Markdown lines, one line at a time.
+    Plain list items count towards nesting, so a checkbox under a plain bullet is still nested.
+
+    Args:
+        lines: Markdown lines (e.g. an open file)
+
+    Yields:
+        Items with "line" (1-based), "parent" (line of the enclosing checkbox or None),
+        "depth", "done", "heading" (nearest heading) and "text"
+    """
+    heading = ""
+    in_code = False
+    # Open list items: (indent, line number, whether the item is a checkbox)
+    stack: List[Tuple[int, int, bool]] = []
+
+    for number, line in enumerate(lines, 1):
+        line = line.rstrip('\r\n')
+        if line.lstrip().startswith('```'):
+            in_code = not in_code
+            continue
+        if in_code or not line.strip():
+            continue
+
+        match = _HEADING.match(line)
+        if match:
+            heading = match.group(2)
+            stack = []
+            continue
+
+        match = _LIST_ITEM.match(line)
+        if not match:
+            # Unindented text ends the list; indented text continues the current item
+            if not line[0].isspace():
+                stack = []
+            continue
+
+        indent = len(match.group(1).expandtabs(4))
+        while stack and stack[-1][0] >= indent:
+            stack.pop()
+        checkbox = _CHECKBOX.match(match.group(2))
+        if checkbox:
+            parent = next((item_line for _, item_line, is_box in reversed(stack) if is_box), None)
+            yield {
+                "line": number,
+                "parent": parent,
+                "depth": len(stack),
+                "done": checkbox.group(1) != ' ',
+                "heading": heading,
+                "text": checkbox.group(2).strip(),
+            }
+        stack.append((indent, number, bool(checkbox)))
+
+
+def _scan_project(project_dir: str) -> List[FileSignature]:
+    """
+    Stat the Markdown files directly under a project's dev/ directory.
+    """
+    files = []
+    try:
+        with os.scandir(os.path.join(project_dir, 'dev')) as entries:
+            for entry in entries:
+                if entry.name.endswith('.md') and entry.is_file():
+                    st = entry.stat()
+                    files.append((project_dir, entry.path, st.st_mtime_ns, st.st_size))
+    except OSError:
+        pass
+    return files
+
+
+def _parse_file(signature: FileSignature) -> Tuple[FileSignature, List[Dict]]:
+    """
+    Parse the checkbox items of one file.
+    """
+    try:
+        with open(signature[1], 'r', encoding='utf-8', errors='replace') as f:
+            return signature, list(parse_checklist(f))
+    except OSError:
+        return signature, []
+
+
+def refresh_index(
+    conn: sqlite3.Connection,
+    project_dirs: List[str],
+    workers: Optional[int] = None,
+    prune: bool = False
+) -> Dict[str, int]:
+    """
+    Bring the index up to date for a set of projects, re-reading only changed files.
+
+    Args:
+        conn: Index connection
+        project_dirs: Absolute project root directories
+        workers: Number of worker threads for stat and parse
+        prune: Whether to drop indexed projects that are not in project_dirs
+
+    Returns:
+        Counts of "files" scanned, files "parsed" and files "removed"
+    """
+    scope = set(project_dirs)
+    known = {
+        row["path"]: row
+        for row in conn.execute("SELECT path, project, mtime_ns, size FROM todo_files")
+        if prune or row["project"] in scope
+    }
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        scanned = [signature for files in executor.map(_scan_project, project_dirs) for signature in files]
+        changed = []
+        for signature in scanned:
+            row = known.pop(signature[1], None)
+            if row is None or (row["mtime_ns"], row["size"]) != signature[2:]:
+                changed.append(signature)
+        # Whatever is left in known was deleted from disk or belongs to a pruned project
+        parsed = list(executor.map(_parse_file, changed))
+
+    stale_paths = [(path,) for path in known] + [(signature[1],) for signature in changed]
+    with conn:
+        conn.executemany("DELETE FROM todo_items WHERE file = ?", stale_paths)
+        conn.executemany("DELETE FROM todo_files WHERE path = ?", stale_paths)
+        conn.executemany("INSERT INTO todo_files (project, path, mtime_ns, size) VALUES (?, ?, ?, ?)", changed)
+        conn.executemany(
+            "INSERT INTO todo_items (file, project, line, parent, depth, done, heading, text) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (signature[1], signature[0], item["line"], item["parent"], item["depth"],
+                 int(item["done"]), item["heading"], item["text"])
+                for signature, items in parsed
+                for item in items
+            ]
+        )
+    return {"files": len(scanned), "parsed": len(changed), "removed": len(known)}
+
+
+def _escape_like(value: str) -> str:
+    return '%' + value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+
+
+def _scope_clause(conn: sqlite3.Connection, project_dirs: Optional[List[str]]) -> str:
+    """
+    Restrict queries to a set of projects through a temporary table.
+    """
+    if project_dirs is None:
+        return ""
+    conn.execute("CREATE TEMP TABLE IF NOT EXISTS todo_scope (path TEXT PRIMARY KEY)")
+    conn.execute("DELETE FROM todo_scope")
+    conn.executemany("INSERT OR IGNORE INTO todo_scope (path) VALUES (?)", [(path,) for path in project_dirs])
+    return " AND project IN (SELECT path FROM todo_scope)"
+
+
+def query_items(
+    conn: sqlite3.Connection,
+    project_dirs: Optional[List[str]] = None,
+    heading: Optional[str] = None,
+    keyword: Optional[str] = None,
+    include_done: bool = False
+) -> List[Dict]:
+    """
+    Query indexed checkbox items.
+
+    Args:
+        conn: Index connection
+        project_dirs: Projects to include (all indexed projects if None)
+        heading: Case-insensitive substring the item's heading must contain
+        keyword: Case-insensitive substring the item's text must contain
+        include_done: Whether to include checked items
+
+    Returns:
+        Items in project, file and line order, each with "project" and "file" added
+    """
+    sql = "SELECT * FROM todo_items WHERE 1 = 1" + _scope_clause(conn, project_dirs)
+    params = []
+    if not include_done:
+        sql += " AND done = 0"
+    if heading:
+        sql += " AND heading LIKE ? ESCAPE '\\'"
+        params.append(_escape_like(heading))
+    if keyword:
+        sql += " AND text LIKE ? ESCAPE '\\'"
+        params.append(_escape_like(keyword))
+    sql += " ORDER BY project, file, line"
+
+    items = []
+    for row in conn.execute(sql, params):
+        item = dict(row)
+        item["done"] = bool(item["done"])
+        items.append(item)
+    return items
+
+
+def count_items(conn: sqlite3.Connection, project_dirs: Optional[List[str]] = None) -> Dict[str, Dict[str, int]]:
+    """
+    Count open and done items per project.
+
+    Args:
+        conn: Index connection
+        project_dirs: Projects to include (all indexed projects if None)
+
+    Returns:
+        Mapping of project path to {"open": n, "done": n}
+    """
+    sql = (
+        "SELECT project, SUM(done = 0) AS open, SUM(done) AS done FROM todo_items WHERE 1 = 1"
+        + _scope_clause(conn, project_dirs)
+        + " GROUP BY project"
+    )
+    return {row["project"]: {"open": row["open"], "done": row["done"]} for row in conn.execute(sql)}
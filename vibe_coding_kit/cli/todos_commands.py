@@ -0,0 +1,115 @@
+"""
+Todos command implementation for vibe-coding-kit CLI.
+Lists open checklist items across projects from the incremental checklist index.
+"""
+
+import json
+import os
+import sqlite3
+import sys
+from typing import Dict, List, Optional
+
+from .todo_index import connect, count_items, query_items, refresh_index
+
+
+def _get_project_dirs(paths: List[str]) -> Optional[List[str]]:
+    """
+    Resolve the projects to report on: the given paths, or every registered project.
+
+    Returns:
+        Absolute project roots, or None if the registry could not be read
+    """
+    if paths:
+        return [os.path.abspath(path) for path in paths]
+
+    from .registry import list_projects
+    try:
+        return [entry["path"] for entry in list_projects()]
+    except sqlite3.Error as e:
+        print(f"Error: Could not read project registry: {e}")
+        return None
+
+
+def _print_items(items: List[Dict], counts: Dict[str, Dict[str, int]]) -> None:
+    """
+    Print items grouped by project, file and heading, indented by nesting depth.
+    """
+    project = file_path = heading = None
+    for item in items:
+        if item["project"] != project:
+            project, file_path = item["project"], None
+            summary = counts.get(project, {"open": 0, "done": 0})
+            print(f"\n{project} ({summary['open']} open, {summary['done']} done)")
+        if item["file"] != file_path or item["heading"] != heading:
+            file_path, heading = item["file"], item["heading"]
+            rel_path = os.path.relpath(file_path, project)
+            print(f"  {rel_path}" + (f" > {heading}" if heading else ""))
+        mark = "x" if item["done"] else " "
+        print(f"    {'  ' * item['depth']}[{mark}] {item['text']}  (line {item['line']})")
+
+
+def todos_command(
+    paths: List[str] = None,
+    heading: Optional[str] = None,
+    keyword: Optional[str] = None,
+    include_done: bool = False,
+    summary: bool = False,
+    as_json: bool = False,
+    refresh: bool = True,
+    workers: Optional[int] = None
+) -> None:
+    """
+    List checklist items from the dev/ Markdown files of registered (or given) projects.
+
+    Args:
+        paths: Project roots to report on (defaults to every registered project)
+        heading: Only list items under headings containing this text
+        keyword: Only list items whose text contains this keyword
+        include_done: Whether to list checked items too
+        summary: Whether to print only open/done counts per project
+        as_json: Whether to print the report as JSON
+        refresh: Whether to re-scan projects for changed files before querying
+        workers: Number of worker threads for scanning
+    """
+    project_dirs = _get_project_dirs(paths or [])
+    if project_dirs is None:
+        sys.exit(1)
+
+    conn = connect()
+    try:
+        if refresh:
+            # Without explicit paths the registry is authoritative: forget unregistered projects
+            stats = refresh_index(conn, project_dirs, workers=workers, prune=not paths)
+            if not as_json:
+                print(f"Indexed {stats['files']} files ({stats['parsed']} re-read, {stats['removed']} removed).")
+        counts = count_items(conn, project_dirs)
+        items = [] if summary else query_items(conn, project_dirs, heading, keyword, include_done)
+    finally:
+        conn.close()
+
+    if as_json:
+        projects = {path: {"path": path, **counts[path], "items": []} for path in sorted(counts)}
+        for item in items:
+            projects[item["project"]]["items"].append({
+                "file": os.path.relpath(item["file"], item["project"]),
+                "line": item["line"],
+                "parent": item["parent"],
+                "depth": item["depth"],
+                "done": item["done"],
+                "heading": item["heading"],
+                "text": item["text"],
+            })
+        print(json.dumps({
+            "open": sum(summary_counts["open"] for summary_counts in counts.values()),
+            "done": sum(summary_counts["done"] for summary_counts in counts.values()),
+            "projects": list(projects.values()),
+        }, indent=2))
+        return
+
+    if summary:
+        for path in sorted(counts):
+            print(f"  {counts[path]['open']:>5} open {counts[path]['done']:>5} done  {path}")
+    else:
+        _print_items(items, counts)
+    total_open = sum(summary_counts["open"] for summary_counts in counts.values())
+    print(f"\n{total_open} open items in {len(counts)} projects.")
@@ -0,0 +1,157 @@
+"""
+Argument parsers for the project tool commands of the vibe-coding-kit CLI.
+Defines the docs, check, todos and compact subcommands, which work on project files rather than rules.
+"""
+
+import argparse
+
+
+def add_tool_parsers(subparsers: argparse._SubParsersAction) -> None:
+    """
+    Add the project tool subcommands to the vibe command.
+    
+    Args:
+        subparsers: Subparsers of the vibe command
+    """
+    # Docs command - generate the API summary in dev/code_docs.md
+    docs_parser = subparsers.add_parser(
+        'docs',
+        help='Generate the API summary in dev/code_docs.md from Python sources'
+    )
+    docs_parser.add_argument(
+        'path',
+        nargs='?',
+        default=None,
+        help='Project root (defaults to the current directory)'
+    )
+    docs_parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Number of parser processes'
+    )
+    docs_parser.add_argument(
+        '--no-cache',
+        dest='use_cache',
+        action='store_false',
+        help='Re-parse every file instead of reusing results for unchanged files'
+    )
+    
+    # Check command - enforce the maximum code file length
+    check_parser = subparsers.add_parser(
+        'check',
+        help='Report code files longer than the line limit (exits non-zero on violations)'
+    )
+    check_parser.add_argument(
+        'path',
+        nargs='?',
+        default=None,
+        help='Project root (defaults to the current directory)'
+    )
+    check_parser.add_argument(
+        '--max-lines',
+        type=int,
+        default=400,
+        help='Maximum number of lines per code file (default: 400)'
+    )
+    check_parser.add_argument(
+        '--json',
+        dest='as_json',
+        action='store_true',
+        help='Print the report as JSON'
+    )
+    check_parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Number of reader threads'
+    )
+    check_parser.add_argument(
+        '--no-cache',
+        dest='use_cache',
+        action='store_false',
+        help='Re-read every file instead of reusing counts for unchanged files'
+    )
+    
+    # Todos command - list open checklist items across projects
+    todos_parser = subparsers.add_parser(
+        'todos',
+        help='List checklist items from dev/*.md across registered projects'
+    )
+    todos_parser.add_argument(
+        'paths',
+        nargs='*',
+        metavar='PATH',
+        help='Project roots to report on (defaults to every registered project)'
+    )
+    todos_parser.add_argument(
+        '--heading',
+        default=None,
+        help='Only list items under headings containing this text'
+    )
+    todos_parser.add_argument(
+        '--grep',
+        dest='keyword',
+        default=None,
+        help='Only list items containing this keyword'
+    )
+    todos_parser.add_argument(
+        '--done',
+        dest='include_done',
+        action='store_true',
+        help='List checked items too'
+    )
+    todos_parser.add_argument(
+        '--summary',
+        action='store_true',
+        help='Print only open/done counts per project'
+    )
+    todos_parser.add_argument(
+        '--json',
+        dest='as_json',
+        action='store_true',
+        help='Print the report as JSON'
+    )
+    todos_parser.add_argument(
+        '--no-refresh',
+        dest='refresh',
+        action='store_false',
+        help='Query the index without checking projects for changed files'
+    )
+    todos_parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Number of worker threads for scanning'
+    )
+    
+    # Compact command - keep dev/progress.md bounded
+    compact_parser = subparsers.add_parser(
+        'compact',
+        help='Archive older dev/progress.md entries, keeping the most recent ones'
+    )
+    compact_parser.add_argument(
+        'path',
+        nargs='?',
+        default=None,
+        help='Project root (defaults to the current directory)'
+    )
+    compact_parser.add_argument(
+        '--keep-entries',
+        type=int,
+        default=20,
+        metavar='N',
+        help='Maximum number of entries kept in progress.md (default: 20)'
+    )
+    compact_parser.add_argument(
+        '--keep-bytes',
+        type=int,
+        default=32 * 1024,
+        metavar='BYTES',
+        help='Maximum size of the entries kept in progress.md (default: 32768)'
+    )
+    compact_parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='Only report what would be archived'
+    )
@@ -0,0 +1,237 @@
+"""
+Timing instrumentation for vibe-coding-kit CLI.
+Records spans with wall/CPU time and I/O counters as JSON lines or Chrome trace events.
+Enabled with `vibe --trace` (stderr), `vibe --trace-file FILE` or VIBE_TRACE=FILE|stderr; costs a single
+check when disabled. JSON lines are appended to FILE; a Chrome trace replaces it, since it is one JSON array.
+This module is imported at CLI startup, so it avoids importing typing, and imports json and
+threading lazily, only once tracing is enabled.
+"""
+
+import functools
+import os
+import sys
+import time
+
+# Active trace sink, None while tracing is disabled
+_sink = None
+
+
+class _TraceSink:
+    """
+    Serializes trace records to a stream, one record at a time.
+    """
+
+    def __init__(self, destination: str, trace_format: str) -> None:
+        import atexit
+        import threading
+
+        self.format = trace_format
+        self.lock = threading.Lock()
+        self.pid = os.getpid()
+        self.first = True
+        if destination in ('', '1', '-', 'stderr'):
+            self.stream = sys.stderr
+        else:
+            self.stream = open(destination, 'w' if self.format == 'chrome' else 'a', encoding='utf-8')
+        if self.format == 'chrome':
+            self.stream.write("[\n")
+        atexit.register(self.close)
+
+    def emit(self, record: dict) -> None:
+        """
+        Write one span record.
+        """
+        import json
+
+        if self.format == 'chrome':
+            args = {key: value for key, value in record.items() if key not in ('name', 'ts', 'wall_ms', 'tid')}
+            event = {
+                "name": record["name"], "ph": "X", "pid": self.pid, "tid": record["tid"],
+                "ts": record["ts"] * 1e6, "dur": record["wall_ms"] * 1e3, "args": args,
+            }
+            line = json.dumps(event)
+        else:
+            line = json.dumps(record)
+
+        with self.lock:
+            if self.format == 'chrome' and not self.first:
+                self.stream.write(",\n")
+            self.first = False
+            self.stream.write(line if self.format == 'chrome' else line + "\n")
+            self.stream.flush()
+
+    def close(self) -> None:
+        """
+        Terminate the trace and close the stream if we opened it.
+        """
+        with self.lock:
+            if self.stream.closed:
+                return
+            if self.format == 'chrome':
+                self.stream.write("\n]\n")
+            self.stream.flush()
+            if self.stream is not sys.stderr:
+                self.stream.close()
+
+
+def _read_io_counters() -> dict:
+    """
+    Read the process I/O counters (Linux only).
+
+    Returns:
+        Mapping of counter name (rchar, wchar, syscr, syscw) to value, empty where unavailable
+    """
+    try:
+        with open('/proc/self/io', 'r') as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return {}
+    counters = {}
+    for line in lines:
+        key, _, value = line.partition(':')
+        counters[key] = int(value)
+    return counters
+
+
+def _cpu_time() -> float:
+    """
+    CPU time of the calling thread where supported, of the process otherwise.
+    """
+    return time.thread_time() if hasattr(time, 'thread_time') else time.process_time()
+
+
+class _Span:
+    """
+    Context manager measuring one traced phase.
+    """
+
+    __slots__ = ('name', 'attrs', 'start_ts', 'start_wall', 'start_cpu', 'start_io')
+
+    def __init__(self, name: str, attrs: dict) -> None:
+        self.name = name
+        self.attrs = attrs
+
+    def __enter__(self) -> '_Span':
+        self.start_io = _read_io_counters()
+        self.start_ts = time.time()
+        self.start_cpu = _cpu_time()
+        self.start_wall = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        import threading
+
+        wall = time.perf_counter() - self.start_wall
+        cpu = _cpu_time() - self.start_cpu
+        end_io = _read_io_counters()
+
+        record = {
+            "name": self.name,
+            "ts": self.start_ts,
+            "wall_ms": round(wall * 1e3, 3),
+            "cpu_ms": round(cpu * 1e3, 3),
+            "tid": threading.get_ident(),
+        }
+        # I/O counters are process-wide, so spans running concurrently share them
+        for key, label in (('rchar', 'bytes_read'), ('wchar', 'bytes_written'),
+                           ('syscr', 'read_syscalls'), ('syscw', 'write_syscalls')):
+            if key in end_io and key in self.start_io:
+                record[label] = end_io[key] - self.start_io[key]
+        if exc_type is not None:
+            record["error"] = exc_type.__name__
+        record.update(self.attrs)
+        if _sink is not None:
+            _sink.emit(record)
+        return False
+
+
+class _NullSpan:
+    """
+    Shared no-op span returned while tracing is disabled.
+    """
+
+    __slots__ = ()
+
+    def __enter__(self) -> '_NullSpan':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def configure(destination: str, trace_format: str = None) -> None:
+    """
+    Enable tracing to a destination, or disable it.
+
+    Args:
+        destination: File path, "stderr" (or "-"), or None to disable tracing
+        trace_format: "jsonl" (default) or "chrome" for the Chrome trace-event format
+    """
+    global _sink
+    if _sink is not None:
+        _sink.close()
+        _sink = None
+    if destination is None:
+        return
+    if trace_format is None:
+        trace_format = os.environ.get('VIBE_TRACE_FORMAT') or 'jsonl'
+    _sink = _TraceSink(destination, trace_format)
+
+
+def configure_from_env() -> None:
+    """
+    Enable tracing if VIBE_TRACE is set (to a file path, or to "1"/"stderr" for stderr).
+    """
+    destination = os.environ.get('VIBE_TRACE')
+    if destination and destination != '0':
+        configure(destination)
+
+
+def is_enabled() -> bool:
+    """
+    Check whether tracing is enabled.
+
+    Returns:
+        True if spans are being recorded
+    """
+    return _sink is not None
+
+
+def span(name: str, **attrs):
+    """
+    Measure a phase as a context manager.
+
+    Args:
+        name: Span name
+        **attrs: Extra JSON-serializable attributes recorded with the span
+
+    Returns:
+        Context manager (a shared no-op when tracing is disabled)
+    """
+    if _sink is None:
+        return _NULL_SPAN
+    return _Span(name, attrs)
+
+
+def traced(name: str):
+    """
+    Decorator recording every call of a function as a span.
+
+    Args:
+        name: Span name
+
+    Returns:
+        Decorator
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _sink is None:
+                return func(*args, **kwargs)
+            with _Span(name, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -7,10 +7,16 @@ import os
 import sys
 from typing import Dict, List, Optional, Tuple
 
+from .editors import describe_editor_types
+from .profiles import is_headless
+from .tracing import traced
 
+
+@traced("prompt:get_user_input")
 def get_user_input(prompt: str, default: str = "") -> str:
     """
     Get user input with a prompt and optional default value.
+    With a headless profile the default is used without prompting.
     
     Args:
         prompt: Prompt to display to user
@@ -19,6 +25,9 @@ def get_user_input(prompt: str, default: str = "") -> str:
     Returns:
         User input or default value
     """
+    if is_headless():
+        print(f"{prompt}: {default}")
+        return default
     if default:
         user_input = input(f"{prompt}: ")
         return user_input if user_input else default
@@ -26,19 +35,33 @@ def get_user_input(prompt: str, default: str = "") -> str:
         return input(f"{prompt}: ")
 
 
-def get_editor_type() -> str:
+@traced("prompt:get_editor_type")
+def get_editor_type(default: str = "") -> str:
     """
-    Prompt user for editor type preference.
+    Prompt user for the editors to write rules for. Several can be selected at once (e.g. "1,3").
+    With a headless profile the default (or Windsurf) is used without prompting.
+    
+    Args:
+        default: Comma-separated editor types used when the user just presses Enter
+            (e.g. the editors detected in the project)
     
     Returns:
-        'windsurf' or 'cursor'
+        Comma-separated editor types, e.g. 'windsurf', 'cursor' or 'windsurf,cursor-mdc'
     """
+    if is_headless():
+        return default or "windsurf"
+    choices = {"1": "windsurf", "2": "cursor", "3": "cursor-mdc"}
     print("\nSelect your preferred editor:")
     print("1. Windsurf")
     print("2. Cursor")
+    print("3. Cursor project rules (.cursor/rules)")
+    if default:
+        print(f"Detected in this project: {describe_editor_types(default)} (press Enter to keep)")
     
-    choice = ""
-    while choice not in ["1", "2"]:
-        choice = input("Enter choice (1 or 2): ")
-    
-    return "windsurf" if choice == "1" else "cursor"
+    while True:
+        answer = input("Enter choice (1, 2 or 3; separate several with commas): ").strip()
+        if not answer and default:
+            return default
+        picks = [pick.strip() for pick in answer.split(',') if pick.strip()]
+        if picks and all(pick in choices for pick in picks):
+            return ','.join(dict.fromkeys(choices[pick] for pick in picks))
@@ -0,0 +1,195 @@
+"""
+Project tree walking for vibe-coding-kit CLI.
+Yields source files while skipping version control, vendored and build directories,
+and optionally paths ignored by .gitignore files.
+"""
+
+import os
+import re
+from collections import deque
+from typing import Deque, Iterable, Iterator, List, Optional, Pattern, Set, Tuple
+
+# Directories that never contain project sources worth scanning
+VENDORED_DIRS = {
+    '.git', '.hg', '.svn', 'node_modules', 'bower_components', 'vendor', 'third_party',
+    '.venv', 'venv', 'env', '.env', '__pycache__', '.tox', '.nox', '.mypy_cache',
+    '.pytest_cache', '.ruff_cache', '.eggs', 'site-packages', 'build', 'dist', '.idea', '.vscode',
+}
+
+# A compiled .gitignore rule: (regex, negated, directory only)
+IgnoreRule = Tuple[Pattern, bool, bool]
+
+
+def _translate_glob(pattern: str) -> str:
+    """
+    Translate a gitignore glob into a regular expression body.
+    """
+    result = []
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if pattern.startswith('**/', index):
+            result.append('(?:.*/)?')
+            index += 3
+            continue
+        if pattern.startswith('**', index):
+            result.append('.*')
+            index += 2
+            continue
+        if char == '*':
+            result.append('[^/]*')
+        elif char == '?':
+            result.append('[^/]')
+        elif char == '[':
+            end = pattern.find(']', index + 1)
+            if end == -1:
+                result.append(re.escape(char))
+            else:
+                body = pattern[index + 1:end]
+                if body.startswith('!'):
+                    body = '^' + body[1:]
+                result.append(f'[{body}]')
+                index = end
+        elif char == '\\' and index + 1 < len(pattern):
+            index += 1
+            result.append(re.escape(pattern[index]))
+        else:
+            result.append(re.escape(char))
+        index += 1
+    return ''.join(result)
+
+
+def parse_gitignore(text: str) -> List[IgnoreRule]:
+    """
+    Compile the rules of a .gitignore file.
+
+    Args:
+        text: Content of the .gitignore file
+
+    Returns:
+        Compiled rules, in file order (the last matching rule wins)
+    """
+    rules = []
+    for line in text.splitlines():
+        line = line.rstrip()
+        if not line or line.startswith('#'):
+            continue
+        negated = line.startswith('!')
+        if negated:
+            line = line[1:]
+        dir_only = line.endswith('/')
+        line = line.rstrip('/')
+        if not line:
+            continue
+        # Patterns with an inner slash are relative to the .gitignore's directory
+        anchored = '/' in line
+        body = _translate_glob(line.lstrip('/'))
+        regex = re.compile(('' if anchored else '(?:.*/)?') + body + '$')
+        rules.append((regex, negated, dir_only))
+    return rules
+
+
+def is_ignored(rel_path: str, is_dir: bool, rule_sets: List[Tuple[str, List[IgnoreRule]]]) -> bool:
+    """
+    Check a path against the .gitignore rules in effect for its directory.
+
+    Args:
+        rel_path: Path relative to the walk root, with "/" separators
+        is_dir: Whether the path is a directory
+        rule_sets: (base directory, rules) pairs from the root down to the path's parent
+
+    Returns:
+        True if the path is ignored
+    """
+    ignored = False
+    for base_dir, rules in rule_sets:
+        local_path = rel_path[len(base_dir) + 1:] if base_dir else rel_path
+        for regex, negated, dir_only in rules:
+            if dir_only and not is_dir:
+                continue
+            if regex.match(local_path):
+                ignored = not negated
+    return ignored
+
+
+def _load_rules(directory: str) -> List[IgnoreRule]:
+    """
+    Read the .gitignore of a directory, if any.
+    """
+    try:
+        with open(os.path.join(directory, '.gitignore'), 'r', encoding='utf-8', errors='replace') as f:
+            return parse_gitignore(f.read())
+    except OSError:
+        return []
+
+
+def walk_entries(
+    root: str,
+    extensions: Optional[Iterable[str]] = None,
+    skip_dirs: Optional[Set[str]] = None,
+    respect_gitignore: bool = False,
+    breadth_first: bool = False
+) -> Iterator[Tuple[str, os.DirEntry]]:
+    """
+    Walk a project tree with os.scandir, skipping vendored and symlinked directories.
+    Directories are read lazily, so a consumer that stops early never lists the rest of the tree.
+
+    Args:
+        root: Project root directory
+        extensions: File extensions to yield (e.g. [".py"]); all files if None
+        skip_dirs: Directory names to skip (defaults to VENDORED_DIRS)
+        respect_gitignore: Whether to skip paths ignored by .gitignore files in the tree
+        breadth_first: Whether to finish each level before descending (useful for sampling a tree)
+
+    Yields:
+        Tuples of (path relative to root with "/" separators, DirEntry); DirEntry.stat() is cached
+    """
+    suffixes = tuple(extensions) if extensions is not None else None
+    skip = VENDORED_DIRS if skip_dirs is None else skip_dirs
+    # Each queue item: (relative directory, .gitignore rule sets in effect above it)
+    queue: Deque[Tuple[str, List[Tuple[str, List[IgnoreRule]]]]] = deque([('', [])])
+
+    while queue:
+        rel_dir, rule_sets = queue.popleft() if breadth_first else queue.pop()
+        directory = os.path.join(root, rel_dir)
+        if respect_gitignore:
+            rules = _load_rules(directory)
+            if rules:
+                rule_sets = rule_sets + [(rel_dir, rules)]
+        try:
+            iterator = os.scandir(directory)
+        except OSError:
+            continue
+
+        with iterator:
+            for entry in iterator:
+                rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name in skip or entry.name.endswith('.egg-info'):
+                            continue
+                        if rule_sets and is_ignored(rel_path, True, rule_sets):
+                            continue
+                        queue.append((rel_path, rule_sets))
+                    elif entry.is_file() and (suffixes is None or entry.name.endswith(suffixes)):
+                        if rule_sets and is_ignored(rel_path, False, rule_sets):
+                            continue
+                        yield rel_path, entry
+                except OSError:
+                    continue
+
+
+def walk_files(
+    root: str,
+    extensions: Optional[Iterable[str]] = None,
+    skip_dirs: Optional[Set[str]] = None,
+    respect_gitignore: bool = False
+) -> Iterator[str]:
+    """
+    Walk a project tree, yielding file paths only. See walk_entries() for the arguments.
+
+    Yields:
+        Paths of matching files, relative to root, with "/" separators
+    """
+    for rel_path, _ in walk_entries(root, extensions, skip_dirs, respect_gitignore):
+        yield rel_path
@@ -0,0 +1,174 @@
+"""
+Watch command implementation for vibe-coding-kit CLI.
+Keeps registered projects' rules files in sync with the templates as they change.
+"""
+
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
+
+from .editors import get_primary_path, render_outputs
+from .fileio import STATUS_UNCHANGED, write_if_changed
+from .history import get_latest_files, history_enabled
+from .paths import get_packs_dir
+from .propagate_commands import make_renderer, rerender_project
+from .registry import (
+    find_stale_projects, get_registry_path, get_source_paths, list_projects, make_entry, record_projects
+)
+from .watcher import create_watcher
+
+
+def rerender_entries(entries: List[Dict], workers: Optional[int] = None) -> Dict[str, int]:
+    """
+    Re-render the rules files of registered projects, rendering each distinct content only once.
+
+    Args:
+        entries: Registry entries to re-render
+        workers: Maximum number of concurrent worker threads
+
+    Returns:
+        Mapping of write status to number of projects
+    """
+    # Projects sharing the same overrides (or none), stacks and packs share the same rendered content
+    render = make_renderer()
+    jobs = [(entry, ) + render(entry["stacks"], entry["overrides"], entry["packs"]) for entry in entries]
+
+    counts = {}
+    records = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(lambda job: rerender_project(job[0], job[1], job[2]), jobs)
+        for (entry, status, error), job in zip(results, jobs):
+            counts[status] = counts.get(status, 0) + 1
+            if error:
+                print(f"  {status:<9} {entry['path']}: {error}")
+                continue
+            if status != STATUS_UNCHANGED:
+                print(f"  {status:<9} {entry['rules_file']}")
+            records.append(make_entry(
+                entry["path"], entry["editor"], get_primary_path(entry["path"], entry["editor"], job[1]),
+                entry["overrides"], rules_digest=job[2], stacks=entry["stacks"], packs=entry["packs"]
+            ))
+
+    try:
+        record_projects(records)
+    except (sqlite3.Error, OSError) as e:
+        print(f"Warning: Could not update project registry: {e}")
+    return counts
+
+
+def restore_deleted(deleted: Dict[str, Tuple[Dict, str]]) -> None:
+    """
+    Restore rules files deleted by hand. Files a rollback removed, which the project's latest
+    recorded revision does not have, stay deleted.
+
+    Args:
+        deleted: Mapping of deleted output path to (registry entry, rendered content)
+    """
+    for path, (entry, content) in sorted(deleted.items()):
+        latest = get_latest_files(entry["path"]) if history_enabled() else None
+        if latest is not None and os.path.relpath(path, entry["path"]) not in latest:
+            continue
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            status = write_if_changed(path, content)
+        except OSError as e:
+            print(f"  failed    {path}: {e}")
+            continue
+        print(f"  {status:<9} {path}")
+
+
+def watch_command(
+    debounce: float = 0.5,
+    use_polling: bool = False,
+    interval: float = 2.0,
+    workers: Optional[int] = None
+) -> None:
+    """
+    Watch the templates and registered projects and re-render rules files when they change.
+    Runs until interrupted.
+
+    Args:
+        debounce: Seconds without further changes before a burst of saves is processed
+        use_polling: Force stat polling instead of inotify
+        interval: Polling interval in seconds for the polling watcher
+        workers: Maximum number of concurrent worker threads for re-rendering
+    """
+    watcher = create_watcher(use_polling, interval)
+    sources: Set[str] = set()
+    packs_dir = os.path.abspath(get_packs_dir())
+    registry_path = os.path.abspath(get_registry_path())
+    # Every output file of every registered project (editor files and scoped shards) -> (entry, content)
+    outputs_by_path: Dict[str, Tuple[Dict, str]] = {}
+    project_count = 0
+    unwatched = 0
+
+    def refresh_sources() -> None:
+        # Rule packs and the organisation template can appear while watching
+        sources.clear()
+        for path in get_source_paths():
+            path = os.path.abspath(path)
+            watcher.watch_file(path)
+            sources.add(path)
+
+    def refresh_projects() -> None:
+        nonlocal project_count, unwatched
+        outputs_by_path.clear()
+        unwatched = 0
+        render = make_renderer()
+        entries = list_projects()
+        for entry in entries:
+            rules_content = render(entry["stacks"], entry["overrides"], entry["packs"])[0]
+            for rel_path, content in render_outputs(entry["editor"], rules_content):
+                path = os.path.join(entry["path"], rel_path)
+                outputs_by_path[path] = (entry, content)
+                if not watcher.watch_file(path):
+                    unwatched += 1
+        project_count = len(entries)
+
+    watcher.watch_file(registry_path)
+    watcher.watch_directory(packs_dir)
+    refresh_sources()
+    refresh_projects()
+
+    print(f"Watching templates and {project_count} projects ({type(watcher).__name__})...")
+    if unwatched:
+        print(f"Warning: {unwatched} rules files could not be watched (inotify watch limit?). Use --poll instead.")
+
+    # Catch up with changes made while the watcher was not running
+    stale = find_stale_projects()
+    if stale:
+        rerender_entries(stale, workers=workers)
+
+    try:
+        while True:
+            changed = set(watcher.wait(None))
+            # Debounce: keep collecting until the burst of saves settles
+            while True:
+                more = watcher.wait(debounce)
+                if not more:
+                    break
+                changed.update(more)
+
+            if registry_path in changed or packs_dir in changed:
+                refresh_sources()
+            if registry_path in changed:
+                refresh_projects()
+
+            if packs_dir in changed or changed & sources:
+                # Sources changed: re-render every project whose digests no longer match
+                stale = find_stale_projects()
+                print(f"Templates changed, {len(stale)} projects affected.")
+                rerender_entries(stale, workers=workers)
+
+            # Rules files deleted by hand are restored; edits by hand (or by vibe rollback) are kept
+            deleted = {
+                path: outputs_by_path[path] for path in changed
+                if path in outputs_by_path and not os.path.exists(path)
+            }
+            if deleted:
+                restore_deleted(deleted)
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
+    finally:
+        watcher.close()
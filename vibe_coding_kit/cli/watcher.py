@@ -0,0 +1,229 @@
+"""
+File watchers for vibe-coding-kit CLI.
+Reports changes to a set of files using inotify on Linux, with a stat polling fallback.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+# inotify event masks (see <sys/inotify.h>)
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 0o2000000
+
+# Atomic renames show up as MOVED_TO on the directory, so watch directories rather than files
+WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+_EVENT_HEADER = struct.Struct('iIII')
+
+
+class InotifyWatcher:
+    """
+    Watch files through inotify watches on their parent directories.
+    Blocks in select() while idle, so it uses no CPU between changes.
+    """
+
+    def __init__(self) -> None:
+        libc_name = ctypes.util.find_library('c') or 'libc.so.6'
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs: Dict[str, int] = {}
+        self._wd_to_dir: Dict[int, str] = {}
+        self._files: Set[str] = set()
+        # Directories reported themselves when any of their entries changes
+        self._reported_dirs: Set[str] = set()
+
+    def _add_watch(self, directory: str) -> bool:
+        if directory not in self._dirs:
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+            if wd < 0:
+                return False
+            self._dirs[directory] = wd
+            self._wd_to_dir[wd] = directory
+        return True
+
+    def watch_file(self, path: str) -> bool:
+        """
+        Start reporting changes to a file (which may not exist yet).
+
+        Args:
+            path: File path
+
+        Returns:
+            True if the file is watched, False if no watch could be added (e.g. watch limit reached)
+        """
+        path = os.path.abspath(path)
+        if not self._add_watch(os.path.dirname(path)):
+            return False
+        self._files.add(path)
+        return True
+
+    def watch_directory(self, path: str) -> bool:
+        """
+        Start reporting a directory whenever a file in it is created, removed or changed.
+
+        Args:
+            path: Directory path
+
+        Returns:
+            True if the directory is watched, False if no watch could be added (e.g. it does not exist)
+        """
+        path = os.path.abspath(path)
+        if not self._add_watch(path):
+            return False
+        self._reported_dirs.add(path)
+        return True
+
+    def wait(self, timeout: Optional[float] = None) -> List[str]:
+        """
+        Wait for changes to watched files.
+
+        Args:
+            timeout: Seconds to wait (None waits forever)
+
+        Returns:
+            Changed file paths (empty on timeout)
+        """
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return []
+
+        changed = set()
+        while True:
+            try:
+                data = os.read(self._fd, 65536)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, _mask, _cookie, name_len = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset:offset + name_len].rstrip(b'\0')
+                offset += name_len
+                directory = self._wd_to_dir.get(wd)
+                if directory is None or not name:
+                    continue
+                if directory in self._reported_dirs:
+                    changed.add(directory)
+                path = os.path.join(directory, os.fsdecode(name))
+                if path in self._files:
+                    changed.add(path)
+        return sorted(changed)
+
+    def close(self) -> None:
+        """
+        Release the inotify file descriptor.
+        """
+        os.close(self._fd)
+
+
+class PollingWatcher:
+    """
+    Watch files by comparing their stat signatures at a fixed interval.
+    Used where inotify is unavailable.
+    """
+
+    def __init__(self, interval: float = 2.0) -> None:
+        self._interval = interval
+        self._files: Dict[str, Optional[Tuple[int, int, int]]] = {}
+
+    @staticmethod
+    def _signature(path: str) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def watch_file(self, path: str) -> bool:
+        """
+        Start reporting changes to a file (which may not exist yet).
+
+        Args:
+            path: File path
+
+        Returns:
+            Always True
+        """
+        path = os.path.abspath(path)
+        if path not in self._files:
+            self._files[path] = self._signature(path)
+        return True
+
+    def watch_directory(self, path: str) -> bool:
+        """
+        Start reporting a directory whenever a file is added to or removed from it
+        (its modification time changes).
+
+        Args:
+            path: Directory path
+
+        Returns:
+            Always True
+        """
+        return self.watch_file(path)
+
+    def wait(self, timeout: Optional[float] = None) -> List[str]:
+        """
+        Poll watched files until one changes or the timeout expires.
+
+        Args:
+            timeout: Seconds to wait (None waits forever)
+
+        Returns:
+            Changed file paths (empty on timeout)
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            changed = []
+            for path, signature in self._files.items():
+                current = self._signature(path)
+                if current != signature:
+                    self._files[path] = current
+                    changed.append(path)
+            if changed:
+                return sorted(changed)
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return []
+                time.sleep(min(self._interval, remaining))
+            else:
+                time.sleep(self._interval)
+
+    def close(self) -> None:
+        """
+        Nothing to release for the polling watcher.
+        """
+
+
+def create_watcher(use_polling: bool = False, interval: float = 2.0):
+    """
+    Create the best available watcher.
+
+    Args:
+        use_polling: Force the polling watcher
+        interval: Polling interval in seconds for the polling watcher
+
+    Returns:
+        InotifyWatcher if available, PollingWatcher otherwise
+    """
+    if not use_polling:
+        try:
+            return InotifyWatcher()
+        except (OSError, AttributeError):
+            # No libc or no inotify support on this platform
+            pass
+    return PollingWatcher(interval)